@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark the first-name and company-name cleaners.
+
+Runs each cleaner over a synthetic corpus and a real-shaped corpus
+(values from exports/ resampled with repetition), single-call and batch,
+with cold and warm memoization caches.
+
+Usage:
+    python benchmarks/bench_cleaners.py
+    python benchmarks/bench_cleaners.py --rows 500000 --json bench.jsonl
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from harness import (
+    export_column, measure, peak_memory, print_results, resample, synthetic_company_names,
+    synthetic_first_names, write_json, Measurement,
+)
+import clean_first_name
+import clean_company_name
+
+
+def clear_caches():
+    clean_first_name._clean_first_name.cache_clear()
+    clean_company_name._cleaner.clean.cache_clear()
+
+
+def run_single(clean: Callable[[str], str], names: List[str], latencies: List[float]):
+    """One call per name, timing each call."""
+    for name in names:
+        start = time.perf_counter()
+        clean(name)
+        latencies.append(time.perf_counter() - start)
+
+
+def bench(label: str, run: Callable[[Measurement], None], rows: int, cold: bool,
+          trace_memory: bool) -> Measurement:
+    """Time run(result); cold cases start from empty memoization caches."""
+    if cold:
+        clear_caches()
+    with measure(label) as result:
+        run(result)
+        result.rows = rows
+    if trace_memory:
+        if cold:
+            clear_caches()
+        result.peak_bytes = peak_memory(lambda: run(Measurement(label)))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the BuzzLead name cleaners")
+    parser.add_argument("--rows", type=int, default=100_000, help="Names per corpus")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus random seed")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass (faster, no peak MB)")
+    parser.add_argument("--json", help="Append results as a JSON line to this file")
+    args = parser.parse_args()
+    trace_memory = not args.no_memory
+
+    corpora = {
+        "first/synthetic": synthetic_first_names(args.rows, args.seed),
+        "first/real": resample(export_column("First Name", "first_name"), args.rows, args.seed),
+        "company/synthetic": synthetic_company_names(args.rows, args.seed),
+        "company/real": resample(export_column("name", "Name", "company_name"), args.rows, args.seed),
+    }
+    cleaners = {
+        "first": (clean_first_name.clean_first_name, clean_first_name.clean_first_names),
+        "company": (clean_company_name.clean_company_name, clean_company_name.clean_company_names),
+    }
+
+    results = []
+    for corpus, names in corpora.items():
+        if not names:
+            print(f"⚠️  No values for {corpus} - skipped")
+            continue
+        clean, clean_many = cleaners[corpus.split("/")[0]]
+        print(f"→ {corpus}: {len(names)} names ({len(set(names))} distinct)")
+
+        single = lambda result: run_single(clean, names, result.latencies)
+        batch = lambda result: clean_many(names)
+        for mode, run in (("single", single), ("batch", batch)):
+            for cold in (True, False):
+                label = f"{corpus} {mode} {'cold' if cold else 'warm'}"
+                results.append(bench(label, run, len(names), cold, trace_memory))
+
+    print_results(results)
+    if args.json:
+        write_json(args.json, results, benchmark="cleaners", rows=args.rows, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
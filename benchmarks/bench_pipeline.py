@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark of the enrichment pipeline against local mock providers.
+
+Runs waterfall_enrich.enrich_csv and enrich_contacts.enrich_companies over
+generated CSVs, with every provider pointed at tools/mock_providers.py.
+No API keys or credits are used. Provider rate limits are switched off
+unless --rate-limits is given, so the numbers show what the pipeline
+itself sustains at each concurrency / batch size.
+
+Usage:
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --contacts 2000 --concurrency 1,8,32 --latency-ms 100
+    python benchmarks/bench_pipeline.py --error-rate 0.05 --cache --json bench.jsonl
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from harness import (
+    FIRST_NAMES, LAST_NAMES, Measurement, measure, peak_memory, print_results, synthetic_company_names, write_json,
+)
+from checkpoint import Checkpoint
+from mock_providers import MockConfig, base_url_overrides, spawn
+from rate_limiter import DEFAULT_RATE_LIMITS
+import requests
+import waterfall_enrich
+
+
+FAKE_KEYS = {
+    f"{provider.upper()}_API_KEY": "bench" for provider in
+    ("trykit", "leadmagic", "icypeas", "millionverifier", "bounceban", "emailguard", "aiark")
+}
+
+
+def int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+class MockStats:
+    """Requests served by the mock server during one benchmark case."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.before = self._fetch()
+
+    def _fetch(self) -> Dict[str, int]:
+        return requests.get(f"{self.url}/_stats").json()
+
+    def report(self, label: str):
+        after = self._fetch()
+        counts = {p: n - self.before.get(p, 0) for p, n in after.items() if n - self.before.get(p, 0)}
+        print(f"  {label}: {sum(counts.values())} requests {counts}")
+
+
+def write_contacts(path: Path, rows: int, contacts_per_domain: int):
+    """Contacts CSV in the shape the waterfall expects (a few people per company domain)."""
+    companies = synthetic_company_names(max(rows // contacts_per_domain, 1))
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Full Name", "Company", "Domain", "Email"])
+        for i in range(rows):
+            company_index = i // contacts_per_domain % len(companies)
+            name = f"{FIRST_NAMES[i % len(FIRST_NAMES)]} {LAST_NAMES[i * 7 % len(LAST_NAMES)]}{i}"
+            writer.writerow([name, companies[company_index], f"company{company_index}.com", ""])
+
+
+def write_companies(path: Path, rows: int):
+    """Lookalike CSV in the /lookalike export schema."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["domain", "name", "similarity", "employees", "score", "city", "state",
+                         "country", "primary_industry", "description"])
+        for i, name in enumerate(synthetic_company_names(rows)):
+            writer.writerow([f"company{i}.com", name, 90, "11-50", 300, "Austin", "TX", "US",
+                             "SOFTWARE", "Synthetic company"])
+
+
+@contextlib.contextmanager
+def timed(module, name: str, latencies: List[float]):
+    """Record how long each call to module.name takes (the function is restored afterwards)."""
+    original = getattr(module, name)
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    setattr(module, name, wrapper)
+    try:
+        yield
+    finally:
+        setattr(module, name, original)
+
+
+@contextlib.contextmanager
+def timed_yields(module, name: str, latencies: List[float]):
+    """Record the time between items of the generator module.name (one item per company)."""
+    original = getattr(module, name)
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        for item in original(*args, **kwargs):
+            latencies.append(time.perf_counter() - start)
+            yield item
+            start = time.perf_counter()
+
+    setattr(module, name, wrapper)
+    try:
+        yield
+    finally:
+        setattr(module, name, original)
+
+
+def bench_waterfall(url: str, workdir: Path, contacts: int, contacts_per_domain: int,
+                    concurrency: int, keys: Dict[str, str], use_cache: bool, trace_memory: bool) -> List[Measurement]:
+    input_csv = workdir / f"contacts_c{concurrency}.csv"
+    write_contacts(input_csv, contacts, contacts_per_domain)
+    secrets = workdir / "bench.env"
+    secrets.write_text("".join(f"{k}={v}\n" for k, v in keys.items()))
+    cache_path = workdir / f"cache_c{concurrency}.sqlite"
+
+    def run(latencies: List[float], fresh_cache: bool):
+        if fresh_cache:
+            for path in workdir.glob(f"{cache_path.name}*"):
+                path.unlink()
+        with timed(waterfall_enrich, "enrich_row", latencies), contextlib.redirect_stdout(io.StringIO()):
+            waterfall_enrich.enrich_csv(
+                str(input_csv), str(workdir / "out.csv"), str(secrets),
+                concurrency=concurrency, cache_path=str(cache_path) if use_cache else None,
+                mx_screen=False,  # the mock domains aren't in DNS
+            )
+        Checkpoint(str(input_csv), "waterfall").path.unlink(missing_ok=True)
+
+    # With a cache the second pass shows warm-cache throughput
+    passes = [("cold", True), ("warm", False)] if use_cache else [("run", True)]
+    results = []
+    for label, fresh_cache in passes:
+        stats = MockStats(url)
+        with measure(f"waterfall c={concurrency} {label}") as result:
+            run(result.latencies, fresh_cache)
+            result.rows = contacts
+        stats.report(result.label)
+        if trace_memory:
+            result.peak_bytes = peak_memory(lambda: run([], fresh_cache))
+        results.append(result)
+    return results
+
+
+def bench_companies(url: str, workdir: Path, companies: int, batch_size: int,
+                    trace_memory: bool) -> Measurement:
+    # enrich_contacts reads its key, base URL and limits from the environment at import
+    import enrich_contacts
+
+    input_csv = workdir / f"companies_b{batch_size}.csv"
+    write_companies(input_csv, companies)
+
+    def run(latencies: List[float]):
+        with timed_yields(enrich_contacts, "iter_company_people", latencies), \
+                contextlib.redirect_stdout(io.StringIO()):
+            enrich_contacts.enrich_companies(str(input_csv), str(workdir / "companies_out.csv"),
+                                             batch_size=batch_size)
+        Checkpoint(str(input_csv), "enrich").path.unlink(missing_ok=True)
+
+    stats = MockStats(url)
+    with measure(f"companies batch={batch_size}") as result:
+        run(result.latencies)
+        result.rows = companies
+    stats.report(result.label)
+    if trace_memory:
+        result.peak_bytes = peak_memory(lambda: run([]))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the enrichment pipeline against mock providers")
+    parser.add_argument("--contacts", type=int, default=500, help="Contacts for the waterfall benchmark")
+    parser.add_argument("--contacts-per-domain", type=int, default=5, help="Contacts sharing a company domain")
+    parser.add_argument("--companies", type=int, default=200, help="Companies for the enrich_companies benchmark")
+    parser.add_argument("--concurrency", type=int_list, default=[1, 8], help="Waterfall concurrency levels, e.g. 1,8,32")
+    parser.add_argument("--batch-size", type=int_list, default=[1, 50], help="enrich_companies batch sizes, e.g. 1,50")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Mock latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra random mock latency per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of mock requests failing with HTTP 500")
+    parser.add_argument("--cache", action="store_true", help="Run the waterfall with a fresh result cache (cold + warm pass)")
+    parser.add_argument("--rate-limits", action="store_true", help="Keep the production provider rate limits")
+    parser.add_argument("--only", choices=["waterfall", "companies"], help="Run just one of the benchmarks")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass (faster, no peak MB)")
+    parser.add_argument("--json", help="Append results as a JSON line to this file")
+    args = parser.parse_args()
+    trace_memory = not args.no_memory
+
+    config = MockConfig(latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000,
+                        error_rate=args.error_rate, seed=0)
+    results = []
+    # The mock server runs in its own process so it doesn't compete with the pipeline for the GIL
+    server, url = spawn(config)
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        keys = dict(FAKE_KEYS, **base_url_overrides(url))
+        if not args.rate_limits:
+            keys.update({f"{provider.upper()}_RATE_LIMIT": "off" for provider in DEFAULT_RATE_LIMITS})
+        keys["HTTP_POOL_SIZE"] = str(max(args.concurrency))
+        os.environ.update(keys)
+
+        print(f"Mock providers at {url} (latency {args.latency_ms:.0f}ms, errors {args.error_rate:.0%})")
+        if args.only != "companies":
+            for concurrency in args.concurrency:
+                results.extend(bench_waterfall(url, workdir, args.contacts, args.contacts_per_domain,
+                                               concurrency, keys, args.cache, trace_memory))
+        if args.only != "waterfall":
+            for batch_size in args.batch_size:
+                results.append(bench_companies(url, workdir, args.companies, batch_size, trace_memory))
+    server.terminate()
+
+    print_results(results)
+    if args.json:
+        write_json(args.json, results, benchmark="pipeline", latency_ms=args.latency_ms,
+                   error_rate=args.error_rate, contacts=args.contacts, companies=args.companies)
+
+
+if __name__ == "__main__":
+    main()
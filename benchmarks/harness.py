@@ -0,0 +1,198 @@
+"""
+Shared helpers for the BuzzLead benchmarks.
+Name corpora, timing/memory measurement and result reporting.
+"""
+
+import csv
+import json
+import random
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional
+
+REPO_DIR = Path(__file__).parent.parent
+EXPORTS_DIR = REPO_DIR / "exports"
+
+# Benchmarks import the tools and scripts directly
+sys.path.insert(0, str(REPO_DIR / "tools"))
+sys.path.insert(0, str(REPO_DIR / "scripts"))
+
+
+# =============================================================================
+# CORPORA
+# =============================================================================
+
+FIRST_NAMES = [
+    "John", "Mary", "José", "François", "Mary-Jane", "O'Brien", "Nick", "Alexandra",
+    "Joel", "Priya", "Wei", "Björn", "Chloé", "Mohammed", "Siobhan", "D'Angelo",
+]
+LAST_NAMES = [
+    "Smith", "Hebert", "Courteau", "García-López", "O'Connor", "Nguyen", "Müller",
+    "Van der Berg", "Patel", "Kowalski", "Johnson", "Okafor",
+]
+COMPANY_WORDS = [
+    "Acme", "Bold", "Brands", "Apparel", "Global", "Fitness", "Unitee", "Summit",
+    "Digital", "Labs", "Blue", "Ocean", "North", "Star", "Print", "Works", "IBM", "AT&T",
+]
+COMPANY_SUFFIXES = [
+    "", "", "Inc", "Inc.", "LLC", "L.L.C.", "Ltd", "GmbH", "Pte. Ltd.", "Co.", "Corp",
+    "Corporation", "S.A.", "B.V.", "Pty Ltd",
+]
+
+
+def _messy(rng: random.Random, name: str) -> str:
+    """Apply the kind of noise seen in CRM exports to a clean name."""
+    roll = rng.random()
+    if roll < 0.15:
+        return name.upper()
+    if roll < 0.25:
+        return name.lower()
+    if roll < 0.30:
+        return f"  {name} 🚀"
+    return name
+
+
+def synthetic_first_names(n: int, seed: int = 0) -> List[str]:
+    """n first-name cells: plain, ALL CAPS, nicknames, initials, Dr. prefixes, emojis."""
+    rng = random.Random(seed)
+    names = []
+    for _ in range(n):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        shape = rng.random()
+        if shape < 0.05:
+            name = f"{first} ({rng.choice(FIRST_NAMES)}) {last}"
+        elif shape < 0.08:
+            name = f'"{rng.choice(FIRST_NAMES)}" {first}'
+        elif shape < 0.11:
+            name = f"Dr. {first} {last}"
+        elif shape < 0.15:
+            name = f"{first[0]}. {rng.choice(FIRST_NAMES)}"
+        else:
+            name = first
+        names.append(_messy(rng, name))
+    return names
+
+
+def synthetic_company_names(n: int, seed: int = 0) -> List[str]:
+    """n company-name cells with legal suffixes, "The" prefixes, DBAs and acronyms."""
+    rng = random.Random(seed)
+    names = []
+    for _ in range(n):
+        words = rng.sample(COMPANY_WORDS, rng.randint(1, 3))
+        name = " ".join(words)
+        suffix = rng.choice(COMPANY_SUFFIXES)
+        if suffix:
+            name = f"{name}{',' if rng.random() < 0.3 else ''} {suffix}"
+        shape = rng.random()
+        if shape < 0.05:
+            name = f"The {name}"
+        elif shape < 0.08:
+            name = f"{name} DBA {rng.choice(COMPANY_WORDS)}"
+        names.append(_messy(rng, name))
+    return names
+
+
+def export_column(*columns: str) -> List[str]:
+    """Non-empty values of the first matching column in every CSV under exports/."""
+    values = []
+    for path in sorted(EXPORTS_DIR.rglob("*.csv")):
+        with open(path, encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            column = next((c for c in columns if c in (reader.fieldnames or [])), None)
+            if column:
+                values.extend(row[column] for row in reader if row.get(column))
+    return values
+
+
+def resample(values: List[str], n: int, seed: int = 0) -> List[str]:
+    """n values drawn with replacement (real-shaped corpora have heavy repetition)."""
+    rng = random.Random(seed)
+    return [rng.choice(values) for _ in range(n)] if values else []
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+@dataclass
+class Measurement:
+    """Result of one benchmark case."""
+    label: str
+    rows: int = 0
+    seconds: float = 0.0
+    peak_bytes: Optional[int] = None
+    latencies: List[float] = field(default_factory=list, repr=False)
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def latency(self, pct: float) -> Optional[float]:
+        return percentile(self.latencies, pct)
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        del data["latencies"]
+        data.update(rows_per_sec=self.rows_per_sec, p50=self.latency(50), p99=self.latency(99))
+        return data
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile (None for no samples)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(int(round(pct / 100 * len(ordered))) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+@contextmanager
+def measure(label: str) -> Iterator[Measurement]:
+    """Time a block. The block sets .rows and may append per-item latencies."""
+    result = Measurement(label)
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result.seconds = time.perf_counter() - start
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """
+    Peak traced Python memory (bytes) while running func().
+
+    Measured in a separate pass: tracemalloc slows allocation-heavy and
+    threaded code too much to time it in the same run.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _ms(seconds: Optional[float]) -> str:
+    return f"{seconds * 1000:.4g}" if seconds is not None else "-"
+
+
+def print_results(results: List[Measurement]):
+    """Print a results table."""
+    print(f"\n{'case':<40} {'rows':>8} {'rows/sec':>12} {'p50 ms':>10} {'p99 ms':>10} {'peak MB':>9}")
+    print("-" * 94)
+    for r in results:
+        peak = f"{r.peak_bytes / 1e6:.1f}" if r.peak_bytes is not None else "-"
+        print(f"{r.label:<40} {r.rows:>8} {r.rows_per_sec:>12,.0f} "
+              f"{_ms(r.latency(50)):>10} {_ms(r.latency(99)):>10} {peak:>9}")
+
+
+def write_json(path: str, results: List[Measurement], **context):
+    """Append one run's results as a JSON line (for tracking regressions across commits)."""
+    record = {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), **context,
+              "results": [r.as_dict() for r in results]}
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+Lookalike Discovery Script
+Seed domain(s) → DiscoLike /count + parallel /discover pages → lookalike CSV for /enrich
+
+Usage:
+    python discover_lookalikes.py <seed_domain> [--max-records <N>] [--output <csv>]
+
+Example:
+    python discover_lookalikes.py selectforeverfierce.com --country US --employees 11,200 --max-records 5000
+"""
+
+import requests
+import csv
+import sys
+import os
+import argparse
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Iterator, Optional, Tuple
+from time import perf_counter, sleep
+
+# Add tools directory to path for shared helpers
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+from rate_limiter import build_rate_limiters
+from http_client import ProviderSessions, base_url
+from metrics import Metrics
+from domains import normalize_domain
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+DISCOLIKE_API_KEY = os.environ.get("DISCOLIKE_API_KEY", "")
+DISCOLIKE_BASE_URL = base_url("discolike")
+
+# Pooled keep-alive connections (HTTP_POOL_SIZE, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+HTTP = ProviderSessions.from_keys(os.environ)
+
+# Rate limits: 5/sec (override with DISCOLIKE_RATE_LIMIT)
+RATE_LIMITERS = build_rate_limiters(os.environ)
+
+# Per-provider call counts, latency, errors and credit spend
+# (credit cost per request: DISCOLIKE_CREDIT_COST)
+METRICS = Metrics.from_keys(os.environ)
+
+# 429 handling: bounded retries with exponential backoff (2s, 4s, 8s, ...)
+MAX_429_RETRIES = 5
+BACKOFF_BASE = 2.0
+
+# DiscoLike returns at most 10,000 records per search
+MAX_RECORDS_LIMIT = 10000
+
+# Records per /discover request, and requests in flight at once
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_CONCURRENCY = 8
+
+DEFAULT_MAX_RECORDS = 1000
+DEFAULT_MIN_SIMILARITY = 60
+
+EXPORTS_DIR = Path(__file__).parent.parent / "exports"
+
+
+# =============================================================================
+# DISCOLIKE API
+# Reference: docs/DISCOLIKE_API.md
+# =============================================================================
+
+def discolike_headers() -> Dict[str, str]:
+    """Get headers for DiscoLike API requests."""
+    return {"x-discolike-key": DISCOLIKE_API_KEY}
+
+
+def build_filters(
+    seeds: List[str],
+    icp_text: str = None,
+    countries: List[str] = None,
+    states: List[str] = None,
+    employee_range: str = None,
+    min_similarity: int = DEFAULT_MIN_SIMILARITY,
+    min_score: int = None,
+    categories: List[str] = None,
+    negate_categories: List[str] = None,
+    negate_domains: List[str] = None
+) -> Dict[str, str]:
+    """
+    Build the query parameters shared by /count and /discover.
+
+    List filters are sent comma-separated (e.g. negate_category=A,B).
+    """
+    params = {"domain": ",".join(normalize_domain(seed) for seed in seeds)}
+
+    if icp_text:
+        params["icp_text"] = icp_text
+    if countries:
+        params["country"] = ",".join(countries)
+    if states:
+        params["state"] = ",".join(states)
+    if employee_range:
+        params["employee_range"] = employee_range
+    if min_similarity:
+        params["min_similarity"] = str(min_similarity)
+    if min_score:
+        params["min_digital_footprint"] = str(min_score)
+    if categories:
+        params["category"] = ",".join(categories)
+    if negate_categories:
+        params["negate_category"] = ",".join(negate_categories)
+    if negate_domains:
+        params["negate_domain"] = ",".join(normalize_domain(d) for d in negate_domains)
+
+    return params
+
+
+def discolike_get(path: str, params: Dict[str, str], label: str) -> Optional[Dict]:
+    """
+    GET a DiscoLike endpoint.
+
+    429s are retried up to MAX_429_RETRIES times with exponential backoff
+    (honoring Retry-After when sent). Returns the parsed response body, or
+    None on failure (errors are printed, using label to say which request
+    failed).
+    """
+    for attempt in range(MAX_429_RETRIES + 1):
+        throttled = RATE_LIMITERS["discolike"].acquire()
+        start = perf_counter()
+        status = None
+
+        try:
+            response = HTTP.request(
+                "discolike", "GET", f"{DISCOLIKE_BASE_URL}{path}",
+                headers=discolike_headers(),
+                params=params,
+                timeout=(HTTP.timeout[0], 60)
+            )
+            status = response.status_code
+            METRICS.record_call("discolike", perf_counter() - start, status, throttled=throttled)
+
+            if response.status_code == 200:
+                return response.json()
+            elif response.status_code == 401:
+                print(f"  ⚠️  DiscoLike auth failed - check DISCOLIKE_API_KEY")
+            elif response.status_code == 429:
+                if attempt == MAX_429_RETRIES:
+                    print(f"  ⚠️  Rate limited - giving up on {label}")
+                    break
+                retry_after = response.headers.get("Retry-After", "")
+                wait = float(retry_after) if retry_after.isdigit() else BACKOFF_BASE * 2 ** attempt
+                print(f"  ⚠️  Rate limited - waiting {wait:.0f}s...")
+                sleep(wait)
+                continue
+            else:
+                print(f"  ⚠️  DiscoLike {path} returned {response.status_code} for {label}")
+
+        except requests.exceptions.Timeout:
+            METRICS.record_call("discolike", perf_counter() - start, timed_out=True, throttled=throttled)
+            print(f"  ⚠️  Timeout for {label}")
+        except Exception as e:
+            if status is None:
+                METRICS.record_call("discolike", perf_counter() - start, throttled=throttled)
+            print(f"  ⚠️  Error: {str(e)[:50]}")
+
+        break
+
+    return None
+
+
+def count_matches(filters: Dict[str, str]) -> Optional[int]:
+    """Number of companies matching the filters (/count), or None on failure."""
+    data = discolike_get("/count", filters, "count")
+    return int(data.get("count", 0)) if data else None
+
+
+def fetch_page(filters: Dict[str, str], offset: int, size: int) -> List[Dict]:
+    """One /discover page: up to size records starting at offset."""
+    params = dict(filters, offset=str(offset), max_records=str(size))
+    data = discolike_get("/discover", params, f"offset {offset}")
+    if not data:
+        return []
+    return data.get("results", data.get("data", []))
+
+
+def iter_discover_pages(
+    filters: Dict[str, str],
+    total: int,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY
+) -> Iterator[Tuple[int, List[Dict]]]:
+    """
+    Yield (offset, records) for every page up to total, in offset order.
+
+    Pages are requested concurrency at a time (the DiscoLike rate limiter
+    still applies), with submission bounded to a small window ahead of the
+    next page to yield.
+    """
+    offsets = range(0, total, page_size)
+    window = max(concurrency, 1) * 2
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        for offset in offsets:
+            size = min(page_size, total - offset)
+            pending.append((offset, executor.submit(fetch_page, filters, offset, size)))
+            if len(pending) >= window:
+                offset, future = pending.popleft()
+                yield offset, future.result()
+        while pending:
+            offset, future = pending.popleft()
+            yield offset, future.result()
+
+
+# =============================================================================
+# DATA EXTRACTION
+# =============================================================================
+
+def _joined(value) -> str:
+    """Lists (phones, emails, URLs) as one comma-separated cell."""
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value if v)
+    return str(value or "")
+
+
+def extract_company(record: Dict) -> Dict:
+    """
+    Flatten a /discover record into a lookalike CSV row.
+
+    The primary industry is the highest-weighted entry in industry_groups.
+    """
+    address = record.get("address") or {}
+    industries = record.get("industry_groups") or {}
+    if isinstance(industries, dict):
+        primary_industry = max(industries, key=industries.get) if industries else ""
+    else:
+        primary_industry = industries[0] if industries else ""
+
+    return {
+        "domain": normalize_domain(record.get("domain", "")),
+        "name": record.get("name", ""),
+        "similarity": record.get("similarity", ""),
+        "employees": record.get("employees", ""),
+        "score": record.get("score", ""),
+        "city": address.get("city", ""),
+        "state": address.get("state", ""),
+        "country": address.get("country", ""),
+        "primary_industry": primary_industry,
+        "description": record.get("description", ""),
+        "phones": _joined(record.get("phones")),
+        "public_emails": _joined(record.get("public_emails")),
+        "social_urls": _joined(record.get("social_urls")),
+    }
+
+
+# Lookalike CSV columns (what /enrich and enrich_contacts.py read)
+LOOKALIKE_FIELDNAMES = [
+    'domain',
+    'name',
+    'similarity',
+    'employees',
+    'score',
+    'city',
+    'state',
+    'country',
+    'primary_industry',
+    'description',
+    'phones',
+    'public_emails',
+    'social_urls',
+]
+
+
+# =============================================================================
+# MAIN WORKFLOW
+# =============================================================================
+
+def iter_lookalikes(
+    filters: Dict[str, str],
+    total: int,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    skip_domains: set = None
+) -> Iterator[Dict]:
+    """
+    Stream lookalike rows for the first total matches, in DiscoLike order.
+
+    Domains already seen (pages can overlap when results shift between
+    requests) and skip_domains (the seeds) are dropped.
+    """
+    seen = set(skip_domains or ())
+    for offset, records in iter_discover_pages(filters, total, page_size, concurrency):
+        print(f"  → offset {offset}: {len(records)} records")
+        for record in records:
+            company = extract_company(record)
+            if not company["domain"] or company["domain"] in seen:
+                continue
+            seen.add(company["domain"])
+            yield company
+
+
+def default_output_path(seed: str) -> str:
+    """exports/<seed_domain>_lookalike_companies.csv (dots → underscores)."""
+    return str(EXPORTS_DIR / f"{normalize_domain(seed).replace('.', '_')}_lookalike_companies.csv")
+
+
+def discover_lookalikes(
+    seeds: List[str],
+    output_csv: str = None,
+    max_records: int = DEFAULT_MAX_RECORDS,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    metrics_path: str = None,
+    **filter_args
+) -> str:
+    """
+    Main discovery workflow.
+
+    Sizes the job with /count, then fetches /discover pages in parallel by
+    offset and writes the merged, deduplicated companies as they arrive.
+
+    Args:
+        seeds: Seed domain(s) to find lookalikes of
+        output_csv: Output path (default: exports/<seed>_lookalike_companies.csv)
+        max_records: Max companies to pull (DiscoLike caps a search at 10,000)
+        page_size: Records per /discover request
+        concurrency: /discover requests in flight at once
+        metrics_path: Where to append per-provider metrics (JSON lines, or
+            Prometheus text for a .prom path; default <output>_metrics.jsonl)
+        **filter_args: Search filters, see build_filters()
+
+    Returns:
+        Path to output CSV
+    """
+    print("=" * 60)
+    print("LOOKALIKE DISCOVERY")
+    print("=" * 60)
+
+    # Validate API key
+    if not DISCOLIKE_API_KEY:
+        print("❌ Error: DISCOLIKE_API_KEY environment variable not set")
+        print("   export DISCOLIKE_API_KEY='your-api-key'")
+        sys.exit(1)
+
+    filters = build_filters(seeds, **filter_args)
+    print(f"🌱 Seeds: {filters['domain']}")
+
+    # Size the job
+    matches = count_matches(filters)
+    if matches is None:
+        print("❌ /count failed - not running discovery")
+        return ""
+    total = min(matches, max_records, MAX_RECORDS_LIMIT)
+    pages = -(-total // page_size) if total else 0
+    print(f"📊 Matching companies: {matches} → fetching {total} in {pages} pages "
+          f"({concurrency} in parallel)")
+
+    if not total:
+        print("❌ No companies match these filters")
+        return ""
+
+    output_csv = output_csv or default_output_path(seeds[0])
+    os.makedirs(os.path.dirname(os.path.abspath(output_csv)), exist_ok=True)
+
+    start = perf_counter()
+    written = 0
+    industries = Counter()
+    with open(output_csv, 'w', newline='', encoding='utf-8') as out:
+        writer = csv.DictWriter(out, fieldnames=LOOKALIKE_FIELDNAMES, extrasaction='ignore')
+        writer.writeheader()
+        skip = {normalize_domain(seed) for seed in seeds}
+        for company in iter_lookalikes(filters, total, page_size, concurrency, skip):
+            writer.writerow(company)
+            written += 1
+            industries[company['primary_industry'] or 'UNKNOWN'] += 1
+    elapsed = perf_counter() - start
+
+    # Summary
+    print()
+    print("=" * 60)
+    print("✅ DISCOVERY COMPLETE")
+    print("=" * 60)
+    print(f"   Companies written: {written} (of {total} requested, {matches} matching)")
+    print(f"   Time: {elapsed:.1f}s")
+    print(f"   Top industries:")
+    for industry, count in industries.most_common(5):
+        print(f"     {industry}: {count} ({count / written:.0%})")
+    for line in METRICS.summary_lines():
+        print(f"   {line}")
+    metrics_path = metrics_path or os.path.splitext(output_csv)[0] + "_metrics.jsonl"
+    METRICS.write(metrics_path, run=filters['domain'], rows=written)
+    print(f"   Metrics file: {metrics_path}")
+    print(f"   Output file: {output_csv}")
+    print("=" * 60)
+
+    return output_csv
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def csv_list(value: str) -> List[str]:
+    """'US, CA' → ['US', 'CA']"""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Find lookalike companies with DiscoLike and write a lookalike CSV',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python discover_lookalikes.py selectforeverfierce.com
+    python discover_lookalikes.py acme.com --country US --employees 11,200 --max-records 5000
+    python discover_lookalikes.py acme.com --negate-category SPORTS_AND_RECREATION,RESTAURANTS
+    python discover_lookalikes.py acme.com other.com --icp "custom apparel for gyms" -o lookalikes.csv
+
+Environment Variables:
+    DISCOLIKE_API_KEY       Your DiscoLike API key (required)
+    DISCOLIKE_RATE_LIMIT    Request limits (default: 5/s)
+    DISCOLIKE_CREDIT_COST   Estimated credits per request, for the metrics (default: 1)
+        """
+    )
+
+    parser.add_argument('seeds', nargs='+', help='Seed domain(s)')
+    parser.add_argument('--output', '-o', help='Output CSV file path')
+    parser.add_argument('--max-records', '-n', type=int, default=DEFAULT_MAX_RECORDS,
+                        help=f'Max companies to pull (default: {DEFAULT_MAX_RECORDS}, DiscoLike max: {MAX_RECORDS_LIMIT})')
+    parser.add_argument('--country', type=csv_list, help='ISO country codes, e.g. US,CA')
+    parser.add_argument('--state', type=csv_list, help='State codes, e.g. NY,NJ')
+    parser.add_argument('--employees', help='Employee range "min,max", e.g. 11,200')
+    parser.add_argument('--min-similarity', type=int, default=DEFAULT_MIN_SIMILARITY,
+                        help=f'Min similarity 0-99 (default: {DEFAULT_MIN_SIMILARITY})')
+    parser.add_argument('--min-score', type=int, help='Min digital footprint score 0-800')
+    parser.add_argument('--icp', help='Natural language ICP description')
+    parser.add_argument('--category', type=csv_list, help='Industry categories to require')
+    parser.add_argument('--negate-category', type=csv_list, help='Industry categories to exclude')
+    parser.add_argument('--negate-domain', type=csv_list, help='Domains to exclude')
+    parser.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE,
+                        help=f'Records per /discover request (default: {DEFAULT_PAGE_SIZE})')
+    parser.add_argument('--concurrency', '-c', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'/discover requests in flight at once (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--metrics',
+                        help='Per-provider metrics file: JSON lines, or Prometheus text if it ends in .prom '
+                             '(default: <output>_metrics.jsonl)')
+
+    args = parser.parse_args()
+
+    discover_lookalikes(
+        seeds=args.seeds,
+        output_csv=args.output,
+        max_records=args.max_records,
+        page_size=args.page_size,
+        concurrency=args.concurrency,
+        metrics_path=args.metrics,
+        icp_text=args.icp,
+        countries=args.country,
+        states=args.state,
+        employee_range=args.employees,
+        min_similarity=args.min_similarity,
+        min_score=args.min_score,
+        categories=args.category,
+        negate_categories=args.negate_category,
+        negate_domains=args.negate_domain
+    )
+
+
+if __name__ == "__main__":
+    main()
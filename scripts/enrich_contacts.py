@@ -15,19 +15,46 @@ import csv
 import sys
 import os
 import argparse
+import itertools
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Optional
-from time import sleep
+from pathlib import Path
+from typing import Callable, List, Dict, Iterator, Optional
+from time import perf_counter, sleep
+
+# Add tools directory to path for shared helpers
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+from rate_limiter import build_rate_limiters
+from checkpoint import Checkpoint, CHECKPOINT_EVERY, open_output
+from http_client import ProviderSessions, base_url
+from metrics import Metrics
+from domains import normalize_domain
+from dedupe import SharedResults, count_keys
+from exclusions import ExclusionIndex, EXCLUSION_LISTS_DIR
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
 AIARK_API_KEY = os.environ.get("AIARK_API_KEY", "")
-AIARK_BASE_URL = "https://api.ai-ark.com/api/developer-portal/v1"
+AIARK_BASE_URL = base_url("aiark")
 
-# Rate limits: 5/sec, 300/min, 18000/hour
-RATE_LIMIT_DELAY = 0.25  # 4 requests/sec to be safe
+# Pooled keep-alive connections (HTTP_POOL_SIZE, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+HTTP = ProviderSessions.from_keys(os.environ)
+
+# Rate limits: 5/sec, 300/min, 18000/hour (override with AIARK_RATE_LIMIT)
+RATE_LIMITERS = build_rate_limiters(os.environ)
+
+# Per-provider call counts, latency, errors, hit rates and credit spend
+# (credit cost per request: AIARK_CREDIT_COST)
+METRICS = Metrics.from_keys(os.environ)
+
+# 429 handling: bounded retries with exponential backoff (2s, 4s, 8s, ...)
+MAX_429_RETRIES = 5
+BACKOFF_BASE = 2.0
+
+# Safety cap on pages fetched for a single search
+MAX_PAGES = 20
 
 # Target decision-maker profiles
 TARGET_SENIORITIES = ["C-Level", "VP", "Director", "Owner", "Founder", "Partner"]
@@ -36,6 +63,9 @@ TARGET_DEPARTMENTS = ["Executive", "Sales", "Business Development", "Marketing",
 # Max contacts per company
 MAX_CONTACTS_PER_COMPANY = 5
 
+# Domains per batched people search (--batch-size); 1 = one request per company
+DEFAULT_BATCH_SIZE = 1
+
 
 # =============================================================================
 # AI ARK API
@@ -50,11 +80,158 @@ def aiark_headers() -> Dict[str, str]:
     }
 
 
+def clean_domain(domain: str) -> str:
+    """Normalize a domain (remove protocol, www, path, port; lowercase)."""
+    return normalize_domain(domain)
+
+
+def build_contact_filter(seniorities: List[str] = None, departments: List[str] = None) -> Dict:
+    """Build the contact filter block shared by single and batched searches."""
+    contact_filter = {}
+
+    if seniorities:
+        contact_filter["seniority"] = {
+            "include": seniorities
+        }
+
+    if departments:
+        contact_filter["department"] = {
+            "include": departments
+        }
+
+    return contact_filter
+
+
+def build_people_payload(domains: List[str], seniorities: List[str] = None, departments: List[str] = None,
+                         page_size: int = 10) -> Dict:
+    """
+    Build the /people request body shared by single and batched searches.
+
+    Domains go in account.domain.any.include (see docs/AI_ARK_API.md), so
+    one domain and a batch of them are the same query to the API.
+    """
+    # See: https://docs.ai-ark.com/reference/people-search-1
+    payload = {
+        "page": 0,
+        "size": min(page_size, 100),
+        "account": {
+            "domain": {
+                "any": {
+                    "include": list(domains)
+                }
+            }
+        }
+    }
+
+    # Add contact filters if specified
+    contact_filter = build_contact_filter(seniorities, departments)
+    if contact_filter:
+        payload["contact_filter"] = contact_filter
+
+    return payload
+
+
+def post_people_search(payload: Dict, label: str) -> Optional[Dict]:
+    """
+    POST a payload to the AI Ark /people endpoint.
+
+    429s are retried up to MAX_429_RETRIES times with exponential backoff
+    (honoring Retry-After when sent). Returns the parsed response body, or
+    None on failure (errors are printed, using label to say which search
+    failed).
+    """
+    for attempt in range(MAX_429_RETRIES + 1):
+        throttled = RATE_LIMITERS["aiark"].acquire()
+        start = perf_counter()
+        status = None
+
+        try:
+            response = HTTP.request(
+                "aiark", "POST", f"{AIARK_BASE_URL}/people",
+                headers=aiark_headers(),
+                json=payload,
+                timeout=(HTTP.timeout[0], 30)
+            )
+            status = response.status_code
+            METRICS.record_call("aiark", perf_counter() - start, status, throttled=throttled)
+
+            if response.status_code == 200:
+                return response.json()
+            elif response.status_code == 401:
+                print(f"  ⚠️  AI Ark auth failed - check AIARK_API_KEY")
+            elif response.status_code == 429:
+                if attempt == MAX_429_RETRIES:
+                    print(f"  ⚠️  Rate limited - giving up on {label}")
+                    break
+                retry_after = response.headers.get("Retry-After", "")
+                wait = float(retry_after) if retry_after.isdigit() else BACKOFF_BASE * 2 ** attempt
+                print(f"  ⚠️  Rate limited - waiting {wait:.0f}s...")
+                sleep(wait)
+                continue
+            else:
+                # Silent fail for individual lookups
+                pass
+
+        except requests.exceptions.Timeout:
+            METRICS.record_call("aiark", perf_counter() - start, timed_out=True, throttled=throttled)
+            print(f"  ⚠️  Timeout for {label}")
+        except Exception as e:
+            if status is None:
+                METRICS.record_call("aiark", perf_counter() - start, throttled=throttled)
+            print(f"  ⚠️  Error: {str(e)[:50]}")
+
+        break
+
+    return None
+
+
+def people_from_response(data: Dict) -> List[Dict]:
+    """Pull the people list out of a /people response."""
+    # Response structure: { content: [...], pageable: {...}, totalElements: N }
+    return data.get("content", data.get("results", data.get("people", [])))
+
+
+def iter_people_pages(payload: Dict, label: str, max_pages: int = MAX_PAGES) -> Iterator[List[Dict]]:
+    """
+    Lazily yield pages of people for a /people payload.
+
+    The next page is only requested when the caller asks for it, so a
+    consumer that stops iterating once it has enough contacts never pays
+    for the rest. Paging ends at the last page according to totalElements
+    (falling back to totalPages, or a short page) or after max_pages.
+    """
+    payload = dict(payload)
+    size = payload.get("size", 10)
+
+    for page in range(max_pages):
+        payload["page"] = page
+        data = post_people_search(payload, label)
+        if not data:
+            return
+
+        people = people_from_response(data)
+        if not people:
+            return
+        yield people
+
+        total_elements = data.get("totalElements")
+        total_pages = data.get("totalPages")
+        if total_elements is not None:
+            if (page + 1) * size >= total_elements:
+                return
+        elif total_pages is not None:
+            if page + 1 >= total_pages:
+                return
+        elif len(people) < size:
+            return
+
+
 def search_people_at_company(
     domain: str,
     seniorities: List[str] = None,
     departments: List[str] = None,
-    page_size: int = 10
+    page_size: int = 10,
+    max_results: int = None
 ) -> List[Dict]:
     """
     Search for people at a company using AI Ark People Search API.
@@ -71,68 +248,99 @@ def search_people_at_company(
         seniorities: List of seniority levels to filter by
         departments: List of departments to filter by
         page_size: Number of results per page (max 100)
+        max_results: Stop paging once this many people are found
+            (None = every matching page, up to MAX_PAGES)
 
     Returns:
         List of person dictionaries with contact info
     """
-    endpoint = f"{AIARK_BASE_URL}/people"
-
-    # Build request payload
-    # See: https://docs.ai-ark.com/reference/people-search-1
-    payload = {
-        "page": 0,
-        "size": min(page_size, 100),
-        "account_filter": {
-            "domain": {
-                "include": [domain]
-            }
-        }
-    }
+    payload = build_people_payload([domain], seniorities, departments, page_size)
+
+    people = []
+    for page in iter_people_pages(payload, domain):
+        people.extend(page)
+        if max_results is not None and len(people) >= max_results:
+            people = people[:max_results]
+            break
+
+    METRICS.record_outcome("aiark", people)
+    return people
+
+
+def person_company_domain(person: Dict) -> str:
+    """Get the (normalized) company domain a person record belongs to."""
+    company = person.get("company") or {}
+    link = company.get("link") or {}
+    return clean_domain(
+        link.get("domain") or
+        person.get("company_domain") or
+        person.get("domain") or
+        link.get("website") or
+        ""
+    )
 
-    # Add contact filters if specified
-    contact_filter = {}
 
-    if seniorities:
-        contact_filter["seniority"] = {
-            "include": seniorities
-        }
+def search_people_batch(
+    domains: List[str],
+    seniorities: List[str] = None,
+    departments: List[str] = None,
+    per_company: int = MAX_CONTACTS_PER_COMPANY,
+    max_pages: int = MAX_PAGES
+) -> Dict[str, List[Dict]]:
+    """
+    Search for people at many companies with one paged AI Ark query.
 
-    if departments:
-        contact_filter["department"] = {
-            "include": departments
-        }
+    Packs all domains into one query (see build_people_payload), pages
+    through the combined results and fans the people back out to their
+    companies by domain. The combined results are capped at max_pages
+    pages, which one large company can fill on its own; when the cap is
+    hit, every company still short of its quota is re-queried on its own
+    with search_people_at_company.
 
-    if contact_filter:
-        payload["contact_filter"] = contact_filter
+    Args:
+        domains: Company domains (docs recommend up to ~50 per request)
+        seniorities: List of seniority levels to filter by
+        departments: List of departments to filter by
+        per_company: Max people kept per company
+        max_pages: Safety cap on pages fetched for one batch
 
-    try:
-        response = requests.post(
-            endpoint,
-            headers=aiark_headers(),
-            json=payload,
-            timeout=30
+    Returns:
+        Dict of domain -> list of person dictionaries (every input domain
+        is present, possibly with an empty list)
+    """
+    people_by_domain = {clean_domain(d): [] for d in domains}
+
+    payload = build_people_payload(list(people_by_domain), seniorities, departments, page_size=100)
+
+    label = f"batch of {len(domains)} domains"
+    pages = 0
+    for people in iter_people_pages(payload, label, max_pages=max_pages):
+        pages += 1
+        for person in people:
+            matches = people_by_domain.get(person_company_domain(person))
+            if matches is not None and len(matches) < per_company:
+                matches.append(person)
+
+        # Stop as soon as every company has its quota
+        if all(len(matches) >= per_company for matches in people_by_domain.values()):
+            break
+
+    short = []
+    if pages >= max_pages:
+        short = [d for d, matches in people_by_domain.items() if len(matches) < per_company]
+        if short:
+            print(f"    ⚠️  {label}: hit the {max_pages}-page cap, "
+                  f"re-querying {len(short)} companies short of {per_company} contacts")
+
+    for domain in short:
+        people_by_domain[domain] = search_people_at_company(
+            domain, seniorities, departments, page_size=per_company, max_results=per_company
         )
 
-        if response.status_code == 200:
-            data = response.json()
-            # Response structure: { content: [...], pageable: {...}, totalElements: N }
-            return data.get("content", data.get("results", data.get("people", [])))
-        elif response.status_code == 401:
-            print(f"  ⚠️  AI Ark auth failed - check AIARK_API_KEY")
-        elif response.status_code == 429:
-            print(f"  ⚠️  Rate limited - waiting...")
-            sleep(5)
-            return search_people_at_company(domain, seniorities, departments, page_size)
-        else:
-            # Silent fail for individual lookups
-            pass
-
-    except requests.exceptions.Timeout:
-        print(f"  ⚠️  Timeout for {domain}")
-    except Exception as e:
-        print(f"  ⚠️  Error: {str(e)[:50]}")
-
-    return []
+    for domain, matches in people_by_domain.items():
+        if domain not in short:
+            METRICS.record_outcome("aiark", matches)
+    return people_by_domain
 
 
 def enrich_person_email(person_id: str) -> Optional[str]:
@@ -145,11 +353,67 @@ def enrich_person_email(person_id: str) -> Optional[str]:
     pass
 
 
+# =============================================================================
+# ROW RECORDS
+# Fixed-field records instead of per-row dicts: a run over a few hundred
+# thousand companies holds and writes one small object per company/contact.
+# =============================================================================
+
+@dataclass
+class Company:
+    """One company from a /lookalike CSV."""
+    __slots__ = ('domain', 'company_name', 'similarity', 'employees', 'score', 'city', 'state',
+                 'country', 'primary_industry', 'description')
+    domain: str
+    company_name: str
+    similarity: str
+    employees: str
+    score: str
+    city: str
+    state: str
+    country: str
+    primary_industry: str
+    description: str
+
+    def output_fields(self) -> tuple:
+        """Company columns of ENRICHED_FIELDNAMES, in order (company_linkedin is not in the input)."""
+        return (self.company_name, self.domain, "", self.employees, self.city, self.state,
+                self.country, self.primary_industry, self.similarity)
+
+
+@dataclass
+class Contact:
+    """One decision-maker from AI Ark, normalized."""
+    __slots__ = ('first_name', 'last_name', 'title', 'seniority', 'department', 'email', 'phone',
+                 'linkedin_url')
+    first_name: str
+    last_name: str
+    title: str
+    seniority: str
+    department: str
+    email: str
+    phone: str
+    linkedin_url: str
+
+    def output_fields(self) -> tuple:
+        """Contact columns of ENRICHED_FIELDNAMES, in order."""
+        return (self.first_name, self.last_name, self.title, self.seniority, self.department,
+                self.email, self.phone, self.linkedin_url)
+
+
+NO_CONTACT = Contact("", "", "", "", "", "", "", "")
+
+
+def enriched_row(company: Company, contact: Contact = NO_CONTACT) -> tuple:
+    """One output row (ENRICHED_FIELDNAMES order); a company without contacts gets blank contact columns."""
+    return company.output_fields() + contact.output_fields()
+
+
 # =============================================================================
 # DATA EXTRACTION
 # =============================================================================
 
-def extract_person(person: Dict) -> Dict:
+def extract_person(person: Dict) -> Contact:
     """
     Extract and normalize person data from AI Ark response.
 
@@ -205,115 +469,185 @@ def extract_person(person: Dict) -> Dict:
     seniority = person.get("seniority", person.get("level", ""))
     department = person.get("department", person.get("function", ""))
 
-    return {
-        "first_name": first_name,
-        "last_name": last_name,
-        "title": title,
-        "seniority": seniority,
-        "department": department,
-        "email": email,
-        "phone": phone,
-        "linkedin_url": linkedin,
-    }
+    return Contact(
+        first_name=first_name,
+        last_name=last_name,
+        title=title,
+        seniority=seniority,
+        department=department,
+        email=email,
+        phone=phone,
+        linkedin_url=linkedin,
+    )
 
 
 # =============================================================================
 # CSV PROCESSING
 # =============================================================================
 
-def read_lookalike_csv(filepath: str) -> List[Dict]:
+def column_reader(index: Dict[str, int], *names: str, default: str = "") -> Callable[[List[str]], str]:
     """
-    Read CSV exported from /lookalike skill.
+    Cell getter for the first of names in a CSV header (name → position).
 
-    Expected columns: domain, name, similarity, employees, score, city, state, ...
+    Cells past the end of a short row read as ""; default is returned when
+    none of the names is in the header.
+    """
+    for name in names:
+        position = index.get(name)
+        if position is not None:
+            return lambda values: values[position] if position < len(values) else ""
+    return lambda values: default
+
+
+def iter_lookalike_csv(filepath: str, exclusions: Optional[ExclusionIndex] = None) -> Iterator[Company]:
     """
-    companies = []
+    Stream companies from a CSV exported from /lookalike skill, one row at a time.
 
+    Expected columns: domain, name, similarity, employees, score, city, state, ...
+    Rows are read as plain lists and picked apart by header position.
+    Companies whose domain is in exclusions (or under a listed domain) are dropped.
+    """
     with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Normalize column names (handle variations)
-            domain = (
-                row.get('domain') or
-                row.get('company_domain') or
-                row.get('website') or
-                ""
-            ).strip()
+        reader = csv.reader(f)
+        index = {name: position for position, name in enumerate(next(reader, []))}
+
+        # Normalize column names (handle variations)
+        domain_cells = [column_reader(index, name) for name in ('domain', 'company_domain', 'website')]
+        company_name = column_reader(index, 'name', 'company_name')
+        similarity = column_reader(index, 'similarity')
+        employees = column_reader(index, 'employees')
+        score = column_reader(index, 'score')
+        city = column_reader(index, 'city')
+        state = column_reader(index, 'state')
+        country = column_reader(index, 'country', default='US')
+        primary_industry = column_reader(index, 'primary_industry')
+        description = column_reader(index, 'description')
+
+        for values in reader:
+            if not values:
+                continue
+            domain = next((d for d in (cell(values) for cell in domain_cells) if d), "").strip()
 
             if not domain:
                 continue
 
-            # Clean domain (remove protocol, www, trailing slash)
-            domain = domain.lower()
-            domain = domain.replace('https://', '').replace('http://', '')
-            domain = domain.replace('www.', '')
-            domain = domain.rstrip('/')
-
-            companies.append({
-                'domain': domain,
-                'company_name': row.get('name', row.get('company_name', '')),
-                'similarity': row.get('similarity', ''),
-                'employees': row.get('employees', ''),
-                'score': row.get('score', ''),
-                'city': row.get('city', ''),
-                'state': row.get('state', ''),
-                'country': row.get('country', 'US'),
-                'primary_industry': row.get('primary_industry', ''),
-                'description': row.get('description', '')[:200] if row.get('description') else '',
-            })
-
-    return companies
-
-
-def write_enriched_csv(filepath: str, rows: List[Dict]):
-    """Write enriched data to CSV (Clay-compatible format)."""
-
-    fieldnames = [
-        # Company fields
-        'company_name',
-        'domain',
-        'company_linkedin',
-        'employees',
-        'city',
-        'state',
-        'country',
-        'primary_industry',
-        'similarity',
-        # Contact fields
-        'first_name',
-        'last_name',
-        'title',
-        'seniority',
-        'department',
-        'email',
-        'phone',
-        'linkedin_url',
-    ]
-
-    with open(filepath, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(rows)
+            # Clean domain (remove protocol, www, path)
+            domain = clean_domain(domain)
+            if not domain:
+                continue
+            if exclusions and domain in exclusions:
+                continue
+
+            yield Company(
+                domain=domain,
+                company_name=company_name(values),
+                similarity=similarity(values),
+                employees=employees(values),
+                score=score(values),
+                city=city(values),
+                state=state(values),
+                country=country(values),
+                primary_industry=primary_industry(values),
+                description=description(values)[:200],
+            )
+
+
+# Clay-compatible output columns
+ENRICHED_FIELDNAMES = [
+    # Company fields
+    'company_name',
+    'domain',
+    'company_linkedin',
+    'employees',
+    'city',
+    'state',
+    'country',
+    'primary_industry',
+    'similarity',
+    # Contact fields
+    'first_name',
+    'last_name',
+    'title',
+    'seniority',
+    'department',
+    'email',
+    'phone',
+    'linkedin_url',
+]
 
 
 # =============================================================================
 # MAIN WORKFLOW
 # =============================================================================
 
+def iter_company_people(companies: Iterator[Company], batch_size: int = DEFAULT_BATCH_SIZE,
+                        shared: Optional[SharedResults] = None) -> Iterator:
+    """
+    Yield (company, people) for each company, in input order.
+
+    With batch_size > 1, companies are grouped and each group is looked up
+    with a single batched search instead of one request per company.
+    With shared, a domain listed more than once is searched once and every
+    row for it gets the same people.
+    """
+    shared = shared or SharedResults({})
+    companies = iter(companies)
+    while True:
+        batch = list(itertools.islice(companies, max(batch_size, 1)))
+        if not batch:
+            return
+
+        if batch_size <= 1:
+            for company in batch:
+                yield company, shared.get(company.domain, lambda: search_people_at_company(
+                    domain=company.domain,
+                    seniorities=TARGET_SENIORITIES,
+                    departments=TARGET_DEPARTMENTS,
+                    page_size=MAX_CONTACTS_PER_COMPANY,
+                    max_results=MAX_CONTACTS_PER_COMPANY
+                ))
+            continue
+
+        # Each distinct domain once, skipping any already found in an earlier batch
+        domains = [d for d in dict.fromkeys(company.domain for company in batch) if not shared.done(d)]
+        people_by_domain = search_people_batch(
+            domains,
+            seniorities=TARGET_SENIORITIES,
+            departments=TARGET_DEPARTMENTS,
+            per_company=MAX_CONTACTS_PER_COMPANY
+        ) if domains else {}
+        for company in batch:
+            yield company, shared.get(company.domain, lambda: people_by_domain.get(company.domain, []))
+
+
 def enrich_companies(
     input_csv: str,
     output_csv: str = None,
     limit: int = None,
-    skip_no_contacts: bool = False
+    skip_no_contacts: bool = False,
+    resume: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    metrics_path: str = None,
+    exclude: List[str] = None
 ) -> str:
     """
     Main enrichment workflow.
 
+    Output rows are written as each company completes, and progress is
+    checkpointed to .sessions/ so an interrupted run can be resumed.
+
     Args:
         input_csv: Path to CSV from /lookalike skill
         output_csv: Output path (auto-generated if not provided)
         limit: Max companies to process (None = all)
         skip_no_contacts: If True, skip rows where no contacts found
+        resume: If True, continue an interrupted run for this input,
+            skipping companies already written
+        batch_size: Domains per AI Ark request (1 = one request per company)
+        metrics_path: Where to append per-provider metrics (JSON lines, or
+            Prometheus text for a .prom path; default <output>_metrics.jsonl)
+        exclude: Exclusion CSVs or directories of them; companies at listed
+            domains (or their subdomains) are skipped
 
     Returns:
         Path to output CSV
@@ -328,65 +662,34 @@ def enrich_companies(
         print("   export AIARK_API_KEY='your-api-key'")
         sys.exit(1)
 
-    # Read input
+    # Size the job without holding the companies in memory; they are
+    # streamed from the CSV below
     print(f"📂 Reading: {input_csv}")
-    companies = read_lookalike_csv(input_csv)
+    exclusions = ExclusionIndex.load(exclude) if exclude else None
+    total = 0
+    excluded = 0
+    for company in iter_lookalike_csv(input_csv):
+        if exclusions and company.domain in exclusions:
+            excluded += 1
+        else:
+            total += 1
+    if exclusions:
+        print(f"🚫 Excluded: {excluded} companies ({len(exclusions)} domains in exclusion lists)")
 
-    if not companies:
+    if not total:
         print("❌ No companies found in CSV")
         return ""
 
     if limit:
-        companies = companies[:limit]
+        total = min(total, limit)
 
-    print(f"📊 Companies to enrich: {len(companies)}")
+    print(f"📊 Companies to enrich: {total}")
     print()
 
-    # Process each company
-    results = []
-    companies_with_contacts = 0
-    total_contacts = 0
-
-    for i, company in enumerate(companies):
-        domain = company['domain']
-
-        # Progress indicator
-        if (i + 1) % 10 == 0 or i == 0:
-            print(f"🔍 Processing {i + 1}/{len(companies)}: {domain}")
-
-        # Search for decision-makers
-        people = search_people_at_company(
-            domain=domain,
-            seniorities=TARGET_SENIORITIES,
-            departments=TARGET_DEPARTMENTS,
-            page_size=MAX_CONTACTS_PER_COMPANY
-        )
-
-        if people:
-            companies_with_contacts += 1
-            for person in people[:MAX_CONTACTS_PER_COMPANY]:
-                person_data = extract_person(person)
-                total_contacts += 1
-                results.append({
-                    **company,
-                    **person_data
-                })
-        elif not skip_no_contacts:
-            # Include company row even without contacts
-            results.append({
-                **company,
-                'first_name': '',
-                'last_name': '',
-                'title': '',
-                'seniority': '',
-                'department': '',
-                'email': '',
-                'phone': '',
-                'linkedin_url': '',
-            })
-
-        # Rate limiting
-        sleep(RATE_LIMIT_DELAY)
+    # Resuming reuses the output file of the interrupted run
+    checkpoint = Checkpoint(input_csv, "enrich")
+    if resume and not output_csv and checkpoint.load():
+        output_csv = checkpoint.output_file
 
     # Generate output filename
     if not output_csv:
@@ -394,18 +697,81 @@ def enrich_companies(
         base_name = os.path.splitext(os.path.basename(input_csv))[0]
         output_csv = f"{base_name}_enriched_{timestamp}.csv"
 
-    # Write output
-    write_enriched_csv(output_csv, results)
+    out, resumed = open_output(output_csv, checkpoint, resume)
+    writer = csv.writer(out)
+    if resumed:
+        print(f"↻ Resuming after company {checkpoint.rows_completed} ({checkpoint.path})")
+    else:
+        writer.writerow(ENRICHED_FIELDNAMES)
+        out.flush()
+        checkpoint.commit(0, out.tell())
+
+    # Process each company
+    done = checkpoint.rows_completed
+    processed = 0
+    output_rows = 0
+    companies_with_contacts = 0
+    total_contacts = 0
+
+    # Pre-pass: domains listed more than once are searched once; every row gets the same contacts
+    duplicates = count_keys(
+        company.domain for company in itertools.islice(iter_lookalike_csv(input_csv, exclusions), done, total)
+    )
+    shared = SharedResults(duplicates)
+    if duplicates:
+        print(f"🔁 Duplicate domains: {sum(duplicates.values()) - len(duplicates)} rows repeat an earlier company")
+
+    companies = itertools.islice(iter_lookalike_csv(input_csv, exclusions), done, total)
+
+    try:
+        # Search for decision-makers
+        for i, (company, people) in enumerate(iter_company_people(companies, batch_size, shared), done):
+            domain = company.domain
+
+            # Progress indicator
+            if (i + 1) % 10 == 0 or i == done:
+                print(f"🔍 Processing {i + 1}/{total}: {domain}")
+
+            rows = []
+            if people:
+                companies_with_contacts += 1
+                for person in people[:MAX_CONTACTS_PER_COMPANY]:
+                    total_contacts += 1
+                    rows.append(enriched_row(company, extract_person(person)))
+            elif not skip_no_contacts:
+                # Include company row even without contacts
+                rows.append(enriched_row(company))
+
+            writer.writerows(rows)
+            out.flush()
+            output_rows += len(rows)
+            done = i + 1
+            processed += 1
+            if done % CHECKPOINT_EVERY == 0:
+                checkpoint.commit(done, out.tell())
+    finally:
+        checkpoint.commit(done, out.tell())
+        out.close()
+    checkpoint.finish()
 
     # Summary
     print()
     print("=" * 60)
     print("✅ ENRICHMENT COMPLETE")
     print("=" * 60)
-    print(f"   Companies processed: {len(companies)}")
+    print(f"   Companies processed: {processed}" + (f" (resumed after {done - processed})" if resumed else ""))
     print(f"   Companies with contacts: {companies_with_contacts}")
     print(f"   Total contacts found: {total_contacts}")
-    print(f"   Output rows: {len(results)}")
+    print(f"   Output rows: {output_rows}")
+    if excluded:
+        print(f"   Excluded companies: {excluded}")
+    if shared.reused:
+        print(f"   Duplicate companies (no API calls): {shared.reused}")
+    for line in METRICS.summary_lines():
+        print(f"   {line}")
+    metrics_path = metrics_path or os.path.splitext(output_csv)[0] + "_metrics.jsonl"
+    METRICS.write(metrics_path, run=os.path.basename(input_csv), rows=processed)
+    print(f"   Metrics file: {metrics_path}")
     print(f"   Output file: {output_csv}")
     print("=" * 60)
 
@@ -425,9 +791,14 @@ Examples:
     python enrich_contacts.py exports/foreverfierce/2026-02-04_v1.csv
     python enrich_contacts.py input.csv --output enriched.csv --limit 50
     python enrich_contacts.py input.csv --skip-no-contacts
+    python enrich_contacts.py input.csv --resume
+    python enrich_contacts.py input.csv --batch-size 50
+    python enrich_contacts.py input.csv --exclude exclusion-lists/
 
 Environment Variables:
-    AIARK_API_KEY    Your AI Ark API key (required)
+    AIARK_API_KEY       Your AI Ark API key (required)
+    AIARK_RATE_LIMIT    Request limits (default: 5/s,300/m,18000/h)
+    AIARK_CREDIT_COST   Estimated credits per request, for the metrics (default: 1)
         """
     )
 
@@ -436,6 +807,16 @@ Environment Variables:
     parser.add_argument('--limit', '-l', type=int, help='Max companies to process')
     parser.add_argument('--skip-no-contacts', action='store_true',
                         help='Skip companies where no contacts found')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue an interrupted run, skipping companies already written')
+    parser.add_argument('--batch-size', '-b', type=int, default=DEFAULT_BATCH_SIZE,
+                        help='Domains per AI Ark request (default: 1, docs recommend up to ~50)')
+    parser.add_argument('--metrics',
+                        help='Per-provider metrics file: JSON lines, or Prometheus text if it ends in .prom '
+                             '(default: <output>_metrics.jsonl)')
+    parser.add_argument('--exclude', action='append', nargs='?', const=str(EXCLUSION_LISTS_DIR),
+                        help='Skip companies on an exclusion list: a CSV file or a directory of them '
+                             '(repeatable; bare --exclude uses exclusion-lists/)')
 
     args = parser.parse_args()
 
@@ -447,7 +828,11 @@ Environment Variables:
         input_csv=args.input_csv,
         output_csv=args.output,
         limit=args.limit,
-        skip_no_contacts=args.skip_no_contacts
+        skip_no_contacts=args.skip_no_contacts,
+        resume=args.resume,
+        batch_size=args.batch_size,
+        metrics_path=args.metrics,
+        exclude=args.exclude
     )
 
 
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+BuzzLead Mock Provider Server
+
+Runs a local stand-in for every provider API the scripts call (TryKit,
+LeadMagic, Icypeas, Million Verifier, BounceBan, EmailGuard, AI Ark
+/people, DiscoLike /discover and /count), so concurrency and rate-limit
+settings can be tuned at production scale without spending credits.
+
+Usage:
+    python mock_server.py
+    python mock_server.py --port 8765 --latency-ms 150 --jitter-ms 100 --error-rate 0.01
+    python mock_server.py --burst-every 60 --burst-length 5 --timeout-rate 0.002
+    python mock_server.py --hit-rate trykit=0.5 --hit-rate leadmagic=0.3 --env-file mock.env
+
+Then point the scripts at it with the printed <PROVIDER>_BASE_URL lines
+(secrets file for the waterfall, environment for enrich_contacts.py).
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict
+
+# Add tools directory to path for shared helpers
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+from mock_providers import MockConfig, MockProviderServer
+
+
+def rate_pairs(values) -> Dict[str, float]:
+    """['trykit=0.5', 'good=0.7,risky=0.2'] → {'trykit': 0.5, 'good': 0.7, 'risky': 0.2}"""
+    rates = {}
+    for value in values or []:
+        for pair in value.split(","):
+            name, _, rate = pair.partition("=")
+            if not rate:
+                raise argparse.ArgumentTypeError(f"Expected name=rate, got {pair!r}")
+            rates[name.strip().lower()] = float(rate)
+    return rates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the BuzzLead provider APIs")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (0 = any free port)")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Latency added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra random latency per response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 500")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Fraction of requests that stall (client timeout)")
+    parser.add_argument("--hang", type=float, default=30.0, help="Seconds a stalled request hangs")
+    parser.add_argument("--burst-every", type=float, default=0.0, help="Seconds between 429 bursts (0 = never)")
+    parser.add_argument("--burst-length", type=float, default=1.0, help="Seconds each 429 burst lasts")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After sent with 429s")
+    parser.add_argument("--hit-rate", action="append", metavar="PROVIDER=RATE",
+                        help="Finder hit rate, e.g. trykit=0.6 (repeatable)")
+    parser.add_argument("--quality", metavar="good=R,risky=R,bad=R",
+                        help="Million Verifier quality mix (default: good=0.7,risky=0.2,bad=0.1)")
+    parser.add_argument("--company-hit-rate", type=float, default=0.8, help="AI Ark domains with any people")
+    parser.add_argument("--people-per-company", type=int, default=5, help="AI Ark people per domain")
+    parser.add_argument("--discolike-total", type=int, default=5000, help="Companies matched by DiscoLike")
+    parser.add_argument("--bulk-delay", type=float, default=0.0, help="Seconds bulk verification jobs take")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for outcomes and random latency")
+    parser.add_argument("--env-file", help="Also write the base URL overrides to this file")
+
+    args = parser.parse_args()
+
+    config = MockConfig(
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        hang=args.hang,
+        burst_every=args.burst_every,
+        burst_length=args.burst_length,
+        retry_after=args.retry_after,
+        company_hit_rate=args.company_hit_rate,
+        people_per_company=args.people_per_company,
+        discolike_total=args.discolike_total,
+        bulk_delay=args.bulk_delay,
+        seed=args.seed,
+    )
+    config.hit_rates.update(rate_pairs(args.hit_rate))
+    if args.quality:
+        config.quality_mix = rate_pairs([args.quality])
+
+    server = MockProviderServer(config, host=args.host, port=args.port)
+    overrides = "".join(f"{name}={url}\n" for name, url in server.base_url_overrides().items())
+
+    print(f"🧪 Mock providers listening on {server.url}")
+    print(f"   Latency {args.latency_ms:.0f}ms (+{args.jitter_ms:.0f}ms jitter), "
+          f"errors {args.error_rate:.1%}, timeouts {args.timeout_rate:.1%}")
+    if args.burst_every:
+        print(f"   429 bursts: {args.burst_length:g}s every {args.burst_every:g}s (Retry-After: {args.retry_after})")
+    print(f"   Finder hit rates: {config.hit_rates}")
+    print(f"\n# Add to the secrets file / environment:\n{overrides}")
+    if args.env_file:
+        with open(args.env_file, "w") as f:
+            f.write(overrides)
+        print(f"   Saved to: {args.env_file}")
+    print("Ctrl-C to stop")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(f"\n📊 Requests served: {dict(server.requests)}")
+
+
+if __name__ == "__main__":
+    main()
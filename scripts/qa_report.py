@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Batch QA Report Script
+Lookalike CSV or raw /discover JSON → industry breakdown, target-match warning, distributions + full review CSV
+
+Usage:
+    python qa_report.py <batch_csv_or_json> [--target <industries>] [--output <review_csv>]
+
+Example:
+    python qa_report.py exports/foreverfierce/2026-02-04_v1.csv --target BUSINESS_PRODUCTS_AND_SERVICES,E-COMMERCE
+"""
+
+import sys
+import os
+import argparse
+from pathlib import Path
+from typing import List
+from time import perf_counter
+
+# Add tools directory to path for shared helpers
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+from batch_report import BatchColumns, build_report, summary_lines, write_review_csv
+
+
+def qa_report(input_path: str, targets: List[str] = None, review_csv: str = None) -> str:
+    """
+    Build the STEP 5 / STEP 6a QA report for one discovery batch.
+
+    Args:
+        input_path: Lookalike CSV, review CSV, or raw /discover JSON
+        targets: The seed's industries (default: the most common primary industry)
+        review_csv: Review CSV path (default: <input>_review.csv)
+
+    Returns:
+        Path to review CSV
+    """
+    print("=" * 60)
+    print("BATCH QA REPORT")
+    print("=" * 60)
+
+    start = perf_counter()
+    print(f"📂 Reading: {input_path}")
+    columns = BatchColumns.load(input_path)
+    if not len(columns):
+        print("❌ No companies found")
+        return ""
+
+    report = build_report(columns, targets)
+    review_csv = review_csv or os.path.splitext(input_path)[0] + "_review.csv"
+    write_review_csv(columns, review_csv)
+
+    print(f"📊 Companies: {report.total}")
+    print()
+    for line in summary_lines(report):
+        print(line)
+    print()
+    print(f"   Time: {perf_counter() - start:.2f}s")
+    print(f"   Review file: {review_csv}")
+    print("=" * 60)
+
+    return review_csv
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Industry breakdown, target-match check and full review CSV for a lookalike batch',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python qa_report.py exports/acme/2026-02-04_v1.csv
+    python qa_report.py /tmp/discolike_batch.json --target BUSINESS_PRODUCTS_AND_SERVICES,E-COMMERCE
+    python qa_report.py exports/acme/2026-02-04_v1.csv -o exports/acme/batch2_full_review.csv
+        """
+    )
+
+    parser.add_argument('input', help='Lookalike CSV, review CSV, or raw /discover JSON')
+    parser.add_argument('--target', '-t',
+                        help='Target industries, comma-separated (default: the most common primary industry)')
+    parser.add_argument('--output', '-o', help='Review CSV path (default: <input>_review.csv)')
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"❌ File not found: {args.input}")
+        sys.exit(1)
+
+    qa_report(
+        input_path=args.input,
+        targets=args.target.split(",") if args.target else None,
+        review_csv=args.output
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Phrase Screening Script
+Lookalike CSV + session phrase exclusions → which phrase each company hit + bad-vs-good phrase table
+
+Usage:
+    python screen_phrases.py <lookalike_csv> [--session <session_json>] [--phrase <text>] [--bad <domains>]
+
+Example:
+    python screen_phrases.py exports/foreverfierce/2026-02-04_v1.csv --session .sessions/foreverfierce_session.json
+"""
+
+import csv
+import sys
+import os
+import json
+import argparse
+from collections import Counter
+from pathlib import Path
+from typing import List, Dict, Iterator, Optional
+
+# Add tools directory to path for shared helpers
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+from domains import normalize_domain
+from exclusions import ExclusionIndex
+from phrases import PhraseFilter, PhraseTable, format_table, DEFAULT_MIN_ROWS
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Values of a `fit` column that mark a company as a non-fit (anything else is a good fit)
+BAD_LABELS = {"bad", "no", "n", "exclude", "excluded", "x", "0", "false"}
+
+# Top phrases shown per side of the table
+DEFAULT_TABLE_LIMIT = 15
+
+
+# =============================================================================
+# INPUT
+# =============================================================================
+
+def load_session(path: str) -> Dict:
+    """Read a /lookalike session file (.sessions/<seed>_session.json)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def iter_companies(filepath: str) -> Iterator[Dict]:
+    """
+    Stream companies from a lookalike or review CSV.
+
+    Column names are matched loosely, so both the export columns (domain,
+    primary_industry, description) and the review CSV columns (Domain,
+    Primary Industry, Description) work. The optional `fit` column is the
+    reviewer's verdict.
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            row = {(key or "").strip().lower().replace(" ", "_"): value or "" for key, value in row.items()}
+            yield {
+                'domain': normalize_domain(row.get('domain') or row.get('company_domain') or row.get('website', '')),
+                'name': row.get('name') or row.get('company_name', ''),
+                'primary_industry': row.get('primary_industry', ''),
+                'description': row.get('description', ''),
+                'fit': row.get('fit', '').strip().lower(),
+            }
+
+
+# =============================================================================
+# SCREENING
+# =============================================================================
+
+def screen_companies(
+    input_csv: str,
+    phrases: List[str],
+    industries: List[str] = None,
+    bad_domains: List[str] = None,
+    output_csv: str = None,
+    min_rows: int = DEFAULT_MIN_ROWS,
+    limit: int = DEFAULT_TABLE_LIMIT
+) -> str:
+    """
+    Screen every description against the phrase exclusions in one pass.
+
+    A company is a non-fit when the reviewer marked it bad in a `fit`
+    column, or else when it hits an exclusion phrase, is in an excluded
+    industry or is one of bad_domains. Non-fits are written with the reason
+    and every phrase they hit; all descriptions feed the bad-vs-good phrase
+    table.
+
+    Args:
+        input_csv: Lookalike or review CSV
+        phrases: Phrase exclusions
+        industries: Industry exclusions (primary industry)
+        bad_domains: Domains already judged non-fits
+        output_csv: Where to write the non-fits (default: <input>_phrase_hits.csv)
+        min_rows: Rows a phrase must appear in to be recommended
+        limit: Phrases shown per side of the table
+
+    Returns:
+        Path to output CSV
+    """
+    print("=" * 60)
+    print("PHRASE SCREENING")
+    print("=" * 60)
+
+    phrase_filter = PhraseFilter(phrases)
+    excluded_industries = {industry.strip().upper() for industry in industries or []}
+    excluded_domains = ExclusionIndex(normalize_domain(d) for d in bad_domains or [])
+    print(f"📂 Reading: {input_csv}")
+    print(f"🚫 Exclusions: {len(phrase_filter)} phrases, {len(excluded_industries)} industries, "
+          f"{len(excluded_domains)} domains")
+
+    output_csv = output_csv or os.path.splitext(input_csv)[0] + "_phrase_hits.csv"
+    table = PhraseTable()
+    reasons = Counter()
+    phrase_hits = Counter()
+    total = 0
+
+    with open(output_csv, 'w', newline='', encoding='utf-8') as out:
+        writer = csv.writer(out)
+        writer.writerow(['domain', 'name', 'primary_industry', 'excluded_by', 'phrases', 'description'])
+        for company in iter_companies(input_csv):
+            total += 1
+            hits = phrase_filter.findall(company['description'])
+            phrase_hits.update(hits)
+
+            if company['fit']:
+                reason = "reviewer" if company['fit'] in BAD_LABELS else ""
+            elif hits:
+                reason = "phrase"
+            elif company['primary_industry'].upper() in excluded_industries:
+                reason = "industry"
+            elif company['domain'] in excluded_domains:
+                reason = "domain"
+            else:
+                reason = ""
+
+            table.add(company['description'], bad=bool(reason))
+            if reason:
+                reasons[reason] += 1
+                writer.writerow([company['domain'], company['name'], company['primary_industry'],
+                                 reason, ", ".join(hits), company['description'][:150]])
+
+    # Summary
+    bad = sum(reasons.values())
+    print()
+    print(f"📊 Companies: {total} ({bad} non-fits, {total - bad} good fits)")
+    for reason, count in reasons.most_common():
+        print(f"   {reason}: {count}")
+    if phrase_hits:
+        print()
+        print("🔎 PHRASE HITS:")
+        for phrase, count in phrase_hits.most_common():
+            print(f"   \"{phrase}\": {count}")
+
+    print()
+    recommendations = table.recommendations(min_rows=min_rows, limit=limit)
+    if not bad or bad == total:
+        print("⚠️  Phrase table needs both non-fits and good fits - mark some with a `fit` column or --bad")
+    elif recommendations:
+        print("📋 PHRASE ANALYSIS:")
+        for line in format_table(recommendations):
+            print(f"   {line}")
+    else:
+        print(f"📋 No phrase appears in {min_rows}+ rows of only one kind")
+
+    print()
+    print(f"   Output file: {output_csv}")
+    print("=" * 60)
+
+    return output_csv
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def csv_list(value: str) -> List[str]:
+    """'a.com, b.com' → ['a.com', 'b.com']"""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Screen lookalike descriptions against phrase exclusions and suggest new ones',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python screen_phrases.py exports/acme/2026-02-04_v1.csv --session .sessions/acme_session.json
+    python screen_phrases.py exports/acme/batch1_full_review.csv --phrase "fitness gym" --phrase "web design"
+    python screen_phrases.py exports/acme/2026-02-04_v1.csv --bad gymone.com,fitco.com --min-rows 3
+
+Non-fits are rows marked bad in a `fit` column, or else rows hitting the
+session's phrase, industry or domain exclusions (plus --phrase / --bad).
+        """
+    )
+
+    parser.add_argument('input_csv', help='Lookalike or review CSV')
+    parser.add_argument('--session', help='Session file with phrase_exclusions / industry_exclusions / domain_exclusions')
+    parser.add_argument('--phrase', action='append', default=[], help='Extra phrase exclusion (repeatable)')
+    parser.add_argument('--bad', type=csv_list, default=[], help='Domains judged non-fits, comma-separated')
+    parser.add_argument('--output', '-o', help='Non-fits CSV (default: <input>_phrase_hits.csv)')
+    parser.add_argument('--min-rows', type=int, default=DEFAULT_MIN_ROWS,
+                        help=f'Rows a phrase must appear in to be recommended (default: {DEFAULT_MIN_ROWS})')
+    parser.add_argument('--limit', type=int, default=DEFAULT_TABLE_LIMIT,
+                        help=f'Phrases shown per side of the table (default: {DEFAULT_TABLE_LIMIT})')
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input_csv):
+        print(f"❌ File not found: {args.input_csv}")
+        sys.exit(1)
+
+    session = load_session(args.session) if args.session else {}
+
+    screen_companies(
+        input_csv=args.input_csv,
+        phrases=session.get('phrase_exclusions', []) + args.phrase,
+        industries=session.get('industry_exclusions', []),
+        bad_domains=session.get('domain_exclusions', []) + args.bad,
+        output_csv=args.output,
+        min_rows=args.min_rows,
+        limit=args.limit
+    )
+
+
+if __name__ == "__main__":
+    main()
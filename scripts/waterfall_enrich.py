@@ -3,6 +3,7 @@
 BuzzLead Email Waterfall Enrichment
 
 Waterfall sequence:
+0. MX pre-screen (skip domains that can't receive mail)
 1. Million Verifier (validate existing)
 2. TryKit (find email)
 3. LeadMagic (find email)
@@ -12,25 +13,65 @@ Waterfall sequence:
 7. BounceBan (final validation)
 8. ESP Lookup (identify provider)
 
+Steps 2-4 run in this fixed order unless --adaptive is set, which orders
+them per contact by observed cost per found email. With --race N the first
+N finders in the order run in parallel and the best email wins.
+
 Usage:
     python waterfall_enrich.py input.csv -o output.csv
     python waterfall_enrich.py input.csv --secrets ~/.clawdbot/secrets/buzzlead-api-keys.env
+    python waterfall_enrich.py input.csv --concurrency 8
+    python waterfall_enrich.py input.csv --adaptive --explore 0.1
+    python waterfall_enrich.py input.csv --race 2 --race-precedence arrival
 """
 
+import io
 import os
 import sys
 import csv
 import time
 import argparse
+import itertools
+import threading
 import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, List
-from dataclasses import dataclass, asdict
+from typing import Optional, Dict, List, Callable, Iterable, Iterator, Tuple
 
 # Add tools directory to path for cleaners
 sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
 from clean_first_name import clean_first_name
 from clean_company_name import clean_company_name
+from rate_limiter import build_rate_limiters
+from result_cache import ResultCache, CACHE_MISS, make_key
+from checkpoint import Checkpoint, CHECKPOINT_EVERY, open_output
+from http_client import ProviderSessions, PROVIDER_BASE_URLS, base_url
+from email_patterns import DomainPatternEngine
+from bulk_verify import BulkVerifier
+from metrics import Metrics
+from domains import normalize_domain
+from dedupe import SharedResults, contact_key, count_keys
+from mx_screen import MXScreen
+from esp import ESPResolver
+from exclusions import ExclusionIndex, EXCLUSION_LISTS_DIR
+from finder_order import AdaptiveFinderOrder, FINDERS, DEFAULT_EXPLORE, DEFAULT_STATS_PATH
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / ".cache" / "waterfall_results.sqlite"
+
+# Learned-pattern candidates validated per contact before falling back to finders
+MAX_PATTERN_CANDIDATES = 2
+
+# Contacts per bulk verification chunk (--bulk-size)
+DEFAULT_BULK_SIZE = 5000
+
+# Bulk job rounds per chunk, so contacts can wait for formats learned at their domain
+MAX_BULK_WAVES = 3
+
+# How a race picks its winner (--race-precedence): the first finder in the
+# order that finds an email, or whichever finds one first
+RACE_PRECEDENCES = ("order", "arrival")
 
 
 def load_env_file(path: str) -> Dict[str, str]:
@@ -45,27 +86,107 @@ def load_env_file(path: str) -> Dict[str, str]:
     return keys
 
 
-@dataclass
 class EnrichmentResult:
-    """Result of email enrichment for a single contact."""
+    """Result of email enrichment for a single contact (the waterfall fills in the rest)."""
+    __slots__ = ('full_name', 'first_name_clean', 'domain', 'company_name_clean', 'original_email',
+                 'found_email', 'valid_email', 'email_source', 'quality', 'validity', 'esp_host',
+                 'mx_host', 'error')
+    
+    def __init__(self, full_name: str, first_name_clean: str, domain: str, company_name_clean: str,
+                 original_email: Optional[str] = None):
+        self.full_name = full_name
+        self.first_name_clean = first_name_clean
+        self.domain = domain
+        self.company_name_clean = company_name_clean
+        self.original_email = original_email
+        self.found_email: Optional[str] = None
+        self.valid_email: Optional[str] = None
+        self.email_source: Optional[str] = None
+        self.quality: Optional[str] = None
+        self.validity: Optional[str] = None
+        self.esp_host: Optional[str] = None
+        self.mx_host: Optional[str] = None
+        self.error: Optional[str] = None
+
+
+class CSVRow:
+    """
+    One input row, read by column name without a dict of its own.
+    
+    Wraps the list csv.reader returns plus a name → position map shared by
+    every row of the file. Cells missing from a short row read as "".
+    """
+    __slots__ = ('values', 'index')
+    
+    def __init__(self, values: List[str], index: Dict[str, int]):
+        self.values = values
+        self.index = index
+    
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        position = self.index.get(name)
+        if position is None:
+            return default
+        return self.values[position] if position < len(self.values) else ""
+    
+    def __getitem__(self, name: str) -> str:
+        if name not in self.index:
+            raise KeyError(name)
+        return self.get(name)
+
+
+def read_csv_rows(f) -> Tuple[List[str], Iterator[CSVRow]]:
+    """Header and a stream of CSVRow views for an open CSV file (blank lines skipped, like DictReader)."""
+    reader = csv.reader(f)
+    fieldnames = next(reader, [])
+    index = {name: position for position, name in enumerate(fieldnames)}
+    return fieldnames, (CSVRow(values, index) for values in reader if values)
+
+
+# Columns the waterfall adds to every row (replacing input columns of the same name)
+OUTPUT_COLUMNS = ['First Name', 'Company Name Clean', 'Valid Email', 'Email Host', 'Email Source', 'Email Quality']
+
+
+class OutputLayout:
+    """Output header for an input header, and where each of OUTPUT_COLUMNS goes in it."""
+    __slots__ = ('fieldnames', 'positions', 'width')
+    
+    def __init__(self, input_fieldnames: List[str]):
+        self.fieldnames = list(input_fieldnames)
+        for col in OUTPUT_COLUMNS:
+            if col not in self.fieldnames:
+                self.fieldnames.append(col)
+        self.positions = [self.fieldnames.index(col) for col in OUTPUT_COLUMNS]
+        self.width = len(self.fieldnames)
+    
+    def row(self, contact: CSVRow, values: Iterable[str]) -> List[str]:
+        """The input cells (padded or cut to the header) with the OUTPUT_COLUMNS values filled in."""
+        row = contact.values[:self.width]
+        row.extend([""] * (self.width - len(row)))
+        for position, value in zip(self.positions, values):
+            row[position] = value
+        return row
+
+
+@dataclass
+class ContactFields:
+    """The waterfall inputs pulled out of one input row."""
+    __slots__ = ('full_name', 'domain', 'company_name', 'existing_email', 'first_name_raw', 'key')
     full_name: str
-    first_name_clean: str
     domain: str
-    company_name_clean: str
-    original_email: Optional[str] = None
-    found_email: Optional[str] = None
-    valid_email: Optional[str] = None
-    email_source: Optional[str] = None
-    quality: Optional[str] = None
-    validity: Optional[str] = None
-    esp_host: Optional[str] = None
-    error: Optional[str] = None
+    company_name: str
+    existing_email: str
+    first_name_raw: str
+    key: tuple
 
 
 class WaterfallEnricher:
     """Email waterfall enrichment with cascading providers."""
     
-    def __init__(self, keys: Dict[str, str]):
+    def __init__(self, keys: Dict[str, str], cache: Optional[ResultCache] = None,
+                 sessions: Optional[ProviderSessions] = None, infer_patterns: bool = True,
+                 metrics: Optional[Metrics] = None, finder_order: Optional[AdaptiveFinderOrder] = None,
+                 race: int = 0, race_precedence: str = "order", race_pool: Optional[ThreadPoolExecutor] = None,
+                 mx_screen: Optional[MXScreen] = None):
         self.millionverifier_key = keys.get("MILLIONVERIFIER_API_KEY", "").strip()
         self.trykit_key = keys.get("TRYKIT_API_KEY", "").strip()
         self.leadmagic_key = keys.get("LEADMAGIC_API_KEY", "").strip()
@@ -73,6 +194,46 @@ class WaterfallEnricher:
         self.bounceban_key = keys.get("BOUNCEBAN_API_KEY", "").strip()
         self.emailguard_key = keys.get("EMAILGUARD_API_KEY", "").strip()
         
+        # Per-provider limiters, shared by every worker thread
+        self.rate_limiters = build_rate_limiters(keys)
+        
+        # Pooled keep-alive session per provider host
+        self.sessions = sessions or ProviderSessions.from_keys(keys)
+        self.base_urls = {provider: base_url(provider, keys) for provider in PROVIDER_BASE_URLS}
+        
+        # Optional on-disk cache of finder/validator results
+        self.cache = cache
+        
+        # Address formats learned per domain, tried before the paid finders
+        self.patterns = DomainPatternEngine(cache) if infer_patterns else None
+        
+        # Optional DNS pre-screen: domains without a mail server skip the finders
+        self.mx_screen = mx_screen
+        
+        # ESP per domain: from the MX host when it is a known provider, else EmailGuard
+        self.esp = ESPResolver(self.lookup_esp_emailguard, mx_screen)
+        
+        # Results filled in ahead of time by the bulk verification stage
+        self.prefetched: Dict[str, Dict[str, str]] = {}
+        
+        # Per-provider call counts, latency, errors, hit rates and credit spend
+        self.metrics = metrics or Metrics.from_keys(keys)
+        
+        # Email finders by provider; tried in FINDERS order unless finder_order picks one per contact
+        self.finders: Dict[str, Callable[[str, str], Optional[str]]] = {
+            "trykit": self.find_email_trykit,
+            "leadmagic": self.find_email_leadmagic,
+            "icypeas": self.find_email_icypeas,
+        }
+        self.finder_order = finder_order
+        
+        # Race mode: the first `race` finders are called in parallel on race_pool
+        if race_precedence not in RACE_PRECEDENCES:
+            raise ValueError(f"race_precedence must be one of {RACE_PRECEDENCES}, got {race_precedence!r}")
+        self.race = race if race > 1 else 0
+        self.race_precedence = race_precedence
+        self.race_pool = race_pool or (ThreadPoolExecutor(max_workers=self.race) if self.race else None)
+        
         # Validate required keys
         missing = []
         if not self.trykit_key: missing.append("TRYKIT_API_KEY")
@@ -82,130 +243,273 @@ class WaterfallEnricher:
         if missing:
             print(f"⚠️  Warning: Missing API keys: {', '.join(missing)}")
     
-    def _safe_request(self, method: str, url: str, timeout: int = 20, **kwargs) -> Optional[Dict]:
-        """Make API request with error handling."""
+    def _safe_request(self, provider: str, method: str, url: str, metric: Optional[str] = None,
+                      **kwargs) -> Optional[Dict]:
+        """
+        Make API request with error handling, throttled to the provider's rate limit.
+        
+        Latency and status are recorded in self.metrics under metric
+        (default: provider).
+        """
+        throttled = self.rate_limiters[provider].acquire()
+        start = time.perf_counter()
+        status, timed_out = None, False
         try:
-            response = requests.request(method, url, timeout=timeout, allow_redirects=True, **kwargs)
+            response = self.sessions.request(provider, method, url, allow_redirects=True, **kwargs)
+            status = response.status_code
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
+            timed_out = isinstance(e, requests.exceptions.Timeout)
             print(f"    API error: {e}")
             return None
+        finally:
+            self.metrics.record_call(metric or provider, time.perf_counter() - start, status,
+                                     timed_out=timed_out, throttled=throttled)
+    
+    def _cached(self, provider: str, key: tuple, fetch: Callable[[], Optional[Dict]],
+                extract: Callable[[Dict], Optional[str]]) -> Optional[str]:
+        """
+        Return a provider result from the cache, or fetch and cache it.
+        
+        fetch() makes the API call; extract() pulls the value out of the
+        response. Only successful responses are cached - "no email found" is
+        remembered, a timeout or API error is not.
+        """
+        prefetched = self.prefetched.get(provider)
+        if prefetched:
+            value = prefetched.get(make_key(*key))
+            if value is not None:
+                return value
+        if self.cache:
+            cached = self.cache.get(provider, *key)
+            if cached is not CACHE_MISS:
+                print(f"    (cached {provider}: {cached or 'none'})")
+                return cached
+        response = fetch()
+        if not response:
+            return None
+        value = extract(response)
+        self.metrics.record_outcome(provider, value)
+        if self.cache:
+            self.cache.put(provider, value, *key)
+        return value
+    
+    def prefetch(self, provider: str, results: Dict[str, str]):
+        """Record results obtained in bulk (e.g. {email: quality}) so single calls are skipped."""
+        store = self.prefetched.setdefault(provider, {})
+        for key, value in results.items():
+            store[make_key(key)] = value
+            if self.cache:
+                self.cache.put(provider, value, key)
     
     # ========== EMAIL FINDERS ==========
     
     def find_email_trykit(self, full_name: str, domain: str) -> Optional[str]:
         """TryKit email finder."""
         print(f"  → TryKit: Finding email...")
-        result = self._safe_request(
-            "POST", "https://api.trykitt.ai/job/find_email",
+        email = self._cached("trykit", (full_name, domain), lambda: self._safe_request(
+            "trykit", "POST", f"{self.base_urls['trykit']}/job/find_email",
             params={"src": "BuzzLead"},
             json={"fullName": full_name, "domain": domain, "realtime": True},
             headers={"x-api-key": self.trykit_key}
-        )
-        if result and result.get("email"):
-            print(f"    ✓ Found: {result['email']}")
-            return result["email"]
-        return None
+        ), lambda result: result.get("email") or None)
+        if email:
+            print(f"    ✓ Found: {email}")
+        return email
     
     def find_email_leadmagic(self, full_name: str, domain: str) -> Optional[str]:
         """LeadMagic email finder."""
         print(f"  → LeadMagic: Finding email...")
-        result = self._safe_request(
-            "POST", "https://api.leadmagic.io/business-email",
+        email = self._cached("leadmagic", (full_name, domain), lambda: self._safe_request(
+            "leadmagic", "POST", f"{self.base_urls['leadmagic']}/business-email",
             json={"name": full_name, "domain": domain},
             headers={"X-API-Key": self.leadmagic_key}
-        )
-        if result and result.get("email"):
-            print(f"    ✓ Found: {result['email']}")
-            return result["email"]
-        return None
+        ), lambda result: result.get("email") or None)
+        if email:
+            print(f"    ✓ Found: {email}")
+        return email
     
     def find_email_icypeas(self, full_name: str, domain: str) -> Optional[str]:
         """Icypeas email finder."""
         if not self.icypeas_key:
             return None
         print(f"  → Icypeas: Finding email...")
-        result = self._safe_request(
-            "POST", "https://app.icypeas.com/api/email-search",
+        email = self._cached("icypeas", (full_name, domain), lambda: self._safe_request(
+            "icypeas", "POST", f"{self.base_urls['icypeas']}/api/email-search",
             json={"full_name": full_name, "domain_name": domain},
             headers={"Authorization": f"Bearer {self.icypeas_key}", "Content-Type": "application/json"}
-        )
-        if result and result.get("email"):
-            print(f"    ✓ Found: {result['email']}")
-            return result["email"]
-        return None
+        ), lambda result: result.get("email") or None)
+        if email:
+            print(f"    ✓ Found: {email}")
+        return email
     
     # ========== VALIDATORS ==========
     
     def validate_millionverifier(self, email: str) -> Optional[str]:
         """Million Verifier quality check."""
         print(f"  → Million Verifier: Validating...")
-        result = self._safe_request(
-            "GET", "https://api.millionverifier.com/api/v3/",
+        quality = self._cached("millionverifier", (email,), lambda: self._safe_request(
+            "millionverifier", "GET", f"{self.base_urls['millionverifier']}/api/v3/",
             params={"api": self.millionverifier_key, "email": email, "timeout": "10"}
-        )
-        if result:
-            quality = result.get("quality", "unknown")
+        ), lambda result: result.get("quality", "unknown"))
+        if quality:
             print(f"    Quality: {quality}")
-            return quality
-        return None
+        return quality
     
     def validate_trykit(self, email: str) -> Optional[str]:
         """TryKit validation for risky emails."""
         print(f"  → TryKit Validation: Re-checking...")
-        result = self._safe_request(
-            "POST", "https://api.trykitt.ai/job/verify_email",
+        validity = self._cached("trykit_verify", (email,), lambda: self._safe_request(
+            "trykit", "POST", f"{self.base_urls['trykit']}/job/verify_email",
+            metric="trykit_verify",
             params={"src": "BuzzLead"},
             json={"email": email, "realtime": True},
             headers={"x-api-key": self.trykit_key}
-        )
-        if result:
-            validity = result.get("validity", "unknown")
+        ), lambda result: result.get("validity", "unknown"))
+        if validity:
             print(f"    Validity: {validity}")
-            return validity
-        return None
+        return validity
     
     def validate_bounceban(self, email: str) -> Optional[str]:
         """BounceBan final validation."""
         if not self.bounceban_key:
             return None
         print(f"  → BounceBan: Final check...")
-        result = self._safe_request(
-            "GET", "https://api.bounceban.com/v1/verify/single",
+        status = self._cached("bounceban", (email,), lambda: self._safe_request(
+            "bounceban", "GET", f"{self.base_urls['bounceban']}/v1/verify/single",
             params={"email": email},
             headers={"Authorization": self.bounceban_key}
-        )
-        if result:
-            status = result.get("result", "unknown")
+        ), lambda result: result.get("result", "unknown"))
+        if status:
             print(f"    Result: {status}")
-            return status
-        return None
+        return status
     
     def lookup_esp(self, email: str) -> Optional[str]:
-        """ESP Lookup to identify email provider."""
+        """ESP Lookup to identify email provider (once per domain)."""
+        return self.esp.lookup(email)
+    
+    def lookup_esp_emailguard(self, email: str) -> Optional[str]:
+        """EmailGuard ESP lookup; the answer is cached for the email's whole domain."""
         if not self.emailguard_key:
             return None
         print(f"  → ESP Lookup: Identifying provider...")
         auth_header = self.emailguard_key
         if not auth_header.startswith("Bearer "):
             auth_header = f"Bearer {auth_header}"
-        result = self._safe_request(
-            "POST", "https://app.emailguard.io/api/v1/email-host-lookup",
+        host = self._cached("emailguard", (normalize_domain(email),), lambda: self._safe_request(
+            "emailguard", "POST", f"{self.base_urls['emailguard']}/api/v1/email-host-lookup",
             json={"email": email},
             headers={"Authorization": auth_header}
-        )
-        if result and result.get("data"):
-            host = result["data"].get("email_host", "unknown")
+        ), lambda result: result["data"].get("email_host", "unknown") if result.get("data") else None)
+        if host:
             print(f"    ESP: {host}")
-            return host
+        return host
+    
+    # ========== PATTERN INFERENCE ==========
+    
+    def try_domain_patterns(self, result: EnrichmentResult, full_name: str, domain: str) -> Optional[str]:
+        """Validate emails built from this domain's learned address format before paying for a finder."""
+        for candidate in self.patterns.candidates(full_name, domain, limit=MAX_PATTERN_CANDIDATES):
+            print(f"  → Pattern: Trying {candidate}...")
+            quality = self.validate_millionverifier(candidate)
+            if quality == "good":
+                result.found_email = candidate
+                result.email_source = "pattern"
+                result.quality = quality
+                result.valid_email = candidate.lower()
+                print(f"  ✓ Pattern email is good!")
+                return candidate
         return None
     
+    # ========== FINDER RACE ==========
+    
+    def run_finders(self, order: Iterable[str], full_name: str, domain: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Steps 2-4: call finders in order until one returns an email.
+        
+        In race mode the first self.race finders are called at once, and
+        the rest run one by one only if none of them found anything.
+        Returns (provider, email), or (None, None).
+        """
+        order = list(order)
+        racers = order[:self.race]
+        if racers:
+            provider, email = self.race_finders(racers, full_name, domain)
+            if email:
+                return provider, email
+        for provider in order[len(racers):]:
+            email = self.finders[provider](full_name, domain)
+            if email:
+                return provider, email
+        return None, None
+    
+    def race_finders(self, racers: List[str], full_name: str, domain: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Call several finders in parallel and return (provider, email) for the winner.
+        
+        With precedence "order" the winner is the first racer in the list
+        that found an email, so a later racer's answer waits on the earlier
+        ones; with "arrival" it is whichever finds one first. Losers still
+        running are not waited for: their requests finish in the background
+        (the result is cached and counted in the metrics, and a pay-on-hit
+        finder may still charge for it). Racers not yet started are cancelled.
+        """
+        print(f"  ⇉ Racing {', '.join(racers)}...")
+        futures = {self.race_pool.submit(same_output(self.finders[provider]), full_name, domain): provider
+                   for provider in racers}
+        found: Dict[str, Optional[str]] = {}
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found[futures[future]] = future.result()
+                for provider in racers:
+                    if provider not in found:
+                        if self.race_precedence == "order":
+                            break  # an earlier racer may still win
+                        continue
+                    if found[provider]:
+                        print(f"  ⇉ {provider} wins the race")
+                        return provider, found[provider]
+            return None, None
+        finally:
+            for future in pending:
+                future.cancel()
+    
     # ========== MAIN WATERFALL ==========
     
     def enrich_contact(self, full_name: str, domain: str, company_name: str = "", 
                        existing_email: Optional[str] = None) -> EnrichmentResult:
-        """Run full waterfall enrichment for a single contact."""
+        """
+        Run full waterfall enrichment for a single contact.
+        
+        With pattern inference and no format learned for this contact yet,
+        a contact at a domain another worker thread is already on waits for
+        it to finish, so it can start from the format that one verifies.
+        """
+        if self.patterns and domain and not self.patterns.candidates(full_name, domain, limit=1):
+            with self.patterns.domain_turn(domain):
+                return self._enrich_contact(full_name, domain, company_name, existing_email)
+        return self._enrich_contact(full_name, domain, company_name, existing_email)
+    
+    def _enrich_contact(self, full_name: str, domain: str, company_name: str = "",
+                        existing_email: Optional[str] = None) -> EnrichmentResult:
+        result, email, quality = self.find_email(full_name, domain, company_name, existing_email)
+        if not email:
+            return result
+        return self.verify_email(result, email, quality)
+    
+    def find_email(self, full_name: str, domain: str, company_name: str = "",
+                   existing_email: Optional[str] = None) -> Tuple[EnrichmentResult, Optional[str], Optional[str]]:
+        """
+        Steps 1-4: validate the existing email, or find one.
+        
+        Returns (result, email, quality) where email is the address to verify
+        next (None if nothing was found) and quality its Million Verifier
+        quality so far.
+        """
         
         # Clean names
         first_name_clean = clean_first_name(full_name.split()[0] if full_name else "")
@@ -226,6 +530,17 @@ class WaterfallEnricher:
         email = existing_email if existing_email else None
         quality = None
         
+        # Step 0: Domains that can't receive mail aren't worth searching
+        # (an existing email is still checked, it may be at another domain)
+        searchable = True
+        if self.mx_screen:
+            mx = self.mx_screen.check(domain)
+            result.mx_host = mx.host
+            if not mx.searchable:
+                searchable = False
+                result.error = f"no mail server ({mx.status})"
+                print(f"  ✗ {domain} can't receive mail ({mx.status}), skipping finders")
+        
         # Step 1: Validate existing email (if provided)
         if email:
             quality = self.validate_millionverifier(email)
@@ -238,31 +553,30 @@ class WaterfallEnricher:
                 print(f"  ✗ Original email is bad, searching...")
                 email = None
         
+        # Step 1b: Try the address format already seen on this domain
+        if (not email or quality == "bad") and searchable and self.patterns:
+            email = self.try_domain_patterns(result, full_name, domain)
+            if email:
+                quality = "good"
+        
         # Step 2-4: Waterfall email finding
-        if not email or quality == "bad":
-            email = self.find_email_trykit(full_name, domain)
+        if (not email or quality == "bad") and searchable:
+            order = self.finder_order.order() if self.finder_order else FINDERS
+            provider, email = self.run_finders(order, full_name, domain)
             if email:
                 result.found_email = email
-                result.email_source = "trykit"
-            
-            if not email:
-                email = self.find_email_leadmagic(full_name, domain)
-                if email:
-                    result.found_email = email
-                    result.email_source = "leadmagic"
-            
-            if not email:
-                email = self.find_email_icypeas(full_name, domain)
-                if email:
-                    result.found_email = email
-                    result.email_source = "icypeas"
+                result.email_source = provider
         
         if not email:
             print(f"  ✗ No email found for {full_name}")
-            return result
+        return result, email, quality
+    
+    def verify_email(self, result: EnrichmentResult, email: str, quality: Optional[str]) -> EnrichmentResult:
+        """Steps 5-8: validate a found email, handle risky results, identify the ESP."""
+        full_name, domain = result.full_name, result.domain
         
         # Step 5: Validate waterfall-found email
-        if result.email_source and result.email_source != "original":
+        if result.email_source and result.email_source not in ("original", "pattern"):
             quality = self.validate_millionverifier(email)
             result.quality = quality
             if quality == "good":
@@ -287,6 +601,8 @@ class WaterfallEnricher:
         
         # Step 8: ESP Lookup
         if result.valid_email:
+            if self.patterns:
+                self.patterns.learn(domain, result.valid_email, full_name)
             esp = self.lookup_esp(result.valid_email)
             result.esp_host = esp
             print(f"\n  ★ VALID EMAIL: {result.valid_email} (source: {result.email_source}, esp: {result.esp_host})")
@@ -296,95 +612,550 @@ class WaterfallEnricher:
         return result
 
 
-def enrich_csv(input_file: str, output_file: str, secrets_file: str, delay: float = 0.5):
-    """Enrich contacts from CSV file."""
+def detect_columns(fieldnames: List[str]) -> Dict[str, Optional[str]]:
+    """Map the input CSV headers onto the fields the waterfall needs."""
+    return {
+        'name': next((c for c in fieldnames if c.lower() in ['full name', 'full_name', 'name', 'fullname']), None),
+        'domain': next((c for c in fieldnames if c.lower() in ['domain', 'company website', 'website', 'company_domain']), None),
+        'company': next((c for c in fieldnames if c.lower() in ['company', 'company name', 'company_name', 'org', 'organization']), None),
+        'email': next((c for c in fieldnames if c.lower() in ['email', 'email business', 'email_business', 'work_email']), None),
+        'first_name': next((c for c in fieldnames if c.lower() in ['first name', 'first_name', 'firstname']), None),
+    }
+
+
+def contact_fields(contact: CSVRow, cols: Dict[str, Optional[str]]) -> ContactFields:
+    """Pull the waterfall inputs out of one input row."""
+    full_name = contact.get(cols['name'], "") if cols['name'] else ""
     
-    # Load API keys
-    keys = load_env_file(secrets_file)
-    enricher = WaterfallEnricher(keys)
+    # Get domain, clean it (protocol, www, path, case)
+    domain = contact.get(cols['domain'], "") if cols['domain'] else ""
+    domain = normalize_domain(domain)
     
-    # Read input CSV
-    contacts = []
-    with open(input_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames
-        contacts = list(reader)
+    company = contact.get(cols['company'], "") if cols['company'] else ""
+    existing_email = contact.get(cols['email'], "") if cols['email'] else ""
     
-    print(f"\n📂 Loaded {len(contacts)} contacts from {input_file}")
+    # If we have first name col, use that for cleaning
+    first_name_col = cols['first_name']
+    if first_name_col and contact.get(first_name_col):
+        first_name_raw = contact.get(first_name_col, "")
+    else:
+        first_name_raw = full_name.split()[0] if full_name else ""
     
-    # Detect column names
-    name_col = next((c for c in fieldnames if c.lower() in ['full name', 'full_name', 'name', 'fullname']), None)
-    domain_col = next((c for c in fieldnames if c.lower() in ['domain', 'company website', 'website', 'company_domain']), None)
-    company_col = next((c for c in fieldnames if c.lower() in ['company', 'company name', 'company_name', 'org', 'organization']), None)
-    email_col = next((c for c in fieldnames if c.lower() in ['email', 'email business', 'email_business', 'work_email']), None)
-    first_name_col = next((c for c in fieldnames if c.lower() in ['first name', 'first_name', 'firstname']), None)
+    return ContactFields(
+        full_name=full_name,
+        domain=domain,
+        company_name=company,
+        existing_email=existing_email,
+        first_name_raw=first_name_raw,
+        key=contact_key(full_name, domain, existing_email),
+    )
+
+
+def merge_row(contact: CSVRow, result: EnrichmentResult, fields: ContactFields,
+              layout: OutputLayout) -> List[str]:
+    """
+    Merge an input row with its enrichment result.
     
-    print(f"   Detected columns: name={name_col}, domain={domain_col}, company={company_col}, email={email_col}")
+    The result may be shared with duplicate rows, so it is not modified;
+    the cleaned names come from this row's own fields.
+    """
+    company_name = fields.company_name
     
-    # Enrich contacts
-    results = []
-    for i, contact in enumerate(contacts, 1):
-        print(f"\n[{i}/{len(contacts)}]")
-        
-        full_name = contact.get(name_col, "") if name_col else ""
-        
-        # Get domain, clean it
-        domain = contact.get(domain_col, "") if domain_col else ""
-        domain = domain.replace('http://', '').replace('https://', '').rstrip('/')
-        
-        company = contact.get(company_col, "") if company_col else ""
-        existing_email = contact.get(email_col, "") if email_col else ""
-        
-        # If we have first name col, use that for cleaning
-        if first_name_col and contact.get(first_name_col):
-            first_name_raw = contact.get(first_name_col, "")
+    # Original cells plus the enrichment results (OUTPUT_COLUMNS order)
+    return layout.row(contact, (
+        clean_first_name(fields.first_name_raw),
+        clean_company_name(company_name) if company_name else "",
+        result.valid_email or "",
+        result.esp_host or "",
+        result.email_source or "",
+        result.quality or "",
+    ))
+
+
+def enrich_row(enricher: WaterfallEnricher, contact: CSVRow, cols: Dict[str, Optional[str]],
+               layout: OutputLayout, shared: Optional[SharedResults] = None) -> List[str]:
+    """
+    Run the waterfall for one input row and return the merged output row.
+    
+    With shared, a contact that also appears in other rows runs once and
+    every copy gets the same result.
+    """
+    fields = contact_fields(contact, cols)
+    
+    enrich = lambda: enricher.enrich_contact(
+        full_name=fields.full_name,
+        domain=fields.domain,
+        company_name=fields.company_name,
+        existing_email=fields.existing_email
+    )
+    result = shared.get(fields.key, enrich) if shared else enrich()
+    
+    return merge_row(contact, result, fields, layout)
+
+
+def next_bulk_wave(pending: Dict[tuple, ContactFields], patterns: Optional[DomainPatternEngine],
+                   last: bool = False) -> Tuple[Dict[tuple, ContactFields], Dict[tuple, ContactFields]]:
+    """
+    Split a chunk's pending contacts into the next bulk wave and the rest.
+    
+    A contact waits for a later wave while an earlier contact at its domain
+    goes first and no address format is learned for it yet, so it can start
+    from what that contact verified, as it would in a sequential run. The
+    last wave (or a run without pattern inference) takes everyone.
+    """
+    if last or not patterns:
+        return pending, {}
+    wave: Dict[tuple, ContactFields] = {}
+    rest: Dict[tuple, ContactFields] = {}
+    domains = set()
+    for key, f in pending.items():
+        if f.domain not in domains or patterns.candidates(f.full_name, f.domain, limit=1):
+            wave[key] = f
         else:
-            first_name_raw = full_name.split()[0] if full_name else ""
-        
-        result = enricher.enrich_contact(
-            full_name=full_name,
-            domain=domain,
-            company_name=company,
-            existing_email=existing_email
-        )
+            rest[key] = f
+        domains.add(f.domain)
+    return wave, rest
+
+
+def bulk_stages(enricher: WaterfallEnricher, verifier: BulkVerifier, todo: Dict[tuple, ContactFields],
+                concurrency: int = 1) -> Tuple[Dict[tuple, EnrichmentResult], List[tuple]]:
+    """
+    Steps 1-8 for distinct contacts, with the verification steps run as bulk jobs.
+    
+    Returns the results by contact key, and the keys of contacts that were
+    searched (pattern step and finders) without ending up with a valid email.
+    """
+    # Step 1 in bulk: existing emails
+    enricher.prefetch("millionverifier", verifier.millionverifier(f.existing_email for f in todo.values()))
+    
+    # Steps 1-4 per contact
+    found = list(run_ordered(
+        lambda f: enricher.find_email(f.full_name, f.domain, f.company_name, f.existing_email),
+        todo.values(), concurrency
+    ))
+    
+    # Step 5 in bulk: emails found by the finders
+    enricher.prefetch("millionverifier", verifier.millionverifier(
+        email for result, email, _ in found
+        if email and result.email_source not in (None, "original", "pattern")
+    ))
+    
+    # Steps 6-7: TryKit re-check for risky emails, then BounceBan in bulk for the rest
+    risky = list(dict.fromkeys(
+        email for result, email, quality in found
+        if email and (quality if result.email_source in (None, "original", "pattern")
+                      else enricher.prefetched.get("millionverifier", {}).get(make_key(email))) == "risky"
+    ))
+    validities = list(run_ordered(enricher.validate_trykit, risky, concurrency))
+    enricher.prefetch("trykit_verify", {
+        email: validity for email, validity in zip(risky, validities) if validity
+    })
+    enricher.prefetch("bounceban", verifier.bounceban(
+        email for email, validity in zip(risky, validities) if validity in ["invalid", "unknown"]
+    ))
+    
+    # Steps 5-8 from the prefetched results
+    results = dict(zip(todo, run_ordered(
+        lambda item: enricher.verify_email(*item) if item[1] else item[0], found, concurrency
+    )))
+    
+    # Searched: nothing found (and not skipped by the MX screen), or found by a finder
+    missed = [key for key, (result, email, _) in zip(todo, found)
+              if not result.valid_email and (result.email_source in enricher.finders
+                                             or (not email and not result.error))]
+    return results, missed
+
+
+def iter_bulk_rows(enricher: WaterfallEnricher, verifier: BulkVerifier, contacts: Iterable[CSVRow],
+                   cols: Dict[str, Optional[str]], layout: OutputLayout, concurrency: int = 1,
+                   chunk_size: int = DEFAULT_BULK_SIZE,
+                   shared: Optional[SharedResults] = None) -> Iterator[List[str]]:
+    """
+    Run the waterfall with bulk verification, yielding output rows in input order.
+    
+    Rows are processed in chunks. Per chunk: existing emails are verified
+    in one Million Verifier bulk job, the finders run per contact, every
+    found email is verified in a second bulk job, risky emails get their
+    TryKit re-check and the ones still in doubt go to BounceBan as one bulk
+    job. The results are then merged back and steps 5-8 run from the
+    prefetched answers, so only emails the bulk jobs missed are verified
+    one at a time. Duplicate contacts (see enrich_row) go through the
+    stages once, and a duplicate of a contact from an earlier chunk reuses
+    its result without being sent again.
+    
+    With pattern inference, a chunk runs the stages in up to MAX_BULK_WAVES
+    waves (see next_bulk_wave), so later contacts at a domain try the formats
+    verified for earlier ones before any finder. Contacts still without a
+    valid email then get one more pattern try with everything the chunk
+    learned.
+    """
+    shared = shared or SharedResults({})
+    contacts = iter(contacts)
+    while True:
+        chunk = list(itertools.islice(contacts, chunk_size))
+        if not chunk:
+            return
+        print(f"\n📦 Bulk chunk: {len(chunk)} contacts")
+        enricher.prefetched.clear()
+        fields = [contact_fields(contact, cols) for contact in chunk]
         
-        # Override first_name_clean if we have the raw first name
-        result.first_name_clean = clean_first_name(first_name_raw)
+        # One run per distinct contact not already answered
+        todo: Dict[tuple, ContactFields] = {}
+        for f in fields:
+            if not shared.done(f.key):
+                todo.setdefault(f.key, f)
         
-        # Merge original data with enrichment results
-        enriched_row = dict(contact)
-        enriched_row['First Name'] = result.first_name_clean
-        enriched_row['Company Name Clean'] = result.company_name_clean
-        enriched_row['Valid Email'] = result.valid_email or ""
-        enriched_row['Email Host'] = result.esp_host or ""
-        enriched_row['Email Source'] = result.email_source or ""
-        enriched_row['Email Quality'] = result.quality or ""
+        results: Dict[tuple, EnrichmentResult] = {}
+        missed: List[tuple] = []
+        pending = todo
+        for wave_number in range(1, MAX_BULK_WAVES + 1):
+            wave, pending = next_bulk_wave(pending, enricher.patterns, last=wave_number == MAX_BULK_WAVES)
+            if wave_number > 1:
+                print(f"\n📦 Wave {wave_number}: {len(wave)} contacts")
+            wave_results, wave_missed = bulk_stages(enricher, verifier, wave, concurrency)
+            results.update(wave_results)
+            missed.extend(wave_missed)
+            if not pending:
+                break
         
-        results.append(enriched_row)
+        # Step 1b again for the misses, with the formats learned from the rest of the chunk
+        if enricher.patterns and missed:
+            def retry(key):
+                result = results[key]
+                email = enricher.try_domain_patterns(result, result.full_name, result.domain)
+                if email:
+                    enricher.verify_email(result, email, "good")
+            for _ in run_ordered(retry, missed, concurrency):
+                pass
         
-        if i < len(contacts):
+        for contact, f in zip(chunk, fields):
+            result = shared.get(f.key, lambda: results[f.key])
+            yield merge_row(contact, result, f, layout)
+
+
+def count_csv_rows(path: str) -> int:
+    """Count data rows in a CSV without holding them in memory."""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return sum(1 for _ in read_csv_rows(f)[1])
+
+
+def is_excluded(contact: CSVRow, cols: Dict[str, Optional[str]],
+                exclusions: Optional[ExclusionIndex]) -> bool:
+    """Whether the row's domain or email domain is on an exclusion list (subdomains included)."""
+    if not exclusions:
+        return False
+    return any(col and contact.get(col) and contact[col] in exclusions for col in (cols['domain'], cols['email']))
+
+
+def iter_included(rows: Iterable[CSVRow], cols: Dict[str, Optional[str]],
+                  exclusions: Optional[ExclusionIndex]) -> Iterator[CSVRow]:
+    """Input rows minus the excluded ones."""
+    if not exclusions:
+        return iter(rows)
+    return (row for row in rows if not is_excluded(row, cols, exclusions))
+
+
+def scan_contacts(path: str, cols: Dict[str, Optional[str]], skip: int = 0,
+                  exclusions: Optional[ExclusionIndex] = None) -> Tuple[Dict[tuple, int], List[str], int]:
+    """
+    Pre-pass over the rows: how many are excluded, and for the included
+    rows after the first skip, occurrences of every contact key that
+    appears more than once and the distinct domains.
+    """
+    domains: Dict[str, None] = {}
+    excluded = 0
+    
+    def included(rows):
+        nonlocal excluded
+        for row in rows:
+            if is_excluded(row, cols, exclusions):
+                excluded += 1
+            else:
+                yield row
+    
+    def keys(rows):
+        for row in rows:
+            fields = contact_fields(row, cols)
+            domains[fields.domain] = None
+            yield fields.key
+    
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        rows = included(read_csv_rows(f)[1])
+        duplicates = count_keys(keys(itertools.islice(rows, skip, None)))
+    return duplicates, list(domains), excluded
+
+
+class OrderedOutput:
+    """
+    Stand-in for sys.stdout while run_ordered has calls in flight.
+    
+    A worker thread's prints go to a buffer of its own, which the consumer
+    writes out when it takes that call's result, so each contact's progress
+    lines come out together and in input order. Threads without a buffer
+    (the consumer) write straight through.
+    """
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+    
+    def buffer(self) -> Optional[io.StringIO]:
+        return getattr(self.local, 'buffer', None)
+    
+    def write(self, text: str) -> int:
+        buffer = self.buffer()
+        return (self.stream if buffer is None else buffer).write(text)
+    
+    def flush(self):
+        if self.buffer() is None:
+            self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+    
+    def capture(self, func: Callable) -> Callable:
+        """func with its prints buffered, returning (result, printed text)."""
+        def call(item):
+            self.local.buffer = io.StringIO()
+            try:
+                return func(item), self.local.buffer.getvalue()
+            except BaseException:
+                self.stream.write(self.local.buffer.getvalue())
+                raise
+            finally:
+                self.local.buffer = None
+        return call
+    
+    def release(self, future):
+        """Write out a captured call's prints and return its result."""
+        result, text = future.result()
+        self.stream.write(text)
+        return result
+
+
+def same_output(func: Callable) -> Callable:
+    """
+    func set to print into the calling thread's OrderedOutput buffer.
+    
+    For helper threads a worker hands its work to (race_finders). Anything
+    printed after the worker's call has returned (a race loser finishing
+    late) is dropped.
+    """
+    output = sys.stdout
+    if not isinstance(output, OrderedOutput) or output.buffer() is None:
+        return func
+    buffer = output.buffer()
+    
+    def call(*args, **kwargs):
+        output.local.buffer = buffer
+        try:
+            return func(*args, **kwargs)
+        finally:
+            output.local.buffer = None
+    return call
+
+
+def run_ordered(func: Callable, items: Iterable, concurrency: int = 1) -> Iterator:
+    """
+    Apply func to each item, yielding results in input order.
+    
+    With concurrency > 1, up to that many calls run at once on a thread pool.
+    Submission is bounded to a small window ahead of the next result to
+    yield, so a slow contact never lets the backlog grow without limit.
+    What each call prints is held back and printed with its result (see
+    OrderedOutput), so output from calls in flight never interleaves.
+    """
+    if concurrency <= 1:
+        for item in items:
+            yield func(item)
+        return
+    
+    window = concurrency * 2
+    pending = deque()
+    output = OrderedOutput(sys.stdout)
+    call = output.capture(func)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for item in items:
+                pending.append(executor.submit(call, item))
+                if len(pending) >= window:
+                    yield output.release(pending.popleft())
+            while pending:
+                yield output.release(pending.popleft())
+    finally:
+        sys.stdout = output.stream
+
+
+def enrich_csv(input_file: str, output_file: str, secrets_file: str, delay: float = 0.0,
+               concurrency: int = 1, cache_path: Optional[str] = str(DEFAULT_CACHE_PATH),
+               resume: bool = False, infer_patterns: bool = True, bulk: bool = False,
+               bulk_size: int = DEFAULT_BULK_SIZE, metrics_path: Optional[str] = None,
+               adaptive: bool = False, explore: float = DEFAULT_EXPLORE,
+               finder_stats_path: Optional[str] = str(DEFAULT_STATS_PATH), race: int = 0,
+               race_precedence: str = "order", mx_screen: bool = True,
+               exclude: Optional[List[str]] = None):
+    """
+    Enrich contacts from CSV file.
+    
+    Rows are written and flushed as they complete, with progress checkpointed
+    in .sessions/. With resume=True, rows finished by an interrupted run are
+    skipped. Pass cache_path=None to disable the result cache, and
+    infer_patterns=False to always run the finders. With bulk=True, emails
+    are verified through the providers' bulk APIs, bulk_size rows at a time.
+    Per-provider metrics are appended to metrics_path (default: next to the
+    output, <output>_metrics.jsonl). With adaptive=True the finders are
+    ordered per contact from this run's metrics and the stats saved in
+    finder_stats_path, trying a random order for an explore fraction of
+    contacts. With race > 1 the first race finders in the order are called
+    in parallel, the winner picked by race_precedence ("order" or "arrival").
+    With mx_screen (and dnspython installed), every domain's MX is resolved
+    up front and contacts at domains that can't receive mail skip the
+    finders. Rows whose domain or email domain is on one of the exclusion
+    lists in exclude (CSV files or directories) are dropped from the output.
+    """
+    
+    # Load API keys
+    keys = load_env_file(secrets_file)
+    cache = ResultCache.from_keys(cache_path, keys) if cache_path else None
+    # Every contact in flight can have `race` finder calls outstanding
+    workers = race * max(concurrency, 1) if race > 1 else concurrency
+    sessions = ProviderSessions.from_keys(keys, pool_size=workers)
+    metrics = Metrics.from_keys(keys)
+    finder_order = None
+    if adaptive:
+        # Icypeas is optional; without a key it never answers, so leave it out of the ranking
+        finders = [p for p in FINDERS if p != "icypeas" or keys.get("ICYPEAS_API_KEY", "").strip()]
+        finder_order = AdaptiveFinderOrder(metrics, finders, explore=explore, stats_path=finder_stats_path)
+    race_pool = ThreadPoolExecutor(max_workers=workers) if race > 1 else None
+    screen = MXScreen.from_keys(keys, cache) if mx_screen else None
+    exclusions = ExclusionIndex.load(exclude) if exclude else None
+    enricher = WaterfallEnricher(keys, cache=cache, sessions=sessions, infer_patterns=infer_patterns,
+                                 metrics=metrics, finder_order=finder_order, race=race,
+                                 race_precedence=race_precedence, race_pool=race_pool, mx_screen=screen)
+    
+    # Stream the input CSV: rows are read, enriched and written one at a time,
+    # so memory stays flat however long the list is
+    total = count_csv_rows(input_file)
+    with open(input_file, 'r', encoding='utf-8', newline='') as f_in:
+        fieldnames, _ = read_csv_rows(f_in)
+    
+    print(f"\n📂 Streaming {total} contacts from {input_file}")
+    
+    # Detect column names
+    cols = detect_columns(fieldnames)
+    
+    print(f"   Detected columns: name={cols['name']}, domain={cols['domain']}, company={cols['company']}, email={cols['email']}")
+    if concurrency > 1:
+        print(f"   Concurrency: {concurrency} contacts in flight")
+    if finder_order:
+        print(f"   Adaptive finder order: {' → '.join(finder_order.ranking())} (explore {explore:.0%})")
+    if enricher.race:
+        print(f"   Race mode: {enricher.race} finders at once, winner by {race_precedence}")
+    
+    def process(item):
+        i, contact = item
+        print(f"\n[{i}/{total}]")
+        enriched_row = enrich_row(enricher, contact, cols, layout, shared)
+        # Provider rate limits are enforced per request; delay is an optional extra pause
+        if delay and i < total:
             time.sleep(delay)
+        return enriched_row
     
     # Determine output columns
-    output_fieldnames = list(fieldnames) if fieldnames else []
-    for col in ['First Name', 'Company Name Clean', 'Valid Email', 'Email Host', 'Email Source', 'Email Quality']:
-        if col not in output_fieldnames:
-            output_fieldnames.append(col)
+    layout = OutputLayout(fieldnames)
+    valid_position = layout.positions[OUTPUT_COLUMNS.index('Valid Email')]
+    
+    # Open output (resuming from the last checkpoint if asked)
+    checkpoint = Checkpoint(input_file, "waterfall")
+    out, resumed = open_output(output_file, checkpoint, resume)
+    writer = csv.writer(out)
+    if resumed:
+        print(f"   ↻ Resuming after row {checkpoint.rows_completed} ({checkpoint.path})")
+    else:
+        writer.writerow(layout.fieldnames)
+        out.flush()
+        checkpoint.commit(0, out.tell())
+    
+    # Duplicate contacts (same name, domain and email) run once; copies reuse the result
+    duplicates, domains, excluded = scan_contacts(input_file, cols, skip=checkpoint.rows_completed,
+                                                  exclusions=exclusions)
+    if exclusions:
+        total -= excluded
+        print(f"   Excluded: {excluded} rows ({len(exclusions)} domains in exclusion lists)")
+    shared = SharedResults(duplicates)
+    if duplicates:
+        print(f"   Duplicates: {sum(duplicates.values()) - len(duplicates)} rows repeat an earlier contact")
     
-    # Write output CSV
-    with open(output_file, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=output_fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(results)
+    # Step 0 for every domain at once
+    if screen:
+        print(f"   MX pre-screen: resolving {len(domains)} domains...")
+        screen.prefetch(domains)
+        print(f"   MX pre-screen: {screen.summary_line()}")
+    
+    # Enrich contacts (results come back in input order) and write each row as it completes
+    done = checkpoint.rows_completed
+    processed = 0
+    valid_count = 0
+    try:
+        with open(input_file, 'r', encoding='utf-8', newline='') as f_in:
+            _, reader = read_csv_rows(f_in)
+            remaining = itertools.islice(iter_included(reader, cols, exclusions), done, None)
+            if bulk:
+                verifier = BulkVerifier(keys, sessions, enricher.rate_limiters, metrics=enricher.metrics)
+                rows = iter_bulk_rows(enricher, verifier, remaining, cols, layout, concurrency, bulk_size, shared)
+            else:
+                rows = run_ordered(process, enumerate(remaining, done + 1), concurrency)
+            for enriched_row in rows:
+                writer.writerow(enriched_row)
+                out.flush()
+                done += 1
+                processed += 1
+                if enriched_row[valid_position]:
+                    valid_count += 1
+                if done % CHECKPOINT_EVERY == 0:
+                    checkpoint.commit(done, out.tell())
+    finally:
+        checkpoint.commit(done, out.tell())
+        out.close()
+        if race_pool:
+            race_pool.shutdown()  # let race losers finish before the cache and sessions close
+        sessions.close()
+        if finder_order:
+            finder_order.save()
+    checkpoint.finish()
     
     # Summary
-    valid_count = sum(1 for r in results if r.get('Valid Email'))
     print(f"\n{'='*50}")
     print(f"📊 SUMMARY")
     print(f"{'='*50}")
-    print(f"Total contacts: {len(results)}")
+    print(f"Total contacts: {processed}" + (f" (resumed after {done - processed})" if resumed else ""))
     print(f"Valid emails found: {valid_count}")
-    print(f"Success rate: {valid_count/len(results)*100:.1f}%")
+    if processed:
+        print(f"Success rate: {valid_count/processed*100:.1f}%")
+    if shared.reused:
+        print(f"Duplicate rows (no API calls): {shared.reused}")
+    if excluded:
+        print(f"Excluded rows (dropped): {excluded}")
+    if screen:
+        print(f"MX pre-screen: {screen.summary_line()}")
+    if enricher.esp.sources:
+        print(f"ESP: {enricher.esp.summary_line()}")
+    print(f"Providers:")
+    for line in enricher.metrics.summary_lines():
+        print(f"  {line}")
+    if finder_order:
+        print(f"Adaptive finders ({finder_order.stats_path}):")
+        for line in finder_order.summary_lines():
+            print(f"  {line}")
+    if cache:
+        print(f"Cache ({cache.path}):")
+        for line in cache.summary_lines():
+            print(f"  {line}")
+        cache.close()
+    metrics_path = metrics_path or os.path.splitext(output_file)[0] + "_metrics.jsonl"
+    enricher.metrics.write(metrics_path, run=os.path.basename(input_file), rows=processed)
+    print(f"Metrics saved to: {metrics_path}")
     print(f"Output saved to: {output_file}")
 
 
@@ -392,11 +1163,46 @@ def main():
     parser = argparse.ArgumentParser(description="BuzzLead Email Waterfall Enrichment")
     parser.add_argument("input", help="Input CSV file with contacts")
     parser.add_argument("-o", "--output", help="Output CSV file (default: input_enriched.csv)")
-    parser.add_argument("-d", "--delay", type=float, default=0.5, help="Delay between contacts in seconds")
+    parser.add_argument("-d", "--delay", type=float, default=0.0,
+                        help="Extra delay between contacts in seconds (provider rate limits apply regardless)")
+    parser.add_argument("-c", "--concurrency", type=int, default=1,
+                        help="Number of contacts to run through the waterfall at once")
     parser.add_argument("-s", "--secrets", default="~/.clawdbot/secrets/buzzlead-api-keys.env",
                         help="Path to secrets/env file with API keys")
+    parser.add_argument("--cache", default=str(DEFAULT_CACHE_PATH),
+                        help="Path to the provider result cache (SQLite)")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the provider result cache")
+    parser.add_argument("--no-patterns", action="store_true",
+                        help="Don't guess emails from address formats learned on the same domain")
+    parser.add_argument("--bulk", action="store_true",
+                        help="Verify emails through the Million Verifier / BounceBan bulk APIs")
+    parser.add_argument("--bulk-size", type=int, default=DEFAULT_BULK_SIZE,
+                        help="Contacts per bulk verification job")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted run, skipping rows already written")
+    parser.add_argument("--metrics",
+                        help="Per-provider metrics file: JSON lines, or Prometheus text if it ends in .prom "
+                             "(default: <output>_metrics.jsonl)")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="Order the email finders per contact by observed hit rate, latency and cost")
+    parser.add_argument("--explore", type=float, default=DEFAULT_EXPLORE,
+                        help="With --adaptive, fraction of contacts that try the finders in a random order")
+    parser.add_argument("--finder-stats", default=str(DEFAULT_STATS_PATH),
+                        help="With --adaptive, finder stats carried over between runs (e.g. one file per vertical)")
+    
+    parser.add_argument("--no-mx-screen", action="store_true",
+                        help="Don't skip domains without a mail server (MX pre-screen needs dnspython)")
+    parser.add_argument("--race", type=int, default=0, metavar="N",
+                        help="Call the first N finders in parallel per contact (more credits, lower latency)")
+    parser.add_argument("--race-precedence", choices=RACE_PRECEDENCES, default="order",
+                        help="Race winner: first finder in the order with an email, or first email to arrive")
+    parser.add_argument("--exclude", action="append", nargs="?", const=str(EXCLUSION_LISTS_DIR),
+                        help="Drop contacts on an exclusion list: a CSV file or a directory of them "
+                             "(repeatable; bare --exclude uses exclusion-lists/)")
     
     args = parser.parse_args()
+    if not 0.0 <= args.explore <= 1.0:
+        parser.error("--explore must be between 0 and 1")
     
     output = args.output or args.input.replace(".csv", "_waterfall.csv")
     secrets = os.path.expanduser(args.secrets)
@@ -409,7 +1215,12 @@ def main():
         print(f"   MILLIONVERIFIER_API_KEY=xxx")
         sys.exit(1)
     
-    enrich_csv(args.input, output, secrets, delay=args.delay)
+    enrich_csv(args.input, output, secrets, delay=args.delay, concurrency=args.concurrency,
+               cache_path=None if args.no_cache else args.cache, resume=args.resume,
+               infer_patterns=not args.no_patterns, bulk=args.bulk, bulk_size=args.bulk_size,
+               metrics_path=args.metrics, adaptive=args.adaptive, explore=args.explore,
+               finder_stats_path=args.finder_stats, race=args.race, race_precedence=args.race_precedence,
+               mx_screen=not args.no_mx_screen, exclude=args.exclude)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,301 @@
+"""
+QA report for a lookalike discovery batch.
+Holds the batch column by column and computes the industry breakdown, target-industry match and
+similarity / score / employee distributions in whole-column passes, plus the full review CSV.
+"""
+
+import csv
+import json
+import math
+import re
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# STEP 5: warn when fewer companies than this are in a target industry
+TARGET_MATCH_WARNING = 0.8
+
+# STEP 6a review CSV
+REVIEW_FIELDNAMES = ['#', 'Domain', 'Name', 'Similarity', 'Primary Industry', 'All Industries', 'Location', 'Description']
+REVIEW_DESCRIPTION_CHARS = 300
+
+EMPLOYEES_RE = re.compile(r"\d+")
+
+
+def _number(value) -> float:
+    """Float for a numeric cell, NaN when blank or not a number."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _industries(value) -> Tuple[str, ...]:
+    """industry_groups ({name: weight}, highest first), a list, or a comma-separated cell; uppercased."""
+    if isinstance(value, dict):
+        names = sorted(value, key=value.get, reverse=True)
+    elif isinstance(value, (list, tuple)):
+        names = [str(v) for v in value if v]
+    else:
+        names = (value or "").split(",")
+    return tuple(name.strip().upper() for name in names if name.strip())
+
+
+class BatchColumns:
+    """
+    A discovery batch stored as columns: numeric columns in float arrays
+    (NaN for missing), text columns in lists. Rows are appended once at
+    load time; every statistic is then a pass over one or two columns.
+    Industry names are uppercased, as DiscoLike returns them.
+    """
+
+    def __init__(self):
+        self.domain: List[str] = []
+        self.name: List[str] = []
+        self.similarity = array('d')
+        self.score = array('d')
+        self.employees: List[str] = []
+        self.primary_industry: List[str] = []
+        self.industries: List[Tuple[str, ...]] = []
+        self.location: List[str] = []
+        self.description: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.domain)
+
+    def append(self, row: Dict):
+        """Add one company: a lookalike/review CSV row (keys lowercased) or a raw /discover record."""
+        address = row.get('address') or {}
+        industries = _industries(row.get('industry_groups') or row.get('all_industries') or row.get('industries'))
+        primary = (row.get('primary_industry') or "").strip().upper() or (industries[0] if industries else "")
+        location = row.get('location') or ", ".join(
+            part for part in (row.get('city') or address.get('city'), row.get('state') or address.get('state')) if part
+        )
+
+        self.domain.append(row.get('domain') or "")
+        self.name.append(row.get('name') or row.get('company_name') or "")
+        self.similarity.append(_number(row.get('similarity')))
+        self.score.append(_number(row.get('score')))
+        self.employees.append(str(row.get('employees') or ""))
+        self.primary_industry.append(primary)
+        self.industries.append(industries or ((primary,) if primary else ()))
+        self.location.append(location)
+        self.description.append(row.get('description') or "")
+
+    @classmethod
+    def load(cls, path: str) -> "BatchColumns":
+        """
+        Load a lookalike CSV, a review CSV, or raw /discover JSON (the
+        response body or its results list, e.g. /tmp/discolike_batch.json).
+        """
+        columns = cls()
+        with open(path, 'r', encoding='utf-8') as f:
+            if path.endswith(".json"):
+                data = json.load(f)
+                records = data if isinstance(data, list) else data.get('results', data.get('data', []))
+            else:
+                records = (
+                    {(key or "").strip().lower().replace(" ", "_"): value for key, value in row.items()}
+                    for row in csv.DictReader(f)
+                )
+            for record in records:
+                columns.append(record)
+        return columns
+
+
+def distribution(values: array) -> Dict[str, float]:
+    """count, min, p25, median, p75, max and mean of a numeric column (NaN skipped)."""
+    present = sorted(v for v in values if v == v)
+    if not present:
+        return {"count": 0}
+
+    def quantile(q: float) -> float:
+        position = (len(present) - 1) * q
+        low = int(position)
+        high = min(low + 1, len(present) - 1)
+        return present[low] + (present[high] - present[low]) * (position - low)
+
+    return {
+        "count": len(present),
+        "min": present[0],
+        "p25": quantile(0.25),
+        "median": quantile(0.5),
+        "p75": quantile(0.75),
+        "max": present[-1],
+        "mean": math.fsum(present) / len(present),
+    }
+
+
+def employee_breakdown(employees: Iterable[str]) -> List[Tuple[str, int]]:
+    """Companies per employee range ("11-50"), smallest range first, blanks last as "unknown"."""
+    counts = Counter(e.strip() or "unknown" for e in employees)
+
+    def lower_bound(item):
+        numbers = EMPLOYEES_RE.findall(item[0].replace(",", ""))
+        return (0, int(numbers[0])) if numbers else (1, 0)
+
+    return sorted(counts.items(), key=lower_bound)
+
+
+@dataclass
+class BatchReport:
+    """STEP 5 numbers for one batch."""
+    total: int
+    targets: List[str]
+    industries: List[Tuple[str, int]]  # primary industry → companies, most common first
+    target_match: float  # share with a target primary industry
+    any_target_match: float  # share with a target industry anywhere in their industries
+    similarity: Dict[str, float] = field(default_factory=dict)
+    score: Dict[str, float] = field(default_factory=dict)
+    employees: List[Tuple[str, int]] = field(default_factory=list)
+
+    @property
+    def warning(self) -> bool:
+        return self.total > 0 and self.target_match < TARGET_MATCH_WARNING
+
+
+def build_report(columns: BatchColumns, targets: Optional[Iterable[str]] = None) -> BatchReport:
+    """
+    Compute the batch report. targets are the seed's industries; by default
+    the most common primary industry.
+    """
+    total = len(columns)
+    industries = Counter(industry or "UNKNOWN" for industry in columns.primary_industry).most_common()
+    targets = [t.strip().upper() for t in targets or [] if t.strip()]
+    if not targets and industries:
+        targets = [industries[0][0]]
+    wanted = set(targets)
+    primary_hits = sum(map(wanted.__contains__, columns.primary_industry))
+    any_hits = sum(1 for industries_ in columns.industries if not wanted.isdisjoint(industries_))
+    return BatchReport(
+        total=total,
+        targets=targets,
+        industries=industries,
+        target_match=primary_hits / total if total else 0.0,
+        any_target_match=any_hits / total if total else 0.0,
+        similarity=distribution(columns.similarity),
+        score=distribution(columns.score),
+        employees=employee_breakdown(columns.employees),
+    )
+
+
+def _format_distribution(stats: Dict[str, float]) -> str:
+    if not stats.get("count"):
+        return "-"
+    return ("{min:.0f}-{max:.0f} (median {median:.0f}, p25 {p25:.0f}, p75 {p75:.0f}, mean {mean:.1f})"
+            .format(**stats))
+
+
+def summary_lines(report: BatchReport) -> List[str]:
+    """The STEP 5 industry table and the batch distributions, ready to print."""
+    targets = set(report.targets)
+    lines = [
+        "📊 INDUSTRY BREAKDOWN:",
+        "| Industry | Count | % | Notes |",
+        "|----------|-------|---|-------|",
+    ]
+    for industry, count in report.industries:
+        note = "✓ Target" if industry in targets else "⚠️ Review"
+        lines.append(f"| {industry} | {count} | {count / report.total:.0%} | {note} |")
+    lines.append("")
+    lines.append(f"🎯 Target industry match: {report.target_match:.0%} primary, "
+                 f"{report.any_target_match:.0%} any industry ({', '.join(report.targets) or '-'})")
+    if report.warning:
+        lines.append(f"⚠️  Target match below {TARGET_MATCH_WARNING:.0%} - review filters before the next batch")
+    lines.append(f"📈 Similarity: {_format_distribution(report.similarity)}")
+    lines.append(f"📈 Score: {_format_distribution(report.score)}")
+    lines.append("👥 Employees: " + (", ".join(f"{size} {count}" for size, count in report.employees) or "-"))
+    return lines
+
+
+def write_review_csv(columns: BatchColumns, path: str) -> str:
+    """Write the STEP 6a full review CSV (one numbered row per company)."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(REVIEW_FIELDNAMES)
+        writer.writerows(zip(
+            range(1, len(columns) + 1),
+            columns.domain,
+            columns.name,
+            ("" if s != s else s for s in columns.similarity),
+            columns.primary_industry,
+            (", ".join(industries) for industries in columns.industries),
+            columns.location,
+            (description[:REVIEW_DESCRIPTION_CHARS] for description in columns.description),
+        ))
+    return path
+
+
+# === TESTS ===
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    records = [
+        {"domain": "a.com", "name": "A", "similarity": 90, "score": 300, "employees": "11-50",
+         "address": {"city": "Austin", "state": "TX"}, "industry_groups": {"RETAIL": 0.2, "APPAREL": 0.7},
+         "description": "x" * 400},
+        {"domain": "b.com", "name": "B", "similarity": 80, "score": 100, "employees": "1-10",
+         "address": {"city": "Cary", "state": "NC"}, "industry_groups": {"RETAIL": 0.9}},
+        {"domain": "c.com", "name": "C", "similarity": 70, "employees": "11-50",
+         "address": {}, "industry_groups": {"SPORTS": 0.8, "APPAREL": 0.3}},
+        {"domain": "d.com", "name": "D", "similarity": 60, "score": 200, "employees": "",
+         "industry_groups": {"APPAREL": 0.5}},
+    ]
+    columns = BatchColumns()
+    for record in records:
+        columns.append(record)
+    assert columns.primary_industry == ["APPAREL", "RETAIL", "SPORTS", "APPAREL"]
+    assert columns.location[:3] == ["Austin, TX", "Cary, NC", ""]
+
+    report = build_report(columns, ["apparel"])
+    assert report.industries == [("APPAREL", 2), ("RETAIL", 1), ("SPORTS", 1)]
+    assert report.target_match == 0.5 and report.any_target_match == 0.75 and report.warning
+    assert report.similarity["median"] == 75 and report.similarity["min"] == 60
+    assert report.score["count"] == 3 and report.score["mean"] == 200
+    assert report.employees == [("1-10", 1), ("11-50", 2), ("unknown", 1)]
+    assert build_report(columns).targets == ["APPAREL"]
+    assert not build_report(BatchColumns()).warning
+    print("\n".join(summary_lines(report)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        review = write_review_csv(columns, os.path.join(tmp, "review.csv"))
+        with open(review, encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == REVIEW_FIELDNAMES
+        assert rows[1][:7] == ["1", "a.com", "A", "90.0", "APPAREL", "APPAREL, RETAIL", "Austin, TX"]
+        assert len(rows[1][7]) == REVIEW_DESCRIPTION_CHARS
+
+        # Review CSVs load back (column names matched loosely)
+        reloaded = BatchColumns.load(review)
+        assert reloaded.industries[2] == ("SPORTS", "APPAREL") and reloaded.location[1] == "Cary, NC"
+
+        # Industries match targets whatever their case
+        mixed = os.path.join(tmp, "mixed.csv")
+        with open(mixed, "w", newline="", encoding="utf-8") as f:
+            f.write("domain,primary_industry,all_industries\n"
+                    "e.com,Apparel,\"Apparel, retail\"\n"
+                    "f.com, apparel ,Apparel\n"
+                    "g.com,,sports\n")
+        mixed = BatchColumns.load(mixed)
+        assert mixed.primary_industry == ["APPAREL", "APPAREL", "SPORTS"]
+        assert mixed.industries[0] == ("APPAREL", "RETAIL")
+        report = build_report(mixed, ["apparel", " Sports"])
+        assert report.target_match == 1.0 and not report.warning
+        assert build_report(mixed, ["retail"]).any_target_match == 1 / 3
+
+        # 10k-company batch
+        big = os.path.join(tmp, "big.json")
+        with open(big, "w") as f:
+            json.dump({"results": records * 2500}, f)
+        start = time.perf_counter()
+        columns = BatchColumns.load(big)
+        report = build_report(columns, ["APPAREL", "RETAIL"])
+        write_review_csv(columns, os.path.join(tmp, "big_review.csv"))
+        assert report.total == 10000 and report.target_match == 0.75
+        print(f"10k companies: loaded, reported and written in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    print("batch_report: all tests passed")
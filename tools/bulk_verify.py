@@ -0,0 +1,179 @@
+"""
+Bulk email verification for BuzzLead waterfall enrichment.
+Submits many emails at once to the Million Verifier / BounceBan bulk APIs, polls until the
+job finishes, and returns per-email results.
+"""
+
+import csv
+import io
+import time
+from typing import Dict, Iterable, List, Mapping, Optional
+
+import requests
+
+from http_client import ProviderSessions, base_url
+from metrics import Metrics
+from rate_limiter import RateLimiter
+
+
+# Million Verifier runs its bulk API on a separate host
+MILLIONVERIFIER_BULK_BASE_URL = "https://bulkapi.millionverifier.com"
+
+DEFAULT_POLL_INTERVAL = 5.0
+DEFAULT_MAX_WAIT = 30 * 60
+
+
+class BulkVerifier:
+    """
+    Client for the providers' list-verification endpoints.
+
+    Each method returns {email: result} for the emails the provider
+    finished. Emails missing from the result (job failed, timed out, or
+    the provider skipped them) should fall back to single verification.
+    """
+
+    def __init__(self, keys: Mapping[str, str], sessions: ProviderSessions,
+                 rate_limiters: Mapping[str, RateLimiter], metrics: Optional[Metrics] = None,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL, max_wait: float = DEFAULT_MAX_WAIT):
+        self.millionverifier_key = keys.get("MILLIONVERIFIER_API_KEY", "").strip()
+        self.bounceban_key = keys.get("BOUNCEBAN_API_KEY", "").strip()
+        self.millionverifier_url = (
+            keys.get("MILLIONVERIFIER_BULK_BASE_URL") or MILLIONVERIFIER_BULK_BASE_URL
+        ).rstrip("/")
+        self.bounceban_url = base_url("bounceban", keys)
+        self.sessions = sessions
+        self.rate_limiters = rate_limiters
+        self.metrics = metrics or Metrics()
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+
+    def _request(self, provider: str, method: str, url: str, **kwargs) -> Optional[requests.Response]:
+        """Rate-limited request, recorded in the metrics as <provider>_bulk."""
+        throttled = self.rate_limiters[provider].acquire()
+        start = time.perf_counter()
+        status, timed_out = None, False
+        try:
+            response = self.sessions.request(provider, method, url, **kwargs)
+            status = response.status_code
+            response.raise_for_status()
+            return response
+        except requests.exceptions.RequestException as e:
+            timed_out = isinstance(e, requests.exceptions.Timeout)
+            print(f"    Bulk API error: {e}")
+            return None
+        finally:
+            self.metrics.record_call(f"{provider}_bulk", time.perf_counter() - start, status,
+                                     timed_out=timed_out, throttled=throttled)
+
+    def _record_results(self, provider: str, submitted: int, results: Dict[str, str]):
+        """Charge credits for the submitted emails and record each answer."""
+        self.metrics.add_credits(f"{provider}_bulk", submitted)
+        for value in results.values():
+            self.metrics.record_outcome(f"{provider}_bulk", value)
+
+    def _poll(self, provider: str, url: str, is_done, **kwargs) -> bool:
+        """Poll a status endpoint until is_done(json) or max_wait elapses."""
+        deadline = time.monotonic() + self.max_wait
+        while time.monotonic() < deadline:
+            response = self._request(provider, "GET", url, **kwargs)
+            if response is None:
+                return False
+            status = response.json()
+            if is_done(status):
+                return True
+            if str(status.get("status", "")).lower() in ("error", "failed", "canceled"):
+                print(f"    Bulk job failed: {status}")
+                return False
+            time.sleep(self.poll_interval)
+        print(f"    Bulk job still running after {self.max_wait:.0f}s - falling back to single checks")
+        return False
+
+    # ========== MILLION VERIFIER ==========
+
+    def millionverifier(self, emails: Iterable[str]) -> Dict[str, str]:
+        """Bulk quality check. Returns {email (lowercased): quality}."""
+        emails = _unique(emails)
+        if not emails or not self.millionverifier_key:
+            return {}
+        print(f"  → Million Verifier bulk: {len(emails)} emails...")
+
+        upload = self._request(
+            "millionverifier", "POST", f"{self.millionverifier_url}/bulkapi/v2/upload",
+            params={"key": self.millionverifier_key},
+            files={"file_contents": ("emails.csv", "\n".join(emails), "text/csv")},
+        )
+        file_id = upload.json().get("file_id") if upload is not None else None
+        if not file_id:
+            return {}
+
+        params = {"key": self.millionverifier_key, "file_id": file_id}
+        finished = self._poll(
+            "millionverifier", f"{self.millionverifier_url}/bulkapi/v2/fileinfo",
+            lambda status: str(status.get("status", "")).lower() == "finished",
+            params=params,
+        )
+        if not finished:
+            return {}
+
+        download = self._request(
+            "millionverifier", "GET", f"{self.millionverifier_url}/bulkapi/v2/download",
+            params=dict(params, filter="all"),
+        )
+        if download is None:
+            return {}
+
+        results = {}
+        for row in csv.DictReader(io.StringIO(download.text)):
+            row = {k.strip().lower(): (v or "").strip() for k, v in row.items() if k}
+            if row.get("email"):
+                results[row["email"].lower()] = row.get("quality") or "unknown"
+        self._record_results("millionverifier", len(emails), results)
+        print(f"    Verified: {len(results)}/{len(emails)}")
+        return results
+
+    # ========== BOUNCEBAN ==========
+
+    def bounceban(self, emails: Iterable[str]) -> Dict[str, str]:
+        """Bulk deliverability check. Returns {email (lowercased): result}."""
+        emails = _unique(emails)
+        if not emails or not self.bounceban_key:
+            return {}
+        print(f"  → BounceBan bulk: {len(emails)} emails...")
+
+        headers = {"Authorization": self.bounceban_key}
+        submit = self._request(
+            "bounceban", "POST", f"{self.bounceban_url}/v1/verify/bulk",
+            json={"emails": emails}, headers=headers,
+        )
+        task_id = submit.json().get("id") if submit is not None else None
+        if not task_id:
+            return {}
+
+        finished = self._poll(
+            "bounceban", f"{self.bounceban_url}/v1/verify/bulk/status",
+            lambda status: str(status.get("status", "")).lower() == "finished",
+            params={"id": task_id}, headers=headers,
+        )
+        if not finished:
+            return {}
+
+        dump = self._request(
+            "bounceban", "GET", f"{self.bounceban_url}/v1/verify/bulk/dump",
+            params={"id": task_id, "retrieve_all": 1}, headers=headers,
+        )
+        if dump is None:
+            return {}
+
+        results = {
+            item["email"].lower(): item.get("result", "unknown")
+            for item in dump.json().get("items", [])
+            if item.get("email")
+        }
+        self._record_results("bounceban", len(emails), results)
+        print(f"    Verified: {len(results)}/{len(emails)}")
+        return results
+
+
+def _unique(emails: Iterable[str]) -> List[str]:
+    """Lowercased, de-duplicated, non-empty emails in first-seen order."""
+    return list(dict.fromkeys(e.strip().lower() for e in emails if e and e.strip()))
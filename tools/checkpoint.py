@@ -0,0 +1,102 @@
+"""
+Checkpoint/resume support for long BuzzLead enrichment runs.
+Progress is recorded in .sessions/<input>_<kind>_checkpoint.json, next to the skill session files.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+
+SESSIONS_DIR = Path(__file__).parent.parent / ".sessions"
+
+# Rows between checkpoint writes. Output rows are flushed as they are written;
+# on resume the output is truncated back to the last checkpointed row.
+CHECKPOINT_EVERY = 10
+
+
+class Checkpoint:
+    """
+    Progress of one run over an input CSV.
+
+    Tracks how many input rows are fully processed and how many bytes of
+    the output file belong to them. Anything written after the last commit
+    (a crash mid-batch) is cut off on resume, so no row is duplicated.
+    """
+
+    def __init__(self, input_file: str, kind: str, sessions_dir: Path = SESSIONS_DIR):
+        self.input_file = input_file
+        self.kind = kind
+        self.path = Path(sessions_dir) / f"{Path(input_file).stem}_{kind}_checkpoint.json"
+        self.state = {}
+
+    def load(self) -> Optional[dict]:
+        """Return the saved state if there is an unfinished run for this input."""
+        if not self.path.exists():
+            return None
+        with open(self.path, encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("input_file") != self.input_file or state.get("status") != "in_progress":
+            return None
+        self.state = state
+        return state
+
+    def start(self, output_file: str):
+        """Begin a fresh run."""
+        now = datetime.now().isoformat()
+        self.state = {
+            "session_id": self.path.stem,
+            "status": "in_progress",
+            "created": now,
+            "last_updated": now,
+            "input_file": self.input_file,
+            "output_file": output_file,
+            "rows_completed": 0,
+            "output_bytes": 0,
+        }
+        self._save()
+
+    @property
+    def rows_completed(self) -> int:
+        return self.state.get("rows_completed", 0)
+
+    @property
+    def output_file(self) -> Optional[str]:
+        return self.state.get("output_file")
+
+    def commit(self, rows_completed: int, output_bytes: int):
+        """Record that rows_completed input rows are safely in the first output_bytes of the output."""
+        self.state["rows_completed"] = rows_completed
+        self.state["output_bytes"] = output_bytes
+        self._save()
+
+    def finish(self):
+        self.state["status"] = "complete"
+        self._save()
+
+    def _save(self):
+        self.state["last_updated"] = datetime.now().isoformat()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp, self.path)
+
+
+def open_output(path: str, checkpoint: Checkpoint, resume: bool):
+    """
+    Open the output CSV for a (possibly resumed) run.
+
+    Returns (file, resumed). When resuming, the file is truncated to the
+    last checkpointed byte and positioned for appending; otherwise it is
+    created fresh and the caller writes the header.
+    """
+    if resume and checkpoint.load() and checkpoint.output_file == path and os.path.exists(path):
+        f = open(path, "r+", encoding="utf-8", newline="")
+        f.truncate(checkpoint.state["output_bytes"])
+        f.seek(0, os.SEEK_END)
+        return f, True
+    checkpoint.start(path)
+    return open(path, "w", encoding="utf-8", newline=""), False
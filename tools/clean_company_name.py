@@ -4,7 +4,8 @@ Removes legal suffixes, normalizes formatting, handles edge cases.
 """
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
 
 
 # Comprehensive list of legal suffixes to remove (case-insensitive)
@@ -44,6 +45,208 @@ END_WORDS_TO_STRIP = [
     r"and", r"&", r"the",
 ]
 
+# Words that should stay lowercase (unless first word)
+LOWERCASE_WORDS = frozenset({'and', 'or', 'the', 'a', 'an', 'of', 'for', 'to', 'in', 'on', 'at', 'by'})
+
+# Known acronyms that should stay uppercase
+KNOWN_ACRONYMS = frozenset({'IBM', 'BMW', 'SAP', 'AWS', 'USA', 'UK', 'AI', 'IT', 'HR', 'CEO', 'CFO', 'CTO', 'VP', '3M'})
+
+# Distinct names remembered by the memoization layer
+DEFAULT_CACHE_SIZE = 65536
+
+
+# Characters with a meaning of their own in a regex (a suffix starting with one can't be factored)
+REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def leading_literal(suffix: str) -> Optional[str]:
+    """
+    The token a suffix pattern starts with, if it matches one fixed character.
+    
+    "inc\.?" → "i", "\.com" → "\.". Returns None for a class, group, anchor,
+    escape sequence such as \s, a quantified first character ("\.?co") or
+    a pattern with its own "|".
+    """
+    if not suffix or "|" in suffix:
+        return None
+    if suffix[0] == "\\":
+        token = suffix[:2]
+        if len(token) < 2 or token[1].isalnum():
+            return None
+    elif suffix[0] in REGEX_METACHARS:
+        return None
+    else:
+        token = suffix[0]
+    if suffix[len(token):len(token) + 1] in ("*", "+", "?", "{"):
+        return None
+    return token
+
+
+def build_suffix_alternation(suffixes: List[str]) -> str:
+    """
+    Build one regex alternation for all suffixes, factored by first letter.
+    
+    "inc\.?|corp\.?|co\.?|intl\.?" → "i(?:nc\.?|ntl\.?)|c(?:orp\.?|o\.?)"
+    
+    At any position only the branch for the current letter is tried instead
+    of every suffix. Alternatives starting with different letters can never
+    match at the same spot, and order within a branch is kept, so matches are
+    identical to the flat alternation. Duplicates are dropped.
+    
+    Only a leading literal is factored (see leading_literal). Any other
+    suffix stays a branch of its own, in its original place, and suffixes
+    on either side of it are grouped separately to keep the flat order.
+    """
+    branches: List[str] = []
+    groups: Dict[str, List[str]] = {}
+    
+    def flush():
+        branches.extend(f"{first}(?:{'|'.join(rests)})" for first, rests in groups.items())
+        groups.clear()
+    
+    for suffix in dict.fromkeys(suffixes):
+        literal = leading_literal(suffix)
+        if literal is None:
+            flush()
+            branches.append(f"(?:{suffix})")
+        else:
+            groups.setdefault(literal.lower(), []).append(suffix[len(literal):])
+    flush()
+    return '|'.join(branches)
+
+
+class CompanyNameCleaner:
+    """
+    Company name cleaner with its patterns compiled once.
+    
+    Results are memoized (bounded LRU), so repeated names in a large
+    column are only cleaned once.
+    """
+    
+    def __init__(self, suffixes: List[str] = LEGAL_SUFFIXES, cache_size: int = DEFAULT_CACHE_SIZE):
+        suffix_pattern = build_suffix_alternation(suffixes)
+        
+        self.parenthetical_re = re.compile(r'\s*\([^)]*\)')
+        self.dba_re = re.compile(r'\s+(?:d\.?b\.?a\.?|d/b/a|trading\s+as|t/a)\s+', re.IGNORECASE)
+        self.comma_suffix_re = re.compile(rf'^({suffix_pattern})\.?\s*$', re.IGNORECASE)
+        # Also handle "and company", "& co", etc.
+        self.suffix_re = re.compile(rf'\s*(?:and|&)?\s*\b(?:{suffix_pattern})\.?\b', re.IGNORECASE)
+        self.the_prefix_re = re.compile(r'^the\s+', re.IGNORECASE)
+        self.special_chars_re = re.compile(r'[^\w\s&\-\'.·]', re.UNICODE)
+        self.trailing_junk_re = re.compile(r'[\s&\-,\.]+$')
+        self.whitespace_re = re.compile(r'\s+')
+        self.trailing_dots_re = re.compile(r'\.+$')
+        
+        self.clean = lru_cache(maxsize=cache_size)(self._clean)
+    
+    def __call__(self, raw_name: Optional[str]) -> str:
+        if not raw_name:
+            return ""
+        return self.clean(str(raw_name))
+    
+    def clean_many(self, raw_names: Iterable[Optional[str]]) -> List[str]:
+        """Clean a whole column of names."""
+        clean = self.clean
+        return [clean(str(name)) if name else "" for name in raw_names]
+    
+    def _clean(self, name: str) -> str:
+        name = name.strip()
+        if not name:
+            return ""
+        
+        # === STEP 1: Remove ALL parenthetical content ===
+        # "Acme Corp (formerly XYZ)" → "Acme Corp"
+        # "Acme Inc. (US)" → "Acme Inc."
+        name = self.parenthetical_re.sub('', name)  # Remove all parentheticals
+        
+        # === STEP 2: Handle "DBA" / "d/b/a" / "trading as" ===
+        # Keep the part BEFORE dba (the legal name)
+        dba_match = self.dba_re.split(name)
+        if len(dba_match) > 1:
+            name = dba_match[0].strip()
+        
+        # === STEP 3: Take first part before comma (but be smart about it) ===
+        # "Acme, Inc." → "Acme"
+        # But "Smith, Johnson & Associates" should stay together
+        if ',' in name:
+            parts = name.split(',')
+            # If second part looks like a suffix, just take first part
+            if len(parts) >= 2:
+                second = parts[1].strip().lower()
+                if self.comma_suffix_re.match(second):
+                    name = parts[0].strip()
+        
+        # === STEP 4: Remove legal suffixes ===
+        name = self.suffix_re.sub('', name)
+        
+        # === STEP 5: Remove "The" from beginning ===
+        name = self.the_prefix_re.sub('', name)
+        
+        # === STEP 6: Clean special characters ===
+        # Keep: letters (including accented), numbers, spaces, &, -, ', .
+        # This preserves: "AT&T", "Johnson & Johnson", "Ben & Jerry's"
+        name = self.special_chars_re.sub(' ', name)
+        
+        # === STEP 7: Remove trailing junk ===
+        # Remove trailing &, -, commas, periods
+        name = self.trailing_junk_re.sub('', name)
+        
+        # === STEP 8: Normalize whitespace ===
+        name = self.whitespace_re.sub(' ', name).strip()
+        
+        if not name:
+            return ""
+        
+        # === STEP 9: Clean up any remaining dots at end ===
+        name = self.trailing_dots_re.sub('', name).strip()
+        
+        # === STEP 10: Smart Title Case ===
+        return smart_title_case(name)
+
+
+def smart_title_case(text: str) -> str:
+    """
+    Handle ALL CAPS → Title Case.
+    But preserve intentional caps like "BMW", "IBM", "AT&T"
+    """
+    words = text.split()
+    result = []
+    
+    # Check if entire text is ALL CAPS
+    all_caps_input = text.isupper()
+    
+    for i, word in enumerate(words):
+        upper_word = word.upper()
+        
+        # If it's a known acronym, keep it uppercase
+        if upper_word in KNOWN_ACRONYMS:
+            result.append(upper_word)
+        # Handle & in words like AT&T, H&M
+        elif '&' in word and len(word) <= 5:
+            result.append(word.upper())
+        # If original input was ALL CAPS, convert to title case
+        elif all_caps_input:
+            if word.lower() in LOWERCASE_WORDS and i > 0:
+                result.append(word.lower())
+            else:
+                result.append(word.capitalize())
+        # Mixed case - preserve it (e.g., McDonald's)
+        elif not word.isupper() and not word.islower():
+            result.append(word)
+        # ALL CAPS single word in otherwise mixed text - might be acronym
+        elif word.isupper() and len(word) <= 4:
+            result.append(word)
+        # ALL CAPS longer word - title case it
+        elif word.isupper():
+            result.append(word.capitalize())
+        else:
+            result.append(word.capitalize() if word.islower() else word)
+    
+    return ' '.join(result)
+
+
+_cleaner = CompanyNameCleaner()
+
 
 def clean_company_name(raw_name: Optional[str]) -> str:
     """
@@ -62,110 +265,12 @@ def clean_company_name(raw_name: Optional[str]) -> str:
     Returns:
         Cleaned company name in Title Case, or empty string if invalid
     """
-    if not raw_name:
-        return ""
-    
-    name = str(raw_name).strip()
-    if not name:
-        return ""
-    
-    # === STEP 1: Remove ALL parenthetical content ===
-    # "Acme Corp (formerly XYZ)" → "Acme Corp"
-    # "Acme Inc. (US)" → "Acme Inc."
-    name = re.sub(r'\s*\([^)]*\)', '', name)  # Remove all parentheticals
-    
-    # === STEP 2: Handle "DBA" / "d/b/a" / "trading as" ===
-    # Keep the part BEFORE dba (the legal name)
-    dba_match = re.split(r'\s+(?:d\.?b\.?a\.?|d/b/a|trading\s+as|t/a)\s+', name, flags=re.IGNORECASE)
-    if len(dba_match) > 1:
-        name = dba_match[0].strip()
-    
-    # === STEP 3: Take first part before comma (but be smart about it) ===
-    # "Acme, Inc." → "Acme"
-    # But "Smith, Johnson & Associates" should stay together
-    if ',' in name:
-        parts = name.split(',')
-        # If second part looks like a suffix, just take first part
-        if len(parts) >= 2:
-            second = parts[1].strip().lower()
-            suffix_pattern = '|'.join(LEGAL_SUFFIXES)
-            if re.match(rf'^({suffix_pattern})\.?\s*$', second, re.IGNORECASE):
-                name = parts[0].strip()
-    
-    # === STEP 4: Remove legal suffixes ===
-    suffix_pattern = r'\b(?:' + '|'.join(LEGAL_SUFFIXES) + r')\.?\b'
-    # Also handle "and company", "& co", etc.
-    name = re.sub(rf'\s*(?:and|&)?\s*{suffix_pattern}', '', name, flags=re.IGNORECASE)
-    
-    # === STEP 5: Remove "The" from beginning ===
-    name = re.sub(r'^the\s+', '', name, flags=re.IGNORECASE)
-    
-    # === STEP 6: Clean special characters ===
-    # Keep: letters (including accented), numbers, spaces, &, -, ', .
-    # This preserves: "AT&T", "Johnson & Johnson", "Ben & Jerry's"
-    name = re.sub(r'[^\w\s&\-\'.·]', ' ', name, flags=re.UNICODE)
-    
-    # === STEP 7: Remove trailing junk ===
-    # Remove trailing &, -, commas, periods
-    name = re.sub(r'[\s&\-,\.]+$', '', name)
-    
-    # === STEP 8: Normalize whitespace ===
-    name = re.sub(r'\s+', ' ', name).strip()
-    
-    if not name:
-        return ""
-    
-    # === STEP 9: Clean up any remaining dots at end ===
-    name = re.sub(r'\.+$', '', name).strip()
-    
-    # === STEP 10: Smart Title Case ===
-    # Handle ALL CAPS → Title Case
-    # But preserve intentional caps like "BMW", "IBM", "AT&T"
-    def smart_title_case(text):
-        words = text.split()
-        result = []
-        
-        # Check if entire text is ALL CAPS
-        all_caps_input = text.isupper()
-        
-        # Words that should stay lowercase (unless first word)
-        lowercase_words = {'and', 'or', 'the', 'a', 'an', 'of', 'for', 'to', 'in', 'on', 'at', 'by'}
-        
-        # Known acronyms that should stay uppercase
-        known_acronyms = {'IBM', 'BMW', 'SAP', 'AWS', 'USA', 'UK', 'AI', 'IT', 'HR', 'CEO', 'CFO', 'CTO', 'VP', '3M'}
-        
-        for i, word in enumerate(words):
-            upper_word = word.upper()
-            
-            # If it's a known acronym, keep it uppercase
-            if upper_word in known_acronyms:
-                result.append(upper_word)
-            # Handle & in words like AT&T, H&M
-            elif '&' in word and len(word) <= 5:
-                result.append(word.upper())
-            # If original input was ALL CAPS, convert to title case
-            elif all_caps_input:
-                if word.lower() in lowercase_words and i > 0:
-                    result.append(word.lower())
-                else:
-                    result.append(word.capitalize())
-            # Mixed case - preserve it (e.g., McDonald's)
-            elif not word.isupper() and not word.islower():
-                result.append(word)
-            # ALL CAPS single word in otherwise mixed text - might be acronym
-            elif word.isupper() and len(word) <= 4:
-                result.append(word)
-            # ALL CAPS longer word - title case it
-            elif word.isupper():
-                result.append(word.capitalize())
-            else:
-                result.append(word.capitalize() if word.islower() else word)
-        
-        return ' '.join(result)
-    
-    name = smart_title_case(name)
-    
-    return name
+    return _cleaner(raw_name)
+
+
+def clean_company_names(raw_names: Iterable[Optional[str]]) -> List[str]:
+    """Clean many company names at once (same output as clean_company_name per item)."""
+    return _cleaner.clean_many(raw_names)
 
 
 # === TESTS ===
@@ -246,6 +351,17 @@ if __name__ == "__main__":
     
     print(f"\n{passed}/{len(test_cases)} tests passed")
     
+    # Factoring only on a plain leading character keeps the flat alternation's matches
+    assert build_suffix_alternation([r"inc\.?", r"intl\.?", r"co\.?"]) == r"i(?:nc\.?|ntl\.?)|c(?:o\.?)"
+    tricky = [r"inc\.?", r"\.?co", r"co\.?", r"[.]x", r"\.com", r"\.net", r"\s*ltd", r"i?nc", r"l|m", r"intl"]
+    factored = re.compile(rf"(?:{build_suffix_alternation(tricky)})", re.IGNORECASE)
+    flat = re.compile(rf"(?:{'|'.join(tricky)})", re.IGNORECASE)
+    for text in ["Acme .co", "acme co.", "acme .x", "acme.com", "acme.net", "acme  ltd", "nc", "INTL", "m", "l"]:
+        assert [m.span() for m in factored.finditer(text)] == [m.span() for m in flat.finditer(text)], text
+    
+    batch = clean_company_names(raw for raw, _ in test_cases)
+    assert batch == [clean_company_name(raw) for raw, _ in test_cases]
+    
     if failed:
         print("\nFailed tests:")
         for raw, expected, result in failed:
@@ -4,8 +4,65 @@ Handles edge cases: parentheses, quotes, Dr. prefix, emojis, accented chars, ALL
 """
 
 import re
+import string
 import unicodedata
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
+
+# Compiled once at import instead of on every call
+PAREN_RE = re.compile(r'\(([^)]+)\)')
+QUOTE_CHAR_RE = re.compile(r'["\'""]')
+QUOTED_RE = re.compile(r'["\'""]([^"\'""]+)["\'""]')
+DR_PREFIX_RE = re.compile(r'^\s*(dr\.?|doctor)\s+', re.IGNORECASE)
+WHITESPACE_RE = re.compile(r'\s+')
+INITIAL_RE = re.compile(r'^[A-Za-z]\.?$')
+APOSTROPHE_SPLIT_RE = re.compile(r"(['\'])")
+
+SUFFIXES = frozenset({'jr', 'jr.', 'sr', 'sr.', 'ii', 'iii', 'iv', 'v'})
+
+# Punctuation kept by STEP 4 besides letters and spaces (\u2019 is ')
+KEEP_CHARS = " '-.\u2019"
+
+# STEP 4 fast path for pure-ASCII names: delete every ASCII char that is not
+# a letter or one of KEEP_CHARS in a single str.translate call
+ASCII_DELETE_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if chr(c) not in string.ascii_letters and chr(c) not in KEEP_CHARS
+))
+
+# Distinct raw names remembered by the memoization layer
+DEFAULT_CACHE_SIZE = 65536
+
+
+def _strip_symbols(name: str) -> str:
+    """Keep letters (including accented), spaces, apostrophes, hyphens, periods."""
+    if name.isascii():
+        return name.translate(ASCII_DELETE_TABLE)
+    # L = Letter, Zs = Space separator, also allow specific punctuation
+    return ''.join(
+        char for char in name
+        if char in KEEP_CHARS or unicodedata.category(char)[0] == 'L' or unicodedata.category(char) == 'Zs'
+    )
+
+
+def _title_case_word(word: str) -> str:
+    """Title case one name, keeping hyphenated and apostrophe names right."""
+    # Special handling for hyphenated names: Mary-Jane → Mary-Jane
+    if '-' in word:
+        return '-'.join(part.capitalize() for part in word.split('-'))
+    # Handle apostrophes: O'Brien → O'Brien, not O'brien
+    if "'" in word or "'" in word:
+        parts = APOSTROPHE_SPLIT_RE.split(word)
+        result = ""
+        for i, part in enumerate(parts):
+            if part in ("'", "'"):
+                result += part
+            elif i == 0 or (i > 0 and parts[i-1] in ("'", "'")):
+                result += part.capitalize()
+            else:
+                result += part.lower()
+        return result
+    return word.capitalize()
 
 
 def clean_first_name(raw_name: Optional[str]) -> str:
@@ -22,48 +79,53 @@ def clean_first_name(raw_name: Optional[str]) -> str:
     - Single-letter initials: "J. Robert" → "Robert"
     - Hyphenated names: "Mary-Jane" → "Mary-Jane"
     
+    Results are memoized, so the long tail of repeated first names is
+    only cleaned once.
+    
     Returns:
         Cleaned first name in Title Case, or empty string if invalid
     """
     if not raw_name:
         return ""
-    
-    name = str(raw_name).strip()
+    return _clean_first_name(str(raw_name))
+
+
+def clean_first_names(raw_names: Iterable[Optional[str]]) -> List[str]:
+    """Clean many first names at once (same output as clean_first_name per item)."""
+    return [_clean_first_name(str(name)) if name else "" for name in raw_names]
+
+
+@lru_cache(maxsize=DEFAULT_CACHE_SIZE)
+def _clean_first_name(name: str) -> str:
+    name = name.strip()
     if not name:
         return ""
     
     # === STEP 1: Check for parenthetical preferred name ===
     # "John (Johnny) Smith" → "Johnny"
-    paren_match = re.search(r'\(([^)]+)\)', name)
+    paren_match = PAREN_RE.search(name)
     if paren_match:
         name = paren_match.group(1).strip()
     
     # === STEP 2: Check for quoted preferred name ===
     # "Nick" John or 'Nick' John or "Nick" or "Nick" → Nick
-    elif re.search(r'["\'""]', name):
-        quote_match = re.search(r'["\'""]([^"\'""]+)["\'""]', name)
+    elif QUOTE_CHAR_RE.search(name):
+        quote_match = QUOTED_RE.search(name)
         if quote_match:
             name = quote_match.group(1).strip()
     
     # === STEP 3: Check for Dr./Doctor prefix ===
     dr_prefix = ""
-    dr_match = re.match(r'^\s*(dr\.?|doctor)\s+', name, re.IGNORECASE)
+    dr_match = DR_PREFIX_RE.match(name)
     if dr_match:
         dr_prefix = "Dr. "
         name = name[dr_match.end():].strip()
     
     # === STEP 4: Remove emojis and weird unicode ===
-    # Keep letters (including accented), spaces, apostrophes, hyphens, periods
-    cleaned = ""
-    for char in name:
-        cat = unicodedata.category(char)
-        # L = Letter, Zs = Space separator, also allow specific punctuation
-        if cat.startswith('L') or cat == 'Zs' or char in " '-.\u2019":  # \u2019 is '
-            cleaned += char
-    name = cleaned
+    name = _strip_symbols(name)
     
     # === STEP 5: Normalize whitespace ===
-    name = re.sub(r'\s+', ' ', name).strip()
+    name = WHITESPACE_RE.sub(' ', name).strip()
     
     if not name:
         return ""
@@ -72,11 +134,10 @@ def clean_first_name(raw_name: Optional[str]) -> str:
     words = name.split()
     
     # Filter out single-letter initials (J. or J)
-    real_words = [w for w in words if not re.match(r'^[A-Za-z]\.?$', w)]
+    real_words = [w for w in words if not INITIAL_RE.match(w)]
     
     # Also filter out common suffixes that might appear
-    suffixes = {'jr', 'jr.', 'sr', 'sr.', 'ii', 'iii', 'iv', 'v'}
-    real_words = [w for w in real_words if w.lower() not in suffixes]
+    real_words = [w for w in real_words if w.lower() not in SUFFIXES]
     
     if not real_words:
         # Fall back to first word if all were filtered
@@ -88,25 +149,7 @@ def clean_first_name(raw_name: Optional[str]) -> str:
         return ""
     
     # === STEP 7: Title case (handles ALL CAPS and all lowercase) ===
-    # Special handling for hyphenated names: Mary-Jane → Mary-Jane
-    def title_case_word(word):
-        if '-' in word:
-            return '-'.join(part.capitalize() for part in word.split('-'))
-        # Handle apostrophes: O'Brien → O'Brien, not O'brien
-        if "'" in word or "'" in word:
-            parts = re.split(r"(['\'])", word)
-            result = ""
-            for i, part in enumerate(parts):
-                if part in ("'", "'"):
-                    result += part
-                elif i == 0 or (i > 0 and parts[i-1] in ("'", "'")):
-                    result += part.capitalize()
-                else:
-                    result += part.lower()
-            return result
-        return word.capitalize()
-    
-    first_name = title_case_word(first_name)
+    first_name = _title_case_word(first_name)
     
     # === STEP 8: Add back Dr. prefix if present ===
     return dr_prefix + first_name
@@ -156,6 +199,10 @@ if __name__ == "__main__":
     
     print(f"\n{passed}/{len(test_cases)} tests passed")
     
+    batch = clean_first_names(raw for raw, _ in test_cases)
+    batch_ok = batch == [clean_first_name(raw) for raw, _ in test_cases]
+    print(f"clean_first_names() batch matches single calls: {batch_ok}")
+    
     if failed:
         print("\nFailed tests:")
         for raw, expected, result in failed:
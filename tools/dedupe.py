@@ -0,0 +1,101 @@
+"""
+Duplicate-row handling for BuzzLead enrichment runs.
+A pre-pass counts each normalized key (domain, or name + domain + email); during the run each
+duplicated key is looked up once and its result handed to every row that shares it.
+"""
+
+import threading
+from collections import Counter
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Iterable, Mapping, Tuple
+
+from domains import normalize_domain
+
+
+def contact_key(full_name: str, domain: str, email: str = "") -> Tuple[str, str, str]:
+    """Key under which two contact rows get the same waterfall result."""
+    return (" ".join((full_name or "").split()).casefold(), normalize_domain(domain),
+            (email or "").strip().lower())
+
+
+def count_keys(keys: Iterable[Hashable]) -> Dict[Hashable, int]:
+    """Occurrences of every key seen more than once (unique keys are dropped to save memory)."""
+    return {key: count for key, count in Counter(keys).items() if count > 1}
+
+
+class SharedResults:
+    """
+    Compute each duplicated key once; every occurrence gets the same result.
+
+    counts comes from a pre-pass over the rows still to be processed
+    (count_keys). Keys not in it are computed directly. A duplicated key is
+    computed by whichever row asks first, rows asking while it is running
+    wait for it (safe from worker threads), and the result is released once
+    the last occurrence has taken it, so memory only holds results still
+    owed to a later row.
+    """
+
+    def __init__(self, counts: Mapping[Hashable, int]):
+        self.remaining = dict(counts)
+        self.futures: Dict[Hashable, Future] = {}
+        self.reused = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """compute() for the first occurrence of key; the same result for the rest."""
+        with self._lock:
+            remaining = self.remaining.get(key)
+            if remaining is None:
+                future = None
+            else:
+                future = self.futures.get(key)
+                owner = future is None
+                if owner:
+                    future = self.futures[key] = Future()
+                else:
+                    self.reused += 1
+                if remaining > 1:
+                    self.remaining[key] = remaining - 1
+                else:
+                    del self.remaining[key]
+                    del self.futures[key]
+        if future is None:
+            return compute()
+        if owner:
+            try:
+                future.set_result(compute())
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+        return future.result()
+
+    def done(self, key: Hashable) -> bool:
+        """Whether a result for key is already available without computing it."""
+        with self._lock:
+            future = self.futures.get(key)
+            return future is not None and future.done()
+
+
+# === TESTS ===
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    assert contact_key(" Jane  DOE ", "https://www.Acme.com/", "Jane@Acme.com ") == \
+        contact_key("jane doe", "acme.com", "jane@acme.com")
+    assert contact_key("Jane Doe", "acme.com") != contact_key("Jane Doe", "acme.io")
+    assert count_keys(["a", "b", "a", "c", "a"]) == {"a": 3}
+
+    calls = Counter()
+
+    def lookup(key):
+        calls[key] += 1
+        return key.upper()
+
+    rows = ["a", "b", "a", "c", "a", "b"]
+    shared = SharedResults(count_keys(rows))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda key: shared.get(key, lambda: lookup(key)), rows))
+    assert results == ["A", "B", "A", "C", "A", "B"], results
+    assert calls == {"a": 1, "b": 1, "c": 1}, calls
+    assert shared.reused == 3 and not shared.remaining and not shared.futures
+    print("dedupe: all tests passed")
@@ -0,0 +1,76 @@
+"""
+Domain normalization shared by the BuzzLead scripts.
+Reduces whatever is in a domain/website cell (URLs, www., paths, ports, emails) to a bare host.
+"""
+
+import re
+from typing import Iterable, Optional
+
+
+SCHEME_RE = re.compile(r"^[a-z][a-z0-9+.-]*://")
+HOST_END_RE = re.compile(r"[/?#\s]")
+
+
+def normalize_domain(value: str) -> str:
+    """
+    Bare lowercase host for a domain or website cell.
+
+    "HTTPS://www.Acme.com/about?ref=x" → "acme.com"
+    "acme.com:8080/" → "acme.com"
+    "jane@Acme.com" → "acme.com"
+    """
+    domain = (value or "").strip().lower()
+    domain = SCHEME_RE.sub("", domain).lstrip("/")
+    domain = HOST_END_RE.split(domain, 1)[0]
+    domain = domain.rpartition("@")[2]
+    domain = domain.partition(":")[0].strip(".")
+    if domain.startswith("www."):
+        domain = domain[4:]
+    return domain
+
+
+def matching_suffix(host: str, suffixes: Iterable[str]) -> Optional[str]:
+    """
+    The first suffix host equals or ends with as whole labels, else None.
+
+    ("mx1.acme.com", ["acme.com"]) → "acme.com"; ("notacme.com", ["acme.com"]) → None
+    """
+    for suffix in suffixes:
+        if host == suffix or host.endswith("." + suffix):
+            return suffix
+    return None
+
+
+# === TESTS ===
+if __name__ == "__main__":
+    tests = [
+        ("acme.com", "acme.com"),
+        ("  Acme.COM  ", "acme.com"),
+        ("https://www.acme.com/", "acme.com"),
+        ("http://acme.com/about/team?ref=x#top", "acme.com"),
+        ("HTTPS://WWW.Acme.com", "acme.com"),
+        ("//acme.com/path", "acme.com"),
+        ("www.acme.co.uk", "acme.co.uk"),
+        ("shop.acme.com", "shop.acme.com"),
+        ("acme.com:8080", "acme.com"),
+        ("acme.com.", "acme.com"),
+        ("jane@acme.com", "acme.com"),
+        ("mailto:jane@acme.com", "acme.com"),
+        ("newwww.com", "newwww.com"),
+        ("", ""),
+        (None, ""),
+    ]
+
+    passed = 0
+    for raw, expected in tests:
+        result = normalize_domain(raw)
+        status = "✓" if result == expected else "✗"
+        if result == expected:
+            passed += 1
+        print(f"{status} {raw!r:40} → {result!r:20} (expected: {expected!r})")
+
+    assert matching_suffix("mx1.acme.com", ["acme.com"]) == "acme.com"
+    assert matching_suffix("acme.com", ["other.com", "acme.com"]) == "acme.com"
+    assert matching_suffix("notacme.com", ["acme.com"]) is None
+
+    print(f"\n{passed}/{len(tests)} tests passed")
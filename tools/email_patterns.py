@@ -0,0 +1,221 @@
+"""
+Domain-level email pattern inference for BuzzLead waterfall enrichment.
+Learns the address format used at a domain (first.last@, flast@, ...) from validated emails
+and generates candidates for the remaining contacts at that domain.
+"""
+
+import re
+import threading
+import unicodedata
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from result_cache import CACHE_MISS
+
+
+# Local-part formats, most specific first (detection takes the first match)
+PATTERNS = {
+    "first.last": "{first}.{last}",
+    "first_last": "{first}_{last}",
+    "first-last": "{first}-{last}",
+    "firstlast": "{first}{last}",
+    "f.last": "{f}.{last}",
+    "flast": "{f}{last}",
+    "last.first": "{last}.{first}",
+    "lastfirst": "{last}{first}",
+    "lastf": "{last}{f}",
+    "firstl": "{first}{l}",
+    "first": "{first}",
+    "last": "{last}",
+}
+
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "phd", "md"}
+
+# Cache provider name for learned per-domain pattern counts
+CACHE_PROVIDER = "email_pattern"
+
+# Contacts at a domain that take turns (see domain_turn) before the rest stop waiting for a format
+MAX_DOMAIN_TURNS = 3
+
+
+def name_parts(full_name: str) -> Optional[Dict[str, str]]:
+    """
+    Split a full name into the ASCII-folded pieces used by PATTERNS.
+
+    "José García-López" → {"first": "jose", "last": "garcialopez", "f": "j", "l": "g"}
+    Returns None when there is no usable first name.
+    """
+    folded = unicodedata.normalize("NFKD", full_name or "").encode("ascii", "ignore").decode()
+    words = [re.sub(r"[^a-z]", "", w) for w in folded.lower().split()]
+    words = [w for w in words if w and w not in NAME_SUFFIXES]
+    if not words:
+        return None
+    first = words[0]
+    last = words[-1] if len(words) > 1 else ""
+    return {"first": first, "last": last, "f": first[:1], "l": last[:1]}
+
+
+def render(pattern: str, parts: Dict[str, str]) -> Optional[str]:
+    """Build the local part for a pattern, or None if the name lacks a needed piece."""
+    template = PATTERNS[pattern]
+    if ("{last}" in template or "{l}" in template) and not parts["last"]:
+        return None
+    return template.format(**parts)
+
+
+def detect_pattern(email: str, full_name: str) -> Optional[str]:
+    """Which PATTERNS entry produced this email's local part for this person, if any."""
+    parts = name_parts(full_name)
+    if not parts or "@" not in (email or ""):
+        return None
+    local = email.split("@", 1)[0].lower()
+    for pattern in PATTERNS:
+        if render(pattern, parts) == local:
+            return pattern
+    return None
+
+
+class DomainPatternEngine:
+    """
+    Per-domain record of which address formats produced valid emails.
+
+    Counts are keyed by company domain and stored as "pattern@maildomain",
+    so a company on acme.com that mails from acme.io still gets the right
+    candidates. When a result cache is given, counts are persisted there
+    and reloaded on later runs.
+    """
+
+    def __init__(self, cache=None):
+        self.cache = cache
+        self._counts: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+        self._turns: Dict[str, list] = {}  # domain → [lock, threads holding or waiting]
+        self._unlearned = Counter()  # domain → turns that ended with no format learned
+
+    def _domain_counts(self, domain: str) -> Counter:
+        """Counts for a domain (caller holds the lock)."""
+        domain = domain.lower()
+        if domain not in self._counts:
+            counts = Counter()
+            if self.cache:
+                stored = self.cache.get(CACHE_PROVIDER, domain)
+                if stored is not CACHE_MISS and stored:
+                    counts.update(stored)
+            self._counts[domain] = counts
+        return self._counts[domain]
+
+    def learn(self, domain: str, email: str, full_name: str) -> Optional[str]:
+        """Record a validated email. Returns the detected pattern, if any."""
+        pattern = detect_pattern(email, full_name)
+        if not pattern or not domain:
+            return None
+        mail_domain = email.split("@", 1)[1].lower()
+        with self._lock:
+            counts = self._domain_counts(domain)
+            counts[f"{pattern}@{mail_domain}"] += 1
+            if self.cache:
+                self.cache.put(CACHE_PROVIDER, dict(counts), domain.lower())
+        return pattern
+
+    @contextmanager
+    def domain_turn(self, domain: str, max_turns: int = MAX_DOMAIN_TURNS) -> Iterator[None]:
+        """
+        Hold while a contact at domain is searched and verified.
+
+        Worker threads take turns per domain, so a contact waiting here
+        starts from whatever format the one before it verified, as in a
+        sequential run. Contacts at other domains are not held up. Once
+        max_turns turns at a domain have ended without a format learned,
+        its remaining contacts stop waiting and run in parallel.
+        """
+        domain = (domain or "").lower()
+        with self._lock:
+            if self._unlearned[domain] >= max_turns:
+                turn = None
+            else:
+                turn = self._turns.setdefault(domain, [threading.Lock(), 0])
+                turn[1] += 1
+        if turn is None:
+            yield
+            return
+        try:
+            with turn[0]:
+                yield
+        finally:
+            with self._lock:
+                if not self._domain_counts(domain):
+                    self._unlearned[domain] += 1
+                turn[1] -= 1
+                if not turn[1]:
+                    del self._turns[domain]
+
+    def candidates(self, full_name: str, domain: str, limit: int = 2) -> List[str]:
+        """Candidate emails for a person, most-observed pattern first (empty if nothing learned)."""
+        parts = name_parts(full_name)
+        if not parts or not domain:
+            return []
+        with self._lock:
+            ranked = self._domain_counts(domain).most_common()
+
+        emails = []
+        for key, _ in ranked:
+            pattern, mail_domain = key.split("@", 1)
+            local = render(pattern, parts) if pattern in PATTERNS else None
+            if local:
+                emails.append(f"{local}@{mail_domain}")
+            if len(emails) >= limit:
+                break
+        return emails
+
+
+# === TESTS ===
+if __name__ == "__main__":
+    assert detect_pattern("john.smith@acme.com", "John Smith") == "first.last"
+    assert detect_pattern("jsmith@acme.com", "John Smith") == "flast"
+    assert detect_pattern("john@acme.com", "John Smith") == "first"
+    assert detect_pattern("jose.garcia@acme.com", "José García") == "first.last"
+    assert detect_pattern("sales@acme.com", "John Smith") is None
+
+    engine = DomainPatternEngine()
+    engine.learn("acme.com", "john.smith@acme.io", "John Smith")
+    engine.learn("acme.com", "mary.jones@acme.io", "Mary Jones")
+    engine.learn("acme.com", "bob@acme.io", "Bob Stone")
+    assert engine.candidates("Jane Doe", "acme.com") == ["jane.doe@acme.io", "jane@acme.io"]
+    assert engine.candidates("Jane Doe", "other.com") == []
+
+    # Contacts at one domain take turns; other domains run alongside
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    active = Counter()
+    overlap = Counter()
+
+    def work(domain):
+        with engine.domain_turn(domain):
+            domain = domain.lower()
+            with engine._lock:
+                active[domain] += 1
+                overlap[domain] = max(overlap[domain], active[domain])
+            time.sleep(0.01)
+            with engine._lock:
+                active[domain] -= 1
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        list(pool.map(work, ["a.com", "A.com", "a.com", "b.com", "b.com", "c.com"]))
+    assert overlap == {"a.com": 1, "b.com": 1, "c.com": 1}, overlap
+    assert not engine._turns
+
+    # A domain that never teaches a format stops holding its contacts back
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        list(pool.map(work, ["d.com"] * MAX_DOMAIN_TURNS))
+        overlap.clear()
+        list(pool.map(work, ["d.com"] * 4))
+    assert overlap["d.com"] > 1 and not engine._turns, overlap
+
+    # Turns keep going at a domain with a learned format
+    engine.learn("e.com", "john.smith@e.com", "John Smith")
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        list(pool.map(work, ["e.com"] * (MAX_DOMAIN_TURNS + 2)))
+    assert overlap["e.com"] == 1, overlap
+    print("email_patterns: all tests passed")
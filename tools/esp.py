@@ -0,0 +1,151 @@
+"""
+Email service provider (ESP) identification for BuzzLead enrichment.
+Classifies a domain's MX host locally (Google, Microsoft 365, Proofpoint, Mimecast, ...) and
+resolves each domain's ESP once, falling back to a remote lookup only for unknown hosts.
+"""
+
+import threading
+from collections import Counter
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+from domains import matching_suffix, normalize_domain
+from mx_screen import MXScreen
+
+
+# MX host suffix → ESP name, most specific first. Names match what EmailGuard
+# reports where it has one ("Google", "Outlook" for Microsoft 365).
+ESP_MX_SUFFIXES = {
+    "aspmx.l.google.com": "Google",
+    "google.com": "Google",
+    "googlemail.com": "Google",
+    "mail.protection.outlook.com": "Outlook",
+    "outlook.com": "Outlook",
+    "hotmail.com": "Outlook",
+    "pphosted.com": "Proofpoint",
+    "ppe-hosted.com": "Proofpoint",
+    "mimecast.com": "Mimecast",
+    "mimecast-offshore.com": "Mimecast",
+    "barracudanetworks.com": "Barracuda",
+    "iphmx.com": "Cisco Secure Email",
+    "trendmicro.com": "Trend Micro",
+    "trendmicro.eu": "Trend Micro",
+    "sophos.com": "Sophos",
+    "messagelabs.com": "Symantec",
+    "zoho.com": "Zoho",
+    "zoho.eu": "Zoho",
+    "zohomail.com": "Zoho",
+    "yahoodns.net": "Yahoo",
+    "secureserver.net": "GoDaddy",
+    "emailsrvr.com": "Rackspace",
+    "messagingengine.com": "Fastmail",
+    "protonmail.ch": "Proton",
+    "icloud.com": "iCloud",
+    "awsapps.com": "Amazon WorkMail",
+    "amazonaws.com": "Amazon SES",
+    "hostinger.com": "Hostinger",
+    "ionos.com": "IONOS",
+    "1and1.com": "IONOS",
+}
+
+
+def classify_mx(host: Optional[str]) -> Optional[str]:
+    """ESP for an MX host ("contoso-com.mail.protection.outlook.com" → "Outlook"), None if unknown."""
+    suffix = matching_suffix((host or "").rstrip(".").lower(), ESP_MX_SUFFIXES)
+    return ESP_MX_SUFFIXES[suffix] if suffix else None
+
+
+class ESPResolver:
+    """
+    One ESP answer per domain, shared by every worker thread.
+
+    The domain's MX host (from the MX screen) is classified locally; only
+    domains with an unknown host go to remote(email), the paid lookup, and
+    only for the first email seen at that domain. A failed remote lookup
+    (None) is not remembered, so the next email at the domain retries.
+    """
+
+    def __init__(self, remote: Callable[[str], Optional[str]], mx_screen: Optional[MXScreen] = None):
+        self.remote = remote
+        self.mx_screen = mx_screen
+        self.results: Dict[str, Future] = {}
+        self.sources: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def lookup(self, email: str) -> Optional[str]:
+        """ESP for the domain of email."""
+        domain = normalize_domain(email)
+        with self._lock:
+            future = self.results.get(domain)
+            owner = future is None
+            if owner:
+                future = self.results[domain] = Future()
+            else:
+                self.sources["domain"] += 1
+        if not owner:
+            esp = future.result()
+            print(f"  → ESP for {domain}: {esp or 'unknown'} (same domain)")
+            return esp
+
+        try:
+            esp, source = self._resolve(email, domain)
+        except BaseException as e:
+            with self._lock:
+                del self.results[domain]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            self.sources[source] += 1
+            if esp is None:
+                del self.results[domain]  # retry with the next email at this domain
+        future.set_result(esp)
+        return esp
+
+    def _resolve(self, email: str, domain: str):
+        if self.mx_screen:
+            esp = classify_mx(self.mx_screen.check(domain).host)
+            if esp:
+                print(f"  → ESP from MX: {esp}")
+                return esp, "mx"
+        return self.remote(email), "remote"
+
+    def summary_line(self) -> str:
+        total = sum(self.sources.values())
+        return (f"{total} lookups: {self.sources['domain']} reused per domain, "
+                f"{self.sources['mx']} from MX, {self.sources['remote']} remote")
+
+
+# === TESTS ===
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    assert classify_mx("aspmx.l.google.com.") == "Google"
+    assert classify_mx("contoso-com.mail.protection.outlook.com") == "Outlook"
+    assert classify_mx("mxa-001.pphosted.com") == "Proofpoint"
+    assert classify_mx("us-smtp-inbound-1.mimecast.com") == "Mimecast"
+    assert classify_mx("mail.custom.com") is None and classify_mx(None) is None
+    assert classify_mx("notgoogle.com") is None
+
+    zone = {"acme.com": [(1, "aspmx.l.google.com.")], "custom.com": [(5, "mail.custom.com.")]}
+    screen = MXScreen(lambda domain: zone.get(domain, []))
+    remote_calls: List[str] = []
+
+    def remote(email):
+        remote_calls.append(email)
+        return "Custom Mail Server"
+
+    resolver = ESPResolver(remote, screen)
+    emails = [f"user{i}@{domain}" for i in range(50) for domain in ("acme.com", "custom.com")]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        esps = list(pool.map(resolver.lookup, emails))
+    assert esps == ["Google", "Custom Mail Server"] * 50, esps
+    assert len(remote_calls) == 1 and remote_calls[0].endswith("@custom.com"), remote_calls
+    assert resolver.sources == {"domain": 98, "mx": 1, "remote": 1}, resolver.sources
+
+    # Without DNS every domain still costs one remote call, and failures are retried
+    answers = iter([None, "Google"])
+    resolver = ESPResolver(lambda email: next(answers))
+    assert resolver.lookup("a@acme.com") is None
+    assert resolver.lookup("b@acme.com") == "Google" and resolver.lookup("c@acme.com") == "Google"
+    print(resolver.summary_line())
+    print("esp: all tests passed")
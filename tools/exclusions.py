@@ -0,0 +1,156 @@
+"""
+Domain exclusion lists for BuzzLead runs.
+Loads the CSVs in exclusion-lists/ (or any given files) once into a set of normalized domains;
+a domain is excluded when it or any parent domain is listed (shop.acme.com matches acme.com).
+"""
+
+import csv
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from domains import normalize_domain
+
+
+EXCLUSION_LISTS_DIR = Path(__file__).parent.parent / "exclusion-lists"
+
+# Prebuilt snapshots of loaded lists, one per set of input files
+SNAPSHOT_DIR = Path(__file__).parent.parent / ".cache" / "exclusions"
+
+# Columns holding the domain, in order of preference (matched case-insensitively)
+DOMAIN_COLUMNS = ("domain", "website", "url", "company_domain")
+
+
+def list_files(paths: Iterable[str]) -> List[Path]:
+    """Exclusion CSVs for paths; a directory stands for every *.csv in it."""
+    files = []
+    for path in paths:
+        path = Path(path).expanduser()
+        if path.is_dir():
+            files.extend(sorted(path.glob("*.csv")))
+        elif path.exists():
+            files.append(path)
+        else:
+            raise FileNotFoundError(f"Exclusion list not found: {path}")
+    return files
+
+
+def read_domains(path: Path) -> Iterator[str]:
+    """Normalized domains from one exclusion CSV (first of DOMAIN_COLUMNS present, else column 1)."""
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = [name.strip().lower() for name in next(reader, [])]
+        column = next((header.index(name) for name in DOMAIN_COLUMNS if name in header), 0)
+        for row in reader:
+            if len(row) > column:
+                domain = normalize_domain(row[column])
+                if domain:
+                    yield domain
+
+
+class ExclusionIndex:
+    """
+    Set of excluded domains with parent-domain matching.
+
+    Lookups walk the host's labels from the full host up ("a.shop.acme.com",
+    "shop.acme.com", "acme.com", "com"), so a check is a handful of set
+    probes whatever the size of the lists.
+    """
+
+    def __init__(self, domains: Iterable[str] = ()):
+        self.domains = frozenset(domains)
+
+    @classmethod
+    def load(cls, paths: Iterable[str], snapshot_dir: Optional[Path] = SNAPSHOT_DIR) -> "ExclusionIndex":
+        """
+        Index the exclusion CSVs at paths (files or directories).
+
+        The built set is pickled to snapshot_dir, keyed by the files' paths,
+        sizes and modification times; later runs with unchanged files load
+        the snapshot instead of parsing the CSVs. Pass snapshot_dir=None to
+        always parse.
+        """
+        files = list_files(paths)
+        snapshot = None
+        if snapshot_dir:
+            fingerprint = "\n".join(
+                f"{file.resolve()}|{file.stat().st_size}|{file.stat().st_mtime_ns}" for file in files
+            )
+            snapshot = Path(snapshot_dir) / f"{hashlib.sha1(fingerprint.encode()).hexdigest()[:16]}.pickle"
+            try:
+                with open(snapshot, "rb") as f:
+                    return cls(pickle.load(f))
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+
+        index = cls(domain for file in files for domain in read_domains(file))
+        if snapshot:
+            os.makedirs(snapshot.parent, exist_ok=True)
+            tmp = snapshot.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(index.domains, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, snapshot)
+        return index
+
+    def match(self, domain: str) -> Optional[str]:
+        """The listed domain that excludes domain (itself or a parent), or None."""
+        if not self.domains:
+            return None
+        host = normalize_domain(domain)
+        while host:
+            if host in self.domains:
+                return host
+            host = host.partition(".")[2]
+        return None
+
+    def __contains__(self, domain: str) -> bool:
+        return self.match(domain) is not None
+
+    def __len__(self) -> int:
+        return len(self.domains)
+
+
+# === TESTS ===
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        (tmp / "clients.csv").write_text("Website,reason\nhttps://www.Acme.com/,client\n\nbeta.io,client\n")
+        (tmp / "dnc.csv").write_text("company_domain\nshop.gamma.co.uk\n")
+        (tmp / "notes.txt").write_text("not a list\n")
+
+        index = ExclusionIndex.load([str(tmp)], snapshot_dir=tmp / "snapshots")
+        assert index.domains == {"acme.com", "beta.io", "shop.gamma.co.uk"}, index.domains
+        assert "acme.com" in index and "mail.shop.acme.com" in index and "https://acme.com/x" in index
+        assert index.match("eu.beta.io") == "beta.io"
+        assert "notacme.com" not in index and "gamma.co.uk" not in index and "" not in index
+        assert "x.shop.gamma.co.uk" in index
+
+        # Second load comes from the snapshot; a changed file is re-read
+        assert len(list((tmp / "snapshots").glob("*.pickle"))) == 1
+        assert ExclusionIndex.load([str(tmp)], snapshot_dir=tmp / "snapshots").domains == index.domains
+        (tmp / "dnc.csv").write_text("domain\ndelta.com\n")
+        assert "delta.com" in ExclusionIndex.load([str(tmp / "dnc.csv")], snapshot_dir=tmp / "snapshots")
+
+        # 1M-domain list: parse once, then load from the snapshot
+        with open(tmp / "big.csv", "w") as f:
+            f.write("domain\n")
+            f.writelines(f"company{i}.com\n" for i in range(1_000_000))
+        start = time.perf_counter()
+        ExclusionIndex.load([str(tmp / "big.csv")], snapshot_dir=tmp / "snapshots")
+        built = time.perf_counter() - start
+        start = time.perf_counter()
+        big = ExclusionIndex.load([str(tmp / "big.csv")], snapshot_dir=tmp / "snapshots")
+        loaded = time.perf_counter() - start
+        start = time.perf_counter()
+        hits = sum(f"www.company{i}.com" in big for i in range(0, 2_000_000, 20))
+        checked = time.perf_counter() - start
+        assert len(big) == 1_000_000 and hits == 50_000
+        print(f"1M domains: built in {built:.2f}s, snapshot loaded in {loaded:.2f}s, "
+              f"{checked / 100_000 * 1e6:.1f}µs per check")
+
+    print("exclusions: all tests passed")
@@ -0,0 +1,193 @@
+"""
+Adaptive finder ordering for the BuzzLead email waterfall.
+Orders the email finders by expected cost per found email - from the hit rate, latency and
+credit spend observed in this run plus stats saved from earlier runs - with a bounded
+fraction of contacts sent through a random order so every finder keeps being measured.
+"""
+
+import json
+import os
+import random
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from metrics import Metrics
+
+
+SESSIONS_DIR = Path(__file__).parent.parent / ".sessions"
+DEFAULT_STATS_PATH = SESSIONS_DIR / "finder_stats.json"
+
+# Fixed waterfall order (also the tie-break order when finders score the same)
+FINDERS = ("trykit", "leadmagic", "icypeas")
+
+# Fraction of contacts that try the finders in a random order
+DEFAULT_EXPLORE = 0.1
+
+# Seconds of waiting worth one credit when trading latency against spend
+SECONDS_PER_CREDIT = 5.0
+
+# Fixed cost of any call in credits (rate-limit budget, a round trip), so
+# that with pay-on-hit finders the ranking still favours fewer calls per contact
+CALL_COST = 0.25
+
+# Saved stats are scaled down to at most this many answers per finder, so a
+# new list (often a different vertical) takes over after a few hundred contacts
+MAX_PRIOR_ANSWERS = 200
+
+# Neutral pseudo-answers mixed into every finder's numbers, so a finder with
+# no data yet is neither first nor last by accident
+PRIOR_ANSWERS = 2
+PRIOR_HIT_RATE = 0.5
+PRIOR_LATENCY = 1.0
+
+TOTAL_FIELDS = ("calls", "hits", "misses", "latency_sum", "throttled_seconds", "credits")
+
+
+def load_stats(path: Path) -> Dict[str, Dict[str, float]]:
+    """Saved per-finder totals ({} if there is no stats file yet)."""
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("finders", {})
+
+
+def scale_totals(totals: Dict[str, float], max_answers: int) -> Dict[str, float]:
+    """Shrink totals proportionally so they hold at most max_answers hits + misses."""
+    answers = totals.get("hits", 0) + totals.get("misses", 0)
+    if answers <= max_answers:
+        return dict(totals)
+    factor = max_answers / answers
+    return {field: value * factor for field, value in totals.items()}
+
+
+class AdaptiveFinderOrder:
+    """
+    Per-contact finder order for WaterfallEnricher.
+
+    Finders are sorted by (expected cost per call) / (hit rate), which
+    minimises the expected cost of a sequential waterfall when hit rates
+    are independent. Cost per call is CALL_COST plus the mean wall time
+    (request plus rate-limiter wait) converted at SECONDS_PER_CREDIT, plus
+    the credits spent per answer. Live numbers come from the run's Metrics, so cached
+    answers don't count.
+    """
+
+    def __init__(self, metrics: Metrics, finders: Sequence[str] = FINDERS,
+                 explore: float = DEFAULT_EXPLORE, stats_path: Optional[Path] = DEFAULT_STATS_PATH,
+                 seed: Optional[int] = None):
+        if not 0.0 <= explore <= 1.0:
+            raise ValueError(f"explore must be between 0 and 1, got {explore}")
+        self.metrics = metrics
+        self.finders = list(finders)
+        self.explore = explore
+        self.stats_path = Path(stats_path) if stats_path else None
+        self.saved = load_stats(self.stats_path) if self.stats_path else {}
+        self.prior = {provider: scale_totals(self.saved.get(provider, {}), MAX_PRIOR_ANSWERS)
+                      for provider in self.finders}
+        self.orders = 0
+        self.explored = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _totals(self, provider: str) -> Dict[str, float]:
+        """Saved (scaled) totals plus this run's."""
+        live = self.metrics.totals(provider)
+        prior = self.prior.get(provider, {})
+        return {field: prior.get(field, 0) + live[field] for field in TOTAL_FIELDS}
+
+    def estimate(self, provider: str) -> Dict[str, float]:
+        """Smoothed hit rate, seconds and credits per call, and cost per found email."""
+        totals = self._totals(provider)
+        answers = totals["hits"] + totals["misses"]
+        hit_rate = (totals["hits"] + PRIOR_HIT_RATE * PRIOR_ANSWERS) / (answers + PRIOR_ANSWERS)
+        seconds = ((totals["latency_sum"] + totals["throttled_seconds"] + PRIOR_LATENCY * PRIOR_ANSWERS)
+                   / (totals["calls"] + PRIOR_ANSWERS))
+        if answers:
+            credits = totals["credits"] / answers
+        else:
+            credits = hit_rate * self.metrics.credit_costs.get(provider, 0.0)
+        cost = CALL_COST + seconds / SECONDS_PER_CREDIT + credits
+        return {"answers": answers, "hit_rate": hit_rate, "seconds": seconds,
+                "credits": credits, "cost_per_hit": cost / hit_rate}
+
+    def order(self) -> List[str]:
+        """Finders to try for the next contact, cheapest expected cost per found email first."""
+        with self._lock:
+            self.orders += 1
+            if self.explore and self._rng.random() < self.explore:
+                self.explored += 1
+                order = list(self.finders)
+                self._rng.shuffle(order)
+                return order
+        return self.ranking()
+
+    def ranking(self, estimates: Optional[Dict[str, Dict[str, float]]] = None) -> List[str]:
+        """Finders by expected cost per found email (stable: ties keep the default order)."""
+        estimates = estimates or {provider: self.estimate(provider) for provider in self.finders}
+        return sorted(self.finders, key=lambda provider: estimates[provider]["cost_per_hit"])
+
+    def summary_lines(self) -> List[str]:
+        """Current order and the numbers behind it, for the run summary."""
+        estimates = {provider: self.estimate(provider) for provider in self.finders}
+        ranked = self.ranking(estimates)
+        explored = f"{self.explored / self.orders:.0%}" if self.orders else "-"
+        lines = [f"Order: {' → '.join(ranked)} (explored {explored} of {self.orders} contacts)"]
+        for provider in ranked:
+            e = estimates[provider]
+            lines.append(
+                f"{provider}: hit rate {e['hit_rate']:.0%}, {e['seconds'] * 1000:.0f}ms/call, "
+                f"~{e['credits']:.2f} credits/call, cost per email {e['cost_per_hit']:.2f} "
+                f"({e['answers']:.0f} answers)"
+            )
+        return lines
+
+    def save(self):
+        """Add this run's totals to the stats file (unscaled, so long-run rates stay exact)."""
+        if not self.stats_path:
+            return
+        finders = {provider: dict(totals) for provider, totals in self.saved.items()}
+        for provider in self.finders:
+            live = self.metrics.totals(provider)
+            saved = finders.setdefault(provider, {})
+            for field in TOTAL_FIELDS:
+                saved[field] = saved.get(field, 0) + live[field]
+        self.stats_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.stats_path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"updated": datetime.now().isoformat(), "finders": finders}, f, indent=2)
+        os.replace(tmp, self.stats_path)
+
+
+# === TESTS ===
+if __name__ == "__main__":
+    import tempfile
+
+    metrics = Metrics()
+    adaptive = AdaptiveFinderOrder(metrics, explore=0.0, stats_path=None)
+    assert adaptive.order() == list(FINDERS), "no data keeps the default order"
+
+    # LeadMagic finds most emails on this list, TryKit few
+    for _ in range(50):
+        metrics.record_call("trykit", 0.4, 200)
+        metrics.record_outcome("trykit", None)
+        metrics.record_call("leadmagic", 0.5, 200)
+        metrics.record_outcome("leadmagic", "jane@acme.com")
+    assert adaptive.order()[0] == "leadmagic", adaptive.summary_lines()
+
+    # Stats carry over to the next run, scaled down
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "finder_stats.json"
+        AdaptiveFinderOrder(metrics, stats_path=path).save()
+        next_run = AdaptiveFinderOrder(Metrics(), explore=0.0, stats_path=path)
+        assert next_run.order()[0] == "leadmagic"
+        assert load_stats(path)["leadmagic"]["hits"] == 50
+        assert scale_totals({"hits": 300, "misses": 100}, 200) == {"hits": 150, "misses": 50}
+
+    # Exploration is bounded by the configured fraction
+    exploring = AdaptiveFinderOrder(metrics, explore=0.2, stats_path=None, seed=1)
+    for _ in range(2000):
+        exploring.order()
+    assert 0.15 < exploring.explored / exploring.orders < 0.25, exploring.explored
+    print("finder_order: all tests passed")
@@ -0,0 +1,87 @@
+"""
+Shared HTTP client layer for BuzzLead provider APIs.
+One pooled keep-alive requests.Session per provider host, with separate connect/read timeouts.
+"""
+
+import os
+import threading
+from typing import Dict, Mapping, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# Production base URLs. Override any of them with <PROVIDER>_BASE_URL in the
+# secrets file or environment (e.g. to point at a local stand-in server).
+PROVIDER_BASE_URLS = {
+    "aiark": "https://api.ai-ark.com/api/developer-portal/v1",
+    "discolike": "https://api.discolike.com/v1",
+    "trykit": "https://api.trykitt.ai",
+    "leadmagic": "https://api.leadmagic.io",
+    "icypeas": "https://app.icypeas.com",
+    "millionverifier": "https://api.millionverifier.com",
+    "bounceban": "https://api.bounceban.com",
+    "emailguard": "https://app.emailguard.io",
+}
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 20.0
+
+
+def base_url(provider: str, keys: Mapping[str, str] = os.environ) -> str:
+    """Base URL for a provider, honoring a <PROVIDER>_BASE_URL override."""
+    url = keys.get(f"{provider.upper()}_BASE_URL") or PROVIDER_BASE_URLS[provider]
+    return url.rstrip("/")
+
+
+class ProviderSessions:
+    """
+    Pooled sessions, one per provider.
+
+    Reusing a session keeps TCP/TLS connections to the provider alive
+    between calls instead of paying a new handshake on every request.
+    pool_size caps the open connections per host and should be at least
+    the number of worker threads calling that provider.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: float = DEFAULT_READ_TIMEOUT):
+        self.pool_size = pool_size
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_keys(cls, keys: Mapping[str, str], pool_size: Optional[int] = None) -> "ProviderSessions":
+        """Build from HTTP_POOL_SIZE / HTTP_CONNECT_TIMEOUT / HTTP_READ_TIMEOUT entries in keys."""
+        configured = int(keys.get("HTTP_POOL_SIZE") or DEFAULT_POOL_SIZE)
+        return cls(
+            pool_size=max(configured, pool_size or 0),
+            connect_timeout=float(keys.get("HTTP_CONNECT_TIMEOUT") or DEFAULT_CONNECT_TIMEOUT),
+            read_timeout=float(keys.get("HTTP_READ_TIMEOUT") or DEFAULT_READ_TIMEOUT),
+        )
+
+    def session(self, provider: str) -> requests.Session:
+        """Get (or lazily create) the provider's session."""
+        with self._lock:
+            session = self._sessions.get(provider)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[provider] = session
+            return session
+
+    def request(self, provider: str, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request on the provider's pooled session (default timeout: (connect, read))."""
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session(provider).request(method, url, **kwargs)
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
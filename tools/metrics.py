@@ -0,0 +1,273 @@
+"""
+Per-provider instrumentation for BuzzLead API clients.
+Call counts, latency histograms, errors/429s/timeouts, hit rates and estimated credit spend,
+written as JSON lines (or Prometheus text) next to the run summary.
+"""
+
+import json
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Mapping, Optional
+
+
+# Latency histogram bucket upper bounds, in seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Estimated credits per call. Override with <PROVIDER>_CREDIT_COST in the
+# secrets file / environment to match your plan.
+DEFAULT_CREDIT_COSTS = {
+    "aiark": 1.0,
+    "discolike": 1.0,
+    "trykit": 1.0,
+    "trykit_verify": 1.0,
+    "leadmagic": 1.0,
+    "icypeas": 1.0,
+    "millionverifier": 1.0,
+    "bounceban": 1.0,
+    "emailguard": 0.0,
+    "millionverifier_bulk": 1.0,
+    "bounceban_bulk": 1.0,
+}
+
+# Finders only charge when they return an email
+CHARGED_ON_HIT = {"trykit", "leadmagic", "icypeas"}
+
+# Bulk jobs charge per submitted email (add_credits), not per request
+CHARGED_PER_ITEM = {"millionverifier_bulk", "bounceban_bulk"}
+
+# Answers that count as a hit; for anything else a non-empty answer is a hit
+HIT_VALUES = {
+    "millionverifier": {"good"},
+    "trykit_verify": {"valid", "valid-risky"},
+    "bounceban": {"deliverable"},
+    "millionverifier_bulk": {"good"},
+    "bounceban_bulk": {"deliverable"},
+}
+
+
+def is_hit(provider: str, value: Any) -> bool:
+    """Whether a provider's answer was useful (email found, email good, ...)."""
+    if provider in HIT_VALUES:
+        return value in HIT_VALUES[provider]
+    return bool(value) and value != "unknown"
+
+
+class ProviderMetrics:
+    """Counters for one provider."""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.timeouts = 0
+        self.hits = 0
+        self.misses = 0
+        self.credits = 0.0
+        self.throttled_seconds = 0.0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)  # last bucket: > LATENCY_BUCKETS[-1]
+
+    def latency_percentile(self, pct: float) -> Optional[float]:
+        """Upper bound of the histogram bucket holding the pct-th percentile."""
+        if not self.calls:
+            return None
+        rank = pct / 100 * self.calls
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS + (self.latency_max,), self.buckets):
+            seen += count
+            if seen >= rank:
+                return round(min(bound, self.latency_max), 4)
+        return round(self.latency_max, 4)
+
+    def snapshot(self) -> Dict[str, Any]:
+        outcomes = self.hits + self.misses
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "timeouts": self.timeouts,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / outcomes, 4) if outcomes else None,
+            "credits": round(self.credits, 2),
+            "credits_per_hit": round(self.credits / self.hits, 2) if self.hits else None,
+            "throttled_seconds": round(self.throttled_seconds, 3),
+            "latency": {
+                "mean": round(self.latency_sum / self.calls, 4) if self.calls else None,
+                "p50": self.latency_percentile(50),
+                "p95": self.latency_percentile(95),
+                "max": round(self.latency_max, 4),
+                "buckets": {
+                    **{str(bound): count for bound, count in zip(LATENCY_BUCKETS, self.buckets)},
+                    "+Inf": self.buckets[-1],
+                },
+            },
+        }
+
+
+class Metrics:
+    """
+    Thread-safe per-provider metrics for one run.
+
+    record_call() is called around every HTTP request (including failed
+    ones), record_outcome() once per live answer, so cached answers are not
+    counted as calls or credits.
+    """
+
+    def __init__(self, credit_costs: Optional[Dict[str, float]] = None):
+        self.credit_costs = dict(DEFAULT_CREDIT_COSTS, **(credit_costs or {}))
+        self.providers: Dict[str, ProviderMetrics] = {}
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_keys(cls, keys: Mapping[str, str]) -> "Metrics":
+        """Build with credit costs overridden by <PROVIDER>_CREDIT_COST entries in keys."""
+        costs = {}
+        for provider in DEFAULT_CREDIT_COSTS:
+            cost = keys.get(f"{provider.upper()}_CREDIT_COST")
+            if cost:
+                costs[provider] = float(cost)
+        return cls(costs)
+
+    def _provider(self, provider: str) -> ProviderMetrics:
+        """Counters for a provider (caller holds the lock)."""
+        metrics = self.providers.get(provider)
+        if metrics is None:
+            metrics = self.providers[provider] = ProviderMetrics()
+        return metrics
+
+    def record_call(self, provider: str, seconds: float, status: Optional[int] = None,
+                    timed_out: bool = False, throttled: float = 0.0):
+        """Record one HTTP request: its latency, status (None = no response) and limiter wait."""
+        with self._lock:
+            metrics = self._provider(provider)
+            metrics.calls += 1
+            metrics.latency_sum += seconds
+            metrics.latency_max = max(metrics.latency_max, seconds)
+            metrics.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            metrics.throttled_seconds += throttled
+            if timed_out:
+                metrics.timeouts += 1
+            elif status == 429:
+                metrics.rate_limited += 1
+            elif status is None or status >= 400:
+                metrics.errors += 1
+            charged_per_call = provider not in CHARGED_ON_HIT and provider not in CHARGED_PER_ITEM
+            if charged_per_call and status is not None and status < 400:
+                metrics.credits += self.credit_costs.get(provider, 0.0)
+
+    def record_outcome(self, provider: str, value: Any):
+        """Record a provider's (live) answer as a hit or a miss."""
+        hit = is_hit(provider, value)
+        with self._lock:
+            metrics = self._provider(provider)
+            if hit:
+                metrics.hits += 1
+                if provider in CHARGED_ON_HIT:
+                    metrics.credits += self.credit_costs.get(provider, 0.0)
+            else:
+                metrics.misses += 1
+
+    def add_credits(self, provider: str, units: int):
+        """Charge per-item credits for a bulk job (e.g. one per verified email)."""
+        with self._lock:
+            self._provider(provider).credits += units * self.credit_costs.get(provider, 0.0)
+
+    def totals(self, provider: str) -> Dict[str, float]:
+        """Raw running totals for one provider (cheap enough to read per contact)."""
+        with self._lock:
+            m = self.providers.get(provider) or ProviderMetrics()
+            return {"calls": m.calls, "hits": m.hits, "misses": m.misses, "latency_sum": m.latency_sum,
+                    "throttled_seconds": m.throttled_seconds, "credits": m.credits}
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {provider: m.snapshot() for provider, m in sorted(self.providers.items())}
+
+    def summary_lines(self) -> List[str]:
+        """One line per provider for the run summary."""
+        lines = []
+        for provider, m in self.snapshot().items():
+            hit_rate = f"{m['hit_rate']:.0%}" if m["hit_rate"] is not None else "-"
+            mean = f"{m['latency']['mean'] * 1000:.0f}ms" if m["latency"]["mean"] is not None else "-"
+            lines.append(
+                f"{provider}: {m['calls']} calls, {mean} avg, hit rate {hit_rate}, "
+                f"{m['errors']} errors, {m['rate_limited']} 429s, {m['timeouts']} timeouts, "
+                f"~{m['credits']:g} credits"
+            )
+        return lines
+
+    def write(self, path: str, **context):
+        """
+        Append the metrics to path: one JSON line per provider, or
+        Prometheus text exposition format if path ends in .prom.
+        """
+        snapshot = self.snapshot()
+        if path.endswith(".prom"):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(to_prometheus(snapshot))
+            return
+        now = time.strftime("%Y-%m-%dT%H:%M:%S")
+        elapsed = round(time.time() - self.started, 3)
+        with open(path, "a", encoding="utf-8") as f:
+            for provider, metrics in snapshot.items():
+                record = {"time": now, "elapsed": elapsed, **context, "provider": provider, **metrics}
+                f.write(json.dumps(record) + "\n")
+
+
+def to_prometheus(snapshot: Dict[str, Dict[str, Any]]) -> str:
+    """Render a Metrics.snapshot() in Prometheus text format."""
+    counters = [
+        ("calls", "buzzlead_provider_calls_total", "HTTP requests sent"),
+        ("errors", "buzzlead_provider_errors_total", "Failed requests (other than 429s and timeouts)"),
+        ("rate_limited", "buzzlead_provider_rate_limited_total", "Requests answered with 429"),
+        ("timeouts", "buzzlead_provider_timeouts_total", "Requests that timed out"),
+        ("hits", "buzzlead_provider_hits_total", "Useful answers (email found, email good, ...)"),
+        ("misses", "buzzlead_provider_misses_total", "Answers that were not useful"),
+        ("credits", "buzzlead_provider_credits_total", "Estimated credits spent"),
+        ("throttled_seconds", "buzzlead_provider_throttled_seconds_total", "Time spent waiting on the rate limiter"),
+    ]
+    lines = []
+    for key, name, help_text in counters:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for provider, m in snapshot.items():
+            lines.append(f'{name}{{provider="{provider}"}} {m[key]}')
+
+    name = "buzzlead_provider_latency_seconds"
+    lines.append(f"# HELP {name} Request latency")
+    lines.append(f"# TYPE {name} histogram")
+    for provider, m in snapshot.items():
+        cumulative = 0
+        for bound, count in m["latency"]["buckets"].items():
+            cumulative += count
+            lines.append(f'{name}_bucket{{provider="{provider}",le="{bound}"}} {cumulative}')
+        mean = m["latency"]["mean"] or 0.0
+        lines.append(f'{name}_sum{{provider="{provider}"}} {mean * m["calls"]:.4f}')
+        lines.append(f'{name}_count{{provider="{provider}"}} {m["calls"]}')
+    return "\n".join(lines) + "\n"
+
+
+# === TESTS ===
+if __name__ == "__main__":
+    metrics = Metrics({"millionverifier": 0.5})
+    metrics.record_call("trykit", 0.12, 200)
+    metrics.record_outcome("trykit", "jane@acme.com")
+    metrics.record_call("trykit", 0.30, 200)
+    metrics.record_outcome("trykit", None)
+    metrics.record_call("trykit", 0.02, 429)
+    metrics.record_call("millionverifier", 0.08, 200)
+    metrics.record_outcome("millionverifier", "risky")
+    metrics.record_call("millionverifier", 20.0, None, timed_out=True)
+
+    snapshot = metrics.snapshot()
+    trykit, mv = snapshot["trykit"], snapshot["millionverifier"]
+    assert (trykit["calls"], trykit["hits"], trykit["misses"], trykit["rate_limited"]) == (3, 1, 1, 1), trykit
+    assert trykit["credits"] == 1.0 and trykit["hit_rate"] == 0.5
+    assert (mv["calls"], mv["timeouts"], mv["misses"], mv["credits"]) == (2, 1, 1, 0.5), mv
+    assert trykit["latency"]["buckets"]["0.05"] == 1 and trykit["latency"]["buckets"]["0.25"] == 1
+    assert 'buzzlead_provider_calls_total{provider="trykit"} 3' in to_prometheus(snapshot)
+    print("metrics: all tests passed")
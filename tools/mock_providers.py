@@ -0,0 +1,437 @@
+"""
+Local stand-in for the BuzzLead provider APIs, for benchmarks, load tests and offline runs.
+One threaded HTTP server answers every provider under /<provider>/..., with configurable
+latency, hit rates, errors, 429 bursts and timeouts.
+"""
+
+import email.parser
+import hashlib
+import json
+import multiprocessing
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from http_client import PROVIDER_BASE_URLS
+
+
+@dataclass
+class MockConfig:
+    """
+    How the stand-in server behaves.
+
+    Outcomes (found / quality / validity) are a deterministic function of
+    the lookup and seed, so the finders and validators agree with each
+    other and a re-run gets the same answers (useful with the result cache).
+    """
+    latency: float = 0.05  # seconds added to every response
+    jitter: float = 0.0  # extra random latency, uniform in [0, jitter]
+    error_rate: float = 0.0  # fraction of requests answered with HTTP 500
+    timeout_rate: float = 0.0  # fraction of requests that stall for `hang` seconds
+    hang: float = 30.0  # longer than the scripts' default read timeout (20s)
+    burst_every: float = 0.0  # seconds between 429 bursts (0 = never)
+    burst_length: float = 1.0  # seconds each 429 burst lasts
+    retry_after: int = 1  # Retry-After sent with 429s
+    hit_rates: Dict[str, float] = field(default_factory=lambda: {
+        "trykit": 0.6, "leadmagic": 0.4, "icypeas": 0.3,
+    })
+    quality_mix: Dict[str, float] = field(default_factory=lambda: {
+        "good": 0.7, "risky": 0.2, "bad": 0.1,
+    })
+    trykit_valid_rate: float = 0.5  # risky emails TryKit confirms
+    bounceban_deliverable_rate: float = 0.5  # emails BounceBan calls deliverable
+    company_hit_rate: float = 0.8  # AI Ark domains with any people
+    people_per_company: int = 5  # AI Ark people returned per domain
+    company_sizes: Dict[str, int] = field(default_factory=dict)  # people for specific domains (always found)
+    discolike_total: int = 5000  # companies matched by /count and /discover
+    bulk_delay: float = 0.0  # seconds a bulk verification job reports "processing"
+    seed: int = 0
+
+
+def mock_email(full_name: str, domain: str) -> Optional[str]:
+    """The address the mock finders return: first.last@domain."""
+    words = re.sub(r"[^a-z0-9 ]", "", (full_name or "").lower()).split()
+    if not words or not domain:
+        return None
+    local = f"{words[0]}.{words[-1]}" if len(words) > 1 else words[0]
+    return f"{local}@{domain.lower()}"
+
+
+def base_url_overrides(url: str) -> Dict[str, str]:
+    """<PROVIDER>_BASE_URL entries pointing every provider at a mock server running at url."""
+    overrides = {f"{provider.upper()}_BASE_URL": f"{url}/{provider}" for provider in PROVIDER_BASE_URLS}
+    overrides["MILLIONVERIFIER_BULK_BASE_URL"] = f"{url}/millionverifier"
+    return overrides
+
+
+class MockProviderServer:
+    """
+    Threaded HTTP server emulating the provider endpoints the scripts call.
+
+    Point the scripts at it with the <PROVIDER>_BASE_URL overrides from
+    base_url_overrides(). Requests served per provider are counted in
+    .requests (and served as JSON at /_stats).
+
+        with MockProviderServer(MockConfig(latency=0.1)) as server:
+            keys.update(server.base_url_overrides())
+    """
+
+    def __init__(self, config: Optional[MockConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or MockConfig()
+        self.requests: Counter = Counter()
+        self.jobs: Dict[str, Tuple[List[str], float]] = {}
+        self.started = time.monotonic()
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def base_url_overrides(self) -> Dict[str, str]:
+        """<PROVIDER>_BASE_URL entries pointing every provider at this server."""
+        return base_url_overrides(self.url)
+
+    def start(self) -> "MockProviderServer":
+        """Serve from a background thread."""
+        self.started = time.monotonic()
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve from the calling thread until interrupted."""
+        self.started = time.monotonic()
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockProviderServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def random(self) -> float:
+        with self._lock:
+            return self._random.random()
+
+    def chance(self, *parts: str) -> float:
+        """Stable pseudo-random number in [0, 1) for a lookup."""
+        digest = hashlib.md5("|".join((str(self.config.seed),) + parts).encode()).digest()
+        return int.from_bytes(digest[:8], "big") / 2 ** 64
+
+    def in_burst(self) -> bool:
+        """Whether the server is currently inside a 429 burst."""
+        config = self.config
+        if not config.burst_every:
+            return False
+        return (time.monotonic() - self.started) % config.burst_every < config.burst_length
+
+    # ========== RESPONSES ==========
+
+    def respond(self, method: str, provider: str, path: str, query: Dict[str, str],
+                raw: bytes, content_type: str) -> Tuple[int, object, Dict[str, str]]:
+        """(status, payload, headers) for one request. A str payload is sent as CSV."""
+        if provider == "_stats":
+            with self._lock:
+                return 200, dict(self.requests), {}
+        with self._lock:
+            self.requests[provider] += 1
+
+        config = self.config
+        time.sleep(config.latency + (self.random() * config.jitter if config.jitter else 0.0))
+        if config.timeout_rate and self.random() < config.timeout_rate:
+            time.sleep(config.hang)
+        if self.in_burst():
+            return 429, {"error": "rate limited"}, {"Retry-After": str(config.retry_after)}
+        if config.error_rate and self.random() < config.error_rate:
+            return 500, {"error": "mock failure"}, {}
+
+        body = {}
+        if raw and "json" in content_type:
+            try:
+                body = json.loads(raw)
+            except ValueError:
+                return 400, {"error": "invalid JSON"}, {}
+
+        route = ROUTES.get((provider, method, path))
+        if route is None:
+            return 404, {"error": f"unknown endpoint {method} {provider}{path}"}, {}
+        return 200, route(self, query, body, raw, content_type), {}
+
+    def find(self, provider: str, full_name: str, domain: str) -> Dict:
+        """Finder response: first.last@domain for hit_rates[provider] of lookups."""
+        email = mock_email(full_name, domain)
+        hit = email and self.chance(provider, email) < self.config.hit_rates.get(provider, 1.0)
+        return {"email": email if hit else None}
+
+    def quality(self, email: str) -> str:
+        """Million Verifier quality, drawn from quality_mix."""
+        roll = self.chance("quality", (email or "").lower())
+        for quality, share in self.config.quality_mix.items():
+            if roll < share:
+                return quality
+            roll -= share
+        return "unknown"
+
+    def trykit_validity(self, email: str) -> str:
+        valid = self.chance("trykit_verify", email.lower()) < self.config.trykit_valid_rate
+        return "valid" if valid else "invalid"
+
+    def bounceban_result(self, email: str) -> str:
+        deliverable = self.chance("bounceban", email.lower()) < self.config.bounceban_deliverable_rate
+        return "deliverable" if deliverable else "undeliverable"
+
+    def create_job(self, emails: List[str]) -> str:
+        """Register a bulk verification job; it finishes bulk_delay seconds later."""
+        with self._lock:
+            job_id = f"job{len(self.jobs) + 1}"
+            self.jobs[job_id] = ([e.strip() for e in emails if e and e.strip()], time.monotonic())
+        return job_id
+
+    def job_emails(self, job_id: Optional[str]) -> List[str]:
+        return self.jobs.get(job_id, ([], 0.0))[0]
+
+    def job_status(self, job_id: Optional[str]) -> str:
+        job = self.jobs.get(job_id)
+        if job is None:
+            return "error"
+        return "finished" if time.monotonic() - job[1] >= self.config.bulk_delay else "in_progress"
+
+    def people(self, payload: Dict) -> Dict:
+        """AI Ark /people: a page of synthetic decision-makers for the requested domain(s)."""
+        account = payload.get("account") or {}
+        domains = account.get("domain", {})
+        domains = domains.get("any", domains).get("include", [])
+        page, size = int(payload.get("page", 0)), int(payload.get("size", 10))
+
+        everyone = [
+            {
+                "first_name": f"Person{n}",
+                "last_name": domain.split(".")[0].title(),
+                "title": "VP Sales",
+                "seniority": "VP",
+                "department": "Sales",
+                "linkedin_url": f"https://linkedin.com/in/{domain.split('.')[0]}-{n}",
+                "company": {"link": {"domain": domain}},
+            }
+            for domain in domains
+            if domain in self.config.company_sizes or self.chance("aiark", domain) < self.config.company_hit_rate
+            for n in range(self.config.company_sizes.get(domain, self.config.people_per_company))
+        ]
+        return {
+            "content": everyone[page * size:(page + 1) * size],
+            "totalElements": len(everyone),
+            "totalPages": -(-len(everyone) // size) if size else 0,
+        }
+
+    def discover(self, query: Dict[str, str]) -> Dict:
+        """DiscoLike /discover: synthetic lookalikes, most similar first, paged by offset."""
+        total = self.config.discolike_total
+        offset = int(query.get("offset") or 0)
+        limit = min(int(query.get("max_records") or 100), 10000)
+        results = [
+            {
+                "domain": f"lookalike{i}.com",
+                "name": f"Lookalike {i} Inc",
+                "similarity": 99 - i * 50 // max(total, 1),
+                "score": 100 + int(self.chance("score", str(i)) * 600),
+                "employees": "11-50",
+                "address": {"city": "Austin", "state": "TX", "country": "US"},
+                "industry_groups": {"SOFTWARE": 0.8, "SAAS": 0.6},
+                "description": f"Lookalike company number {i}.",
+            }
+            for i in range(offset, min(offset + limit, total))
+        ]
+        return {"results": results, "count": len(results)}
+
+
+def _multipart_file(raw: bytes, content_type: str) -> str:
+    """Text of the first file part in a multipart/form-data body."""
+    message = email.parser.BytesParser().parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + raw
+    )
+    for part in message.get_payload() if message.is_multipart() else []:
+        if part.get_filename():
+            return part.get_payload(decode=True).decode("utf-8", "ignore")
+    return ""
+
+
+def _mv_download(server: MockProviderServer, file_id: Optional[str]) -> str:
+    """Million Verifier bulk results as CSV."""
+    lines = ["email,quality,result"]
+    lines.extend(f"{e},{server.quality(e)},ok" for e in server.job_emails(file_id))
+    return "\n".join(lines) + "\n"
+
+
+# (provider, method, path) → handler(server, query, json_body, raw_body, content_type)
+ROUTES = {
+    ("trykit", "POST", "/job/find_email"):
+        lambda s, q, b, raw, ct: s.find("trykit", b.get("fullName"), b.get("domain")),
+    ("trykit", "POST", "/job/verify_email"):
+        lambda s, q, b, raw, ct: {"validity": s.trykit_validity(b.get("email", ""))},
+    ("leadmagic", "POST", "/business-email"):
+        lambda s, q, b, raw, ct: s.find("leadmagic", b.get("name"), b.get("domain")),
+    ("icypeas", "POST", "/api/email-search"):
+        lambda s, q, b, raw, ct: s.find("icypeas", b.get("full_name"), b.get("domain_name")),
+    ("millionverifier", "GET", "/api/v3/"):
+        lambda s, q, b, raw, ct: {"email": q.get("email"), "quality": s.quality(q.get("email")), "result": "ok"},
+    ("millionverifier", "POST", "/bulkapi/v2/upload"):
+        lambda s, q, b, raw, ct: {"file_id": s.create_job(_multipart_file(raw, ct).splitlines())},
+    ("millionverifier", "GET", "/bulkapi/v2/fileinfo"):
+        lambda s, q, b, raw, ct: {"file_id": q.get("file_id"), "status": s.job_status(q.get("file_id"))},
+    ("millionverifier", "GET", "/bulkapi/v2/download"):
+        lambda s, q, b, raw, ct: _mv_download(s, q.get("file_id")),
+    ("bounceban", "GET", "/v1/verify/single"):
+        lambda s, q, b, raw, ct: {"email": q.get("email"), "result": s.bounceban_result(q.get("email", ""))},
+    ("bounceban", "POST", "/v1/verify/bulk"):
+        lambda s, q, b, raw, ct: {"id": s.create_job(b.get("emails", []))},
+    ("bounceban", "GET", "/v1/verify/bulk/status"):
+        lambda s, q, b, raw, ct: {"id": q.get("id"), "status": s.job_status(q.get("id"))},
+    ("bounceban", "GET", "/v1/verify/bulk/dump"):
+        lambda s, q, b, raw, ct: {"items": [
+            {"email": e, "result": s.bounceban_result(e)} for e in s.job_emails(q.get("id"))
+        ]},
+    ("emailguard", "POST", "/api/v1/email-host-lookup"):
+        lambda s, q, b, raw, ct: {"data": {
+            "email_host": "Google" if s.chance("esp", b.get("email", "").rpartition("@")[2]) < 0.6 else "Outlook"
+        }},
+    ("aiark", "POST", "/people"):
+        lambda s, q, b, raw, ct: s.people(b),
+    ("discolike", "GET", "/discover"):
+        lambda s, q, b, raw, ct: s.discover(q),
+    ("discolike", "GET", "/count"):
+        lambda s, q, b, raw, ct: {"count": s.config.discolike_total},
+}
+
+
+def _make_handler(server: MockProviderServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like the real APIs
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def _handle(self):
+            parsed = urlparse(self.path)
+            provider, _, rest = parsed.path.lstrip("/").partition("/")
+            query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+
+            status, payload, headers = server.respond(
+                self.command, provider, "/" + rest, query, raw, self.headers.get("Content-Type", "")
+            )
+            if isinstance(payload, str):
+                data, content_type = payload.encode(), "text/csv"
+            else:
+                data, content_type = json.dumps(payload).encode(), "application/json"
+            try:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # the client timed out and hung up before we answered
+
+        do_GET = _handle
+        do_POST = _handle
+
+    return Handler
+
+
+def _serve(config: MockConfig, port_queue):
+    with MockProviderServer(config) as server:
+        port_queue.put(server.url)
+        threading.Event().wait()
+
+
+def spawn(config: Optional[MockConfig] = None):
+    """
+    Run a MockProviderServer in a child process (so it doesn't share the GIL
+    with the code under test). Returns (process, url); terminate() the
+    process when done. Request counts are served at <url>/_stats.
+    """
+    port_queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(config or MockConfig(), port_queue), daemon=True)
+    process.start()
+    return process, port_queue.get(timeout=10)
+
+
+# === TESTS ===
+if __name__ == "__main__":
+    import os
+    import sys
+    from pathlib import Path
+
+    import requests
+
+    always = {"trykit": 1.0, "leadmagic": 1.0, "icypeas": 1.0}
+    with MockProviderServer(MockConfig(latency=0, hit_rates=always)) as mock:
+        urls = mock.base_url_overrides()
+        found = requests.post(f"{urls['TRYKIT_BASE_URL']}/job/find_email",
+                              json={"fullName": "Jane Doe", "domain": "acme.com"}).json()
+        assert found == {"email": "jane.doe@acme.com"}, found
+        page = requests.post(f"{urls['AIARK_BASE_URL']}/people",
+                             json={"page": 1, "size": 3, "account": {"domain": {"any": {"include": ["a.com", "b.com"]}}}}).json()
+        assert page["totalElements"] in (0, 5, 10) and len(page["content"]) <= 3, page
+        assert mock.requests == {"trykit": 1, "aiark": 1}
+
+        discover = requests.get(f"{urls['DISCOLIKE_BASE_URL']}/discover",
+                                params={"offset": 4990, "max_records": 100}).json()
+        assert len(discover["results"]) == 10 and discover["results"][0]["domain"] == "lookalike4990.com"
+
+        upload = requests.post(f"{urls['MILLIONVERIFIER_BULK_BASE_URL']}/bulkapi/v2/upload",
+                               files={"file_contents": ("emails.csv", "a@x.io\nb@x.io", "text/csv")}).json()
+        download = requests.get(f"{urls['MILLIONVERIFIER_BULK_BASE_URL']}/bulkapi/v2/download",
+                                params={"file_id": upload["file_id"]}).text
+        assert download.count("@x.io") == 2, download
+
+    with MockProviderServer(MockConfig(latency=0, error_rate=1.0)) as mock:
+        status = requests.get(f"{mock.url}/millionverifier/api/v3/", params={"email": "a@b.com"}).status_code
+        assert status == 500
+
+    with MockProviderServer(MockConfig(latency=0, burst_every=10, burst_length=5, retry_after=3)) as mock:
+        response = requests.get(f"{mock.url}/millionverifier/api/v3/", params={"email": "a@b.com"})
+        assert response.status_code == 429 and response.headers["Retry-After"] == "3"
+
+    with MockProviderServer(MockConfig(latency=0, timeout_rate=1.0, hang=1)) as mock:
+        try:
+            requests.get(f"{mock.url}/millionverifier/api/v3/", params={"email": "a@b.com"}, timeout=0.2)
+            raise AssertionError("expected a timeout")
+        except requests.exceptions.Timeout:
+            pass
+
+    # One big company fills a batched people search's page cap; the others are re-queried on their own
+    sizes = {"big.com": 300, "small.com": 3, "tiny.com": 2}
+    with MockProviderServer(MockConfig(latency=0, company_sizes=sizes)) as mock:
+        os.environ.update(mock.base_url_overrides(), AIARK_API_KEY="test", AIARK_RATE_LIMIT="off")
+        sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+        import enrich_contacts
+        found = enrich_contacts.search_people_batch(list(sizes), per_company=5, max_pages=2)
+        assert {domain: len(people) for domain, people in found.items()} == {"big.com": 5, "small.com": 3, "tiny.com": 2}
+        assert mock.requests == {"aiark": 4}, mock.requests
+
+    process, url = spawn(MockConfig(latency=0))
+    requests.post(f"{base_url_overrides(url)['LEADMAGIC_BASE_URL']}/business-email",
+                  json={"name": "Jo", "domain": "x.io"})
+    assert requests.get(f"{url}/_stats").json() == {"leadmagic": 1}
+    process.terminate()
+    print("mock_providers: all tests passed")
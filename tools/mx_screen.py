@@ -0,0 +1,221 @@
+"""
+DNS MX pre-screening for BuzzLead email enrichment.
+Resolves each domain's mail exchangers once (cached, concurrent) and flags domains that cannot
+receive mail - no MX, null MX (RFC 7505), parked, or not registered - so the finders skip them.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from domains import matching_suffix
+from result_cache import ResultCache, CACHE_MISS
+
+try:
+    import dns.resolver
+except ImportError:  # optional: pip install dnspython
+    dns = None
+
+
+# Screening outcomes. "error" (timeout, SERVFAIL) fails open: the domain is still searched
+MX_OK = "ok"
+NO_MX = "no_mx"
+NULL_MX = "null_mx"
+PARKED = "parked"
+NO_DOMAIN = "nxdomain"
+MX_ERROR = "error"
+SEARCHABLE = {MX_OK, MX_ERROR}
+
+# Cache provider name for MX answers (TTL: MX_CACHE_TTL_DAYS)
+CACHE_PROVIDER = "mx"
+
+# MX hosts of domain parking services (suffix match)
+PARKED_MX_SUFFIXES = (
+    "parkingcrew.net", "sedoparking.com", "above.com", "bodis.com", "parklogic.com",
+    "dan.com", "afternic.com", "hugedomains.com", "undeveloped.com", "domainmarket.com",
+)
+
+# Domains resolved at once by prefetch()
+DEFAULT_MX_CONCURRENCY = 32
+DEFAULT_DNS_TIMEOUT = 5.0
+
+
+class DomainNotFound(Exception):
+    """The domain does not exist (NXDOMAIN)."""
+
+
+# A resolver takes a domain and returns its MX records as (preference, host)
+# pairs - [] when the domain has none - or raises DomainNotFound.
+Resolver = Callable[[str], List[Tuple[int, str]]]
+
+
+@dataclass
+class MXResult:
+    """Outcome of screening one domain."""
+    status: str
+    host: Optional[str] = None  # preferred mail exchanger
+
+    @property
+    def searchable(self) -> bool:
+        return self.status in SEARCHABLE
+
+
+def classify(records: List[Tuple[int, str]]) -> MXResult:
+    """Screening result for a domain's MX records."""
+    hosts = [host.rstrip(".").lower() for _, host in sorted(records)]
+    if not hosts:
+        return MXResult(NO_MX)
+    if all(host in ("", "localhost") for host in hosts):
+        return MXResult(NULL_MX)
+    host = next(host for host in hosts if host not in ("", "localhost"))
+    if matching_suffix(host, PARKED_MX_SUFFIXES):
+        return MXResult(PARKED, host)
+    return MXResult(MX_OK, host)
+
+
+def dns_resolver(nameservers: Optional[List[str]] = None, timeout: float = DEFAULT_DNS_TIMEOUT) -> Resolver:
+    """
+    MX resolver backed by dnspython.
+
+    nameservers ("ip" or "ip:port") point it at specific servers, e.g. a
+    local stub DNS server in tests; by default the system resolvers are used.
+    """
+    if dns is None:
+        raise ImportError("MX screening needs dnspython: pip install dnspython")
+    resolver = dns.resolver.Resolver()
+    resolver.lifetime = timeout
+    if nameservers:
+        resolver.nameservers = [server.rpartition(":")[0] or server for server in nameservers]
+        ports = {server.rpartition(":")[2] for server in nameservers if ":" in server}
+        if ports:
+            resolver.port = int(ports.pop())
+    query = getattr(resolver, "resolve", None) or resolver.query  # dnspython < 2.0
+
+    def resolve(domain: str) -> List[Tuple[int, str]]:
+        try:
+            answer = query(domain, "MX")
+        except dns.resolver.NXDOMAIN:
+            raise DomainNotFound(domain)
+        except dns.resolver.NoAnswer:
+            return []
+        return [(record.preference, record.exchange.to_text()) for record in answer]
+
+    return resolve
+
+
+class MXScreen:
+    """
+    Per-domain MX screening, shared by every worker thread.
+
+    Each domain is resolved once per run (concurrent checks of the same
+    domain wait for the first) and definite answers are kept in the
+    result cache, so re-runs skip DNS entirely. Failed lookups are not
+    cached and fail open.
+    """
+
+    def __init__(self, resolve: Resolver, cache: Optional[ResultCache] = None):
+        self.resolve = resolve
+        self.cache = cache
+        self.results: Dict[str, Future] = {}
+        self.statuses: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_keys(cls, keys: Mapping[str, str], cache: Optional[ResultCache] = None) -> Optional["MXScreen"]:
+        """
+        Screen using DNS_NAMESERVERS / DNS_TIMEOUT from keys.
+
+        Returns None (screening off) when dnspython is not installed.
+        """
+        if dns is None:
+            print("⚠️  dnspython not installed - MX pre-screening disabled (pip install dnspython)")
+            return None
+        nameservers = [s.strip() for s in keys.get("DNS_NAMESERVERS", "").split(",") if s.strip()]
+        timeout = float(keys.get("DNS_TIMEOUT") or DEFAULT_DNS_TIMEOUT)
+        return cls(dns_resolver(nameservers, timeout), cache)
+
+    def check(self, domain: str) -> MXResult:
+        """Screen a (normalized) domain."""
+        with self._lock:
+            future = self.results.get(domain)
+            owner = future is None
+            if owner:
+                future = self.results[domain] = Future()
+        if owner:
+            result = self._lookup(domain)
+            with self._lock:
+                self.statuses[result.status] += 1
+            future.set_result(result)
+        return future.result()
+
+    def _lookup(self, domain: str) -> MXResult:
+        if not domain:
+            return MXResult(NO_DOMAIN)
+        if self.cache:
+            cached = self.cache.get(CACHE_PROVIDER, domain)
+            if cached is not CACHE_MISS:
+                return MXResult(*cached)
+        try:
+            result = classify(self.resolve(domain))
+        except DomainNotFound:
+            result = MXResult(NO_DOMAIN)
+        except Exception as e:
+            print(f"    DNS error for {domain}: {e}")
+            return MXResult(MX_ERROR)
+        if self.cache:
+            self.cache.put(CACHE_PROVIDER, [result.status, result.host], domain)
+        return result
+
+    def prefetch(self, domains: Iterable[str], concurrency: int = DEFAULT_MX_CONCURRENCY):
+        """Screen many domains ahead of the waterfall, concurrency lookups at a time."""
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+            for _ in executor.map(self.check, domains):
+                pass
+
+    def summary_line(self) -> str:
+        skipped = sum(count for status, count in self.statuses.items() if status not in SEARCHABLE)
+        details = ", ".join(f"{status} {count}" for status, count in sorted(self.statuses.items()))
+        return f"{sum(self.statuses.values())} domains, {skipped} can't receive mail ({details or '-'})"
+
+
+# === TESTS ===
+if __name__ == "__main__":
+    zone = {
+        "acme.com": [(10, "alt1.aspmx.l.google.com."), (1, "aspmx.l.google.com.")],
+        "contoso.com": [(0, "contoso-com.mail.protection.outlook.com.")],
+        "nomail.com": [(0, ".")],
+        "parked.com": [(10, "mx.sedoparking.com.")],
+        "bare.com": [],
+        "custom.com": [(5, "mail.custom.com.")],
+    }
+    lookups = Counter()
+
+    def stub_resolver(domain):
+        lookups[domain] += 1
+        if domain == "flaky.com":
+            raise TimeoutError("timed out")
+        if domain not in zone:
+            raise DomainNotFound(domain)
+        return zone[domain]
+
+    screen = MXScreen(stub_resolver)
+    screen.prefetch(["acme.com", "contoso.com", "nomail.com", "parked.com", "bare.com",
+                     "custom.com", "gone.com", "flaky.com", "acme.com"], concurrency=4)
+    expected = {
+        "acme.com": MXResult(MX_OK, "aspmx.l.google.com"),
+        "contoso.com": MXResult(MX_OK, "contoso-com.mail.protection.outlook.com"),
+        "nomail.com": MXResult(NULL_MX),
+        "parked.com": MXResult(PARKED, "mx.sedoparking.com"),
+        "bare.com": MXResult(NO_MX),
+        "custom.com": MXResult(MX_OK, "mail.custom.com"),
+        "gone.com": MXResult(NO_DOMAIN),
+        "flaky.com": MXResult(MX_ERROR),
+    }
+    for domain, result in expected.items():
+        assert screen.check(domain) == result, (domain, screen.check(domain))
+    assert lookups["acme.com"] == 1, "each domain is resolved once"
+    assert [d for d in expected if screen.check(d).searchable] == ["acme.com", "contoso.com", "custom.com", "flaky.com"]
+    print(screen.summary_line())
+    print("mx_screen: all tests passed")
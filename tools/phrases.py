@@ -0,0 +1,217 @@
+"""
+Phrase exclusions for lookalike QA.
+Compiles every accumulated phrase into one trie-shaped regex that finds the phrase a description
+hits in a single scan, and builds the bad-vs-good phrase frequency table used to pick new ones.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+WORD_RE = re.compile(r"[a-z0-9]+(?:['&-][a-z0-9]+)*")
+
+# Words that don't make a phrase on their own: n-grams starting or ending with one are skipped
+STOPWORDS = frozenset("""
+    a an and are as at be by for from has have in is it its of on or our that the their they
+    this to was we with who which while your you them these those also such other more most
+    can will well all any each into over through including based provides offers specializes
+""".split())
+
+# Frequency table defaults: phrases of 2-3 words seen in at least this many rows
+DEFAULT_NGRAMS = (2, 3)
+DEFAULT_MIN_ROWS = 2
+
+
+def normalize_phrase(text: str) -> str:
+    """'  Fitness   GYM ' → 'fitness gym'"""
+    return " ".join((text or "").lower().split())
+
+
+def _trie_pattern(phrases: Iterable[str]) -> str:
+    """
+    One regex alternation for phrases, factored on shared prefixes.
+
+    ["gym", "gym apparel", "golf"] → g(?:ym(?:\\s+apparel)?|olf). The regex
+    engine then walks a prefix tree instead of retrying every phrase at
+    every position; optional tails are greedy, so the longest phrase wins.
+    """
+    trie: Dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: dict) -> str:
+        end = "" in node
+        branches = [(r"\s+" if char == " " else re.escape(char)) + emit(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not end:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if end else group
+
+    return emit(trie)
+
+
+class PhraseFilter:
+    """
+    Matches text against a set of exclusion phrases.
+
+    Matching ignores case and runs of whitespace, and only counts whole
+    words ("gym" does not hit "gymnastics"). Every phrase is compiled into
+    a single pattern, so a description is scanned once however many
+    phrases have accumulated.
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        self.phrases = list(dict.fromkeys(p for p in map(normalize_phrase, phrases) if p))
+        self.pattern = (
+            re.compile(r"(?<!\w)" + _trie_pattern(self.phrases) + r"(?!\w)", re.IGNORECASE)
+            if self.phrases else None
+        )
+
+    def search(self, text: str) -> Optional[str]:
+        """The first phrase in text, or None."""
+        if not self.pattern or not text:
+            return None
+        match = self.pattern.search(text)
+        return normalize_phrase(match.group()) if match else None
+
+    def findall(self, text: str) -> List[str]:
+        """Every distinct phrase in text, in order of appearance."""
+        if not self.pattern or not text:
+            return []
+        return list(dict.fromkeys(normalize_phrase(m.group()) for m in self.pattern.finditer(text)))
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+
+def row_ngrams(text: str, sizes: Tuple[int, ...] = DEFAULT_NGRAMS) -> set:
+    """Distinct word n-grams in text, minus those starting or ending with a stopword."""
+    words = WORD_RE.findall((text or "").lower())
+    grams = set()
+    for n in sizes:
+        for i in range(len(words) - n + 1):
+            if words[i] not in STOPWORDS and words[i + n - 1] not in STOPWORDS:
+                grams.add(" ".join(words[i:i + n]))
+    return grams
+
+
+@dataclass
+class PhraseStats:
+    """One line of the bad-vs-good phrase table."""
+    phrase: str
+    in_bad: int
+    in_good: int
+    recommend: str  # "exclude", "keep" or ""
+
+
+class PhraseTable:
+    """
+    Bad-vs-good phrase frequencies, fed one description at a time.
+
+    Counts, per phrase, the rows of each kind it appears in (once per row).
+    Phrases only bad fits use are exclusion candidates; phrases only good
+    fits use are target phrases to keep.
+    """
+
+    def __init__(self, sizes: Tuple[int, ...] = DEFAULT_NGRAMS):
+        self.sizes = sizes
+        self.bad: Counter = Counter()
+        self.good: Counter = Counter()
+        self.rows = Counter()
+
+    def add(self, text: str, bad: bool):
+        grams = row_ngrams(text, self.sizes)
+        (self.bad if bad else self.good).update(grams)
+        self.rows["bad" if bad else "good"] += 1
+
+    def stats(self, phrase: str) -> PhraseStats:
+        phrase = normalize_phrase(phrase)
+        in_bad, in_good = self.bad[phrase], self.good[phrase]
+        recommend = "exclude" if in_bad and not in_good else "keep" if in_good and not in_bad else ""
+        return PhraseStats(phrase, in_bad, in_good, recommend)
+
+    def recommendations(self, min_rows: int = DEFAULT_MIN_ROWS, limit: int = 15) -> List[PhraseStats]:
+        """
+        Top exclusion candidates (in at least min_rows bad rows, no good ones),
+        then top target phrases (the reverse), most frequent first. A phrase
+        contained in a longer one with the same counts is left out.
+        """
+        def top(counts: Counter, others: Counter) -> List[str]:
+            found = [(count, phrase) for phrase, count in counts.items()
+                     if count >= min_rows and not others[phrase]]
+            found.sort(key=lambda item: (-item[0], -len(item[1]), item[1]))
+            picked: List[Tuple[int, str]] = []
+            for count, phrase in found:
+                if not any(count == c and f" {phrase} " in f" {p} " for c, p in picked):
+                    picked.append((count, phrase))
+                if len(picked) == limit:
+                    break
+            return [phrase for _, phrase in picked]
+
+        return ([self.stats(p) for p in top(self.bad, self.good)] +
+                [self.stats(p) for p in top(self.good, self.bad)])
+
+
+def format_table(rows: Iterable[PhraseStats]) -> List[str]:
+    """The STEP 6c table: Phrase | In Bad | In Good | Recommend."""
+    rows = list(rows)
+    width = max([len(row.phrase) + 2 for row in rows] + [len("Phrase")])
+    labels = {"exclude": "✅ EXCLUDE", "keep": "✅ KEEP (target phrase)", "": "-"}
+    lines = [f"{'Phrase':<{width}} | In Bad | In Good | Recommend"]
+    for row in rows:
+        quoted = f'"{row.phrase}"'
+        lines.append(f"{quoted:<{width}} | {row.in_bad:<6} | {row.in_good:<7} | {labels[row.recommend]}")
+    return lines
+
+
+# === TESTS ===
+if __name__ == "__main__":
+    import time
+
+    phrases = PhraseFilter(["fitness gym", "Personal  Training", "gym", "crossfit classes", "web design", "gym"])
+    assert len(phrases) == 5
+    assert phrases.search("A FITNESS\nGym in Austin") == "fitness gym", "longest phrase, any case/whitespace"
+    assert phrases.search("We sell to every gym in town") == "gym"
+    assert phrases.search("gymnastics apparel") is None, "whole words only"
+    assert phrases.search("") is None and PhraseFilter([]).search("gym") is None
+    assert phrases.findall("Personal training and crossfit classes at our gym; personal training") == \
+        ["personal training", "crossfit classes", "gym"]
+    assert re.fullmatch(_trie_pattern(["gym", "gym apparel", "golf"]), "gym apparel")
+
+    table = PhraseTable()
+    bad = ["Local fitness gym offering personal training.", "A fitness gym with personal training and yoga.",
+           "Crossfit gym with personal training sessions."]
+    good = ["Custom screen printing for gyms and teams.", "Screen printing and embroidery for brands.",
+            "Custom apparel and screen printing."]
+    for text in bad:
+        table.add(text, bad=True)
+    for text in good:
+        table.add(text, bad=False)
+    recommended = {row.phrase: row for row in table.recommendations()}
+    assert recommended["personal training"].in_bad == 3 and recommended["personal training"].recommend == "exclude"
+    assert recommended["fitness gym"].in_bad == 2
+    assert recommended["screen printing"].in_good == 3 and recommended["screen printing"].recommend == "keep"
+    assert "custom screen printing" not in recommended  # one good row only
+    print("\n".join(format_table(table.recommendations())))
+
+    # Thousands of phrases over thousands of descriptions
+    many = PhraseFilter([f"service line {i}" for i in range(2000)] + ["fitness gym"])
+    texts = [f"Company {i} runs a fitness gym and offers service line {i % 3000} to clients." for i in range(5000)]
+    start = time.perf_counter()
+    hits = Counter(many.search(text) for text in texts)
+    elapsed = time.perf_counter() - start
+    assert hits["fitness gym"] == 5000
+    start = time.perf_counter()
+    hits = Counter(p for text in texts for p in many.findall(text))
+    assert hits["service line 1"] == 2 and hits["service line 2500"] == 0
+    print(f"2001 phrases x 5000 rows: {elapsed * 1000:.0f}ms first hit, "
+          f"{(time.perf_counter() - start) * 1000:.0f}ms all hits")
+    print("phrases: all tests passed")
@@ -0,0 +1,115 @@
+"""
+Per-provider rate limiting for BuzzLead API clients.
+Multi-window token buckets (per second / minute / hour), shared across threads.
+"""
+
+import threading
+import time
+from typing import Dict, List, Mapping, Tuple
+
+
+WINDOW_SECONDS = {"s": 1.0, "m": 60.0, "h": 3600.0}
+
+# Default limits per provider, in the same format as the <PROVIDER>_RATE_LIMIT
+# env/secrets override (e.g. AIARK_RATE_LIMIT=5/s,300/m,18000/h).
+# AI Ark's limits are documented (docs/AI_ARK_API.md); the rest are
+# conservative defaults - raise them in the secrets file to match your plan.
+DEFAULT_RATE_LIMITS = {
+    "aiark": "5/s,300/m,18000/h",
+    "discolike": "5/s",
+    "trykit": "5/s",
+    "leadmagic": "5/s",
+    "icypeas": "5/s",
+    "millionverifier": "10/s",
+    "bounceban": "5/s",
+    "emailguard": "5/s",
+}
+
+
+def parse_rate_limit(spec: str) -> List[Tuple[int, float]]:
+    """
+    Parse a rate limit spec into (max_calls, window_seconds) pairs.
+
+    "5/s,300/m,18000/h" → [(5, 1.0), (300, 60.0), (18000, 3600.0)]
+    "none", "off" or "0" → [] (unlimited)
+    """
+    spec = (spec or "").strip().lower()
+    if spec in ("", "none", "off", "0"):
+        return []
+
+    limits = []
+    for part in spec.split(","):
+        count, _, unit = part.strip().partition("/")
+        if unit not in WINDOW_SECONDS:
+            raise ValueError(f"Invalid rate limit {part!r} (expected e.g. 5/s, 300/m, 18000/h)")
+        limits.append((int(count), WINDOW_SECONDS[unit]))
+    return limits
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter enforcing several windows at once.
+
+    Each window is a bucket holding up to max_calls tokens that refills at
+    max_calls / window_seconds per second. A call goes through only when
+    every bucket has a token, so the provider runs right at its tightest
+    ceiling instead of sleeping a fixed delay on every request.
+    """
+
+    def __init__(self, limits: List[Tuple[int, float]]):
+        self.limits = limits
+        self._tokens = [float(max_calls) for max_calls, _ in limits]
+        self._rates = [max_calls / window for max_calls, window in limits]
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._updated = now
+        for i, (max_calls, _) in enumerate(self.limits):
+            self._tokens[i] = min(float(max_calls), self._tokens[i] + elapsed * self._rates[i])
+
+    def acquire(self) -> float:
+        """Block until a call is allowed. Returns the seconds spent waiting."""
+        if not self.limits:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                wait = max((1 - tokens) / rate for tokens, rate in zip(self._tokens, self._rates))
+                if wait <= 0:
+                    for i in range(len(self._tokens)):
+                        self._tokens[i] -= 1
+                    return waited
+            time.sleep(wait)
+            waited += wait
+
+
+def build_rate_limiters(keys: Mapping[str, str]) -> Dict[str, RateLimiter]:
+    """
+    Build one limiter per provider.
+
+    Limits come from <PROVIDER>_RATE_LIMIT in keys (the secrets file or
+    os.environ), falling back to DEFAULT_RATE_LIMITS.
+    """
+    return {
+        provider: RateLimiter(parse_rate_limit(keys.get(f"{provider.upper()}_RATE_LIMIT", default)))
+        for provider, default in DEFAULT_RATE_LIMITS.items()
+    }
+
+
+# === TESTS ===
+if __name__ == "__main__":
+    assert parse_rate_limit("5/s,300/m,18000/h") == [(5, 1.0), (300, 60.0), (18000, 3600.0)]
+    assert parse_rate_limit("off") == []
+
+    limiter = RateLimiter(parse_rate_limit("20/s"))
+    start = time.monotonic()
+    for _ in range(30):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+    # 20 calls burst immediately, the remaining 10 refill at 20/s
+    print(f"30 calls at 20/s took {elapsed:.2f}s (expected ~0.5s)")
+    assert 0.4 <= elapsed <= 0.8
@@ -0,0 +1,131 @@
+"""
+Persistent result cache for BuzzLead provider calls.
+SQLite-backed, keyed by provider + normalized lookup key, with per-provider TTLs.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Mapping, Optional
+
+
+# Returned by get() when there is no fresh entry (None is a valid cached value:
+# "this provider found no email for this person").
+CACHE_MISS = object()
+
+DAY = 86400
+
+# How long each provider's answers stay fresh. Override with
+# <PROVIDER>_CACHE_TTL_DAYS in the secrets file.
+DEFAULT_TTLS = {
+    "trykit": 30 * DAY,
+    "leadmagic": 30 * DAY,
+    "icypeas": 30 * DAY,
+    "millionverifier": 7 * DAY,
+    "trykit_verify": 7 * DAY,
+    "bounceban": 7 * DAY,
+    "emailguard": 90 * DAY,
+    "email_pattern": 180 * DAY,
+    "mx": 7 * DAY,
+}
+FALLBACK_TTL = 7 * DAY
+
+DEFAULT_MAX_ENTRIES = 1_000_000
+EVICT_EVERY = 1000  # puts between size checks
+
+
+def make_key(*parts: Optional[str]) -> str:
+    """Normalize lookup parts into a cache key: 'John  Smith', 'ACME.com' → 'john smith|acme.com'."""
+    return "|".join(" ".join(str(p or "").lower().split()) for p in parts)
+
+
+class ResultCache:
+    """
+    On-disk cache of provider results.
+
+    Safe to share between worker threads. Entries older than the provider's
+    TTL are treated as misses; once the table grows past max_entries the
+    oldest entries are evicted.
+    """
+
+    def __init__(self, path: str, ttls: Optional[Dict[str, int]] = None,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = os.path.expanduser(path)
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.max_entries = max_entries
+        self.hits: Dict[str, int] = defaultdict(int)
+        self.misses: Dict[str, int] = defaultdict(int)
+        self._puts = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " provider TEXT NOT NULL, key TEXT NOT NULL, value TEXT, created REAL NOT NULL,"
+            " PRIMARY KEY (provider, key))"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_created ON results (created)")
+
+    @classmethod
+    def from_keys(cls, path: str, keys: Mapping[str, str], **kwargs) -> "ResultCache":
+        """Build a cache with TTLs overridden by <PROVIDER>_CACHE_TTL_DAYS entries in keys."""
+        ttls = {}
+        for provider in DEFAULT_TTLS:
+            days = keys.get(f"{provider.upper()}_CACHE_TTL_DAYS")
+            if days:
+                ttls[provider] = int(float(days) * DAY)
+        return cls(path, ttls=ttls, **kwargs)
+
+    def get(self, provider: str, *parts: Optional[str]) -> Any:
+        """Return the cached value, or CACHE_MISS if absent or expired."""
+        key = make_key(*parts)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, created FROM results WHERE provider = ? AND key = ?", (provider, key)
+            ).fetchone()
+            ttl = self.ttls.get(provider, FALLBACK_TTL)
+            if row is None or time.time() - row[1] > ttl:
+                self.misses[provider] += 1
+                return CACHE_MISS
+            self.hits[provider] += 1
+            return json.loads(row[0])
+
+    def put(self, provider: str, value: Any, *parts: Optional[str]):
+        """Store a provider result (any JSON-serializable value, including None)."""
+        key = make_key(*parts)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (provider, key, value, created) VALUES (?, ?, ?, ?)",
+                (provider, key, json.dumps(value), time.time()),
+            )
+            self._puts += 1
+            if self._puts % EVICT_EVERY == 0:
+                self._evict()
+
+    def _evict(self):
+        """Drop the oldest entries beyond max_entries (caller holds the lock)."""
+        count = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM results WHERE rowid IN "
+                "(SELECT rowid FROM results ORDER BY created LIMIT ?)", (excess,)
+            )
+
+    def summary_lines(self) -> List[str]:
+        """Per-provider hit/miss counters for the run summary."""
+        lines = []
+        for provider in sorted(set(self.hits) | set(self.misses)):
+            hits, misses = self.hits[provider], self.misses[provider]
+            lines.append(f"{provider}: {hits} hits / {misses} misses")
+        return lines
+
+    def close(self):
+        with self._lock:
+            self._evict()
+            self._db.close()